@@ -8,18 +8,22 @@ extension, and provides ``compress`` / ``uncompress`` utilities plus
 ``zipFileOrDir`` for packaging dictionary output. Supported extensions are listed
 in ``stdCompressions``.
 
+``progressFile`` and ``progressFileSize`` give byte progress of reading a
+compressed file from the position and size of the compressed file itself,
+so the whole file does not need to be decompressed once to find its size.
+
 This module is used in plugins.
 """
 
 from __future__ import annotations
 
+import io
 import logging
 import os
 from os.path import join
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-	import io
 	from collections.abc import Callable
 
 
@@ -29,8 +33,11 @@ log = logging.getLogger("pyglossary")
 
 __all__ = [
 	"compress",
+	"compressedRawFile",
 	"compressionOpen",
 	"compressionOpenFunc",
+	"progressFile",
+	"progressFileSize",
 	"stdCompressions",
 	"uncompress",
 ]
@@ -86,6 +93,57 @@ def compressionOpen(
 	return open(filename, **kwargs)  # noqa: SIM115
 
 
+def compressedRawFile(file: io.IOBase) -> io.IOBase | None:
+	"""
+	Return the underlying compressed file of a file opened for reading
+	by compressionOpen, or None if file is not compressed.
+	"""
+	if not getattr(file, "compression", ""):
+		return None
+	if isinstance(file, io.TextIOWrapper):
+		file = file.buffer
+	# GzipFile.fileobj, BZ2File._fp, LZMAFile._fp
+	for attr in ("fileobj", "_fp"):
+		raw = getattr(file, attr, None)
+		if raw is not None:
+			return raw
+	return None
+
+
+def progressFile(file: io.IOBase) -> io.IOBase:
+	"""
+	Return the file whose tell() gives byte progress of reading `file`.
+
+	That is the compressed file if `file` is compressed, so the position
+	matches progressFileSize, otherwise `file` itself.
+	"""
+	raw = compressedRawFile(file)
+	if raw is not None:
+		return raw
+	return file
+
+
+def progressFileSize(file: io.IOBase) -> int:
+	"""
+	Return total size for byte progress of reading `file`,
+	or 0 if file is not seekable.
+
+	For a compressed file, this is the size of compressed file, instead of
+	seeking to the end which decompresses the whole file.
+	File is rewound to the beginning.
+	"""
+	if not file.seekable():
+		return 0
+	raw = compressedRawFile(file)
+	if raw is not None:
+		size = os.fstat(raw.fileno()).st_size
+	else:
+		file.seek(0, 2)
+		size = file.tell()
+	file.seek(0)
+	return size
+
+
 def zipFileOrDir(filename: str) -> None:
 	import shutil
 	from os.path import (
@@ -19,6 +19,12 @@ class ConfigType(TypedDict):
 	log_time: NotRequired[bool]
 	cleanup: NotRequired[bool]
 	auto_sqlite: NotRequired[bool]
+	external_sort: NotRequired[bool]
+	external_sort_ram: NotRequired[int]
+	filter_workers: NotRequired[int]
+	profile_report: NotRequired[str]
+	profile_cprofile: NotRequired[str]
+	profile_tracemalloc: NotRequired[str]
 	lower: NotRequired[bool]
 	utf8_check: NotRequired[bool]
 	enable_alts: NotRequired[bool]
@@ -0,0 +1,339 @@
+"""
+Random-access dictzip (``.dz``) reader.
+
+``DictzipReader`` is a read-only binary file object over a dictzip file.
+It parses the "RA" (random access) chunk table from the gzip extra field of
+each gzip member, and on ``read`` decompresses only the chunks that cover
+the requested range, so seeking is cheap in both directions (unlike
+``gzip.GzipFile``, which restarts decompression from the beginning of the
+file on every backward seek).
+
+Decompressed chunks are kept in a small LRU cache. With ``prefetch > 0``,
+when chunks are read in order, the following chunks are decompressed ahead
+of time in a thread pool (zlib releases the GIL while decompressing).
+
+Files made by ``dictzip``, ``idzip`` and ``DictzipWriter`` are supported,
+including multiple gzip members. ``openDictzip`` falls back to
+``gzip.open`` for gzip files without a chunk table.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import os
+import struct
+import zlib
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from concurrent.futures import Future
+	from typing import BinaryIO
+
+__all__ = ["DictzipReader", "openDictzip"]
+
+_gzipDeflateID = b"\x1f\x8b\x08"
+_FHCRC = 2
+_FEXTRA = 4
+_FNAME = 8
+_FCOMMENT = 16
+
+# gzip trailer: crc32 and size of uncompressed data
+_trailerSize = 8
+
+
+def _decompressChunk(data: bytes) -> bytes:
+	# each chunk ends with a full flush, so it can be decompressed alone
+	return zlib.decompressobj(-zlib.MAX_WBITS).decompress(data)
+
+
+class DictzipReader(io.RawIOBase):
+	"""Read-only, seekable file object over a dictzip file."""
+
+	def __init__(
+		self,
+		filename: str,
+		cacheSize: int = 32,
+		prefetch: int = 0,
+	) -> None:
+		"""
+		cacheSize: max number of decompressed chunks to keep.
+		prefetch: number of chunks to decompress ahead in background
+			threads while reading sequentially, 0 disables prefetching.
+
+		Raises ValueError if file is not a dictzip file.
+		"""
+		io.RawIOBase.__init__(self)
+		self.name = filename
+		self._pos = 0
+		self._cacheSize = max(cacheSize, prefetch + 1, 1)
+		self._cache: OrderedDict[int, bytes] = OrderedDict()
+		self._prefetch = prefetch
+		self._pool: ThreadPoolExecutor | None = None
+		self._pending: dict[int, Future[bytes]] = {}
+		self._lastChunk = -1
+		# last used chunk, and its start and end in uncompressed data
+		self._curChunk = b""
+		self._curStart = 0
+		self._curEnd = 0
+		self._file = open(filename, "rb")
+		try:
+			self._readMembers()
+		except Exception:
+			self.close()
+			raise
+
+	def _readMembers(self) -> None:
+		file = self._file
+		fileSize = os.fstat(file.fileno()).st_size
+		# for each chunk: uncompressed start, file offset, compressed size
+		chunkStarts: list[int] = []
+		chunkOffsets: list[int] = []
+		chunkSizes: list[int] = []
+		size = 0
+		memberOffset = 0
+		while memberOffset < fileSize:
+			file.seek(memberOffset)
+			chunkLength, memberSizes = self._readMemberHeader(
+				file,
+				first=memberOffset == 0,
+			)
+			offset = file.tell()
+			memberStart = size
+			for index, chunkSize in enumerate(memberSizes):
+				chunkStarts.append(memberStart + index * chunkLength)
+				chunkOffsets.append(offset)
+				chunkSizes.append(chunkSize)
+				offset += chunkSize
+			trailerOffset = self._findTrailer(offset, fileSize)
+			file.seek(trailerOffset)
+			trailer = file.read(_trailerSize)
+			if len(trailer) < _trailerSize:
+				raise ValueError(f"truncated dictzip file: {self.name}")
+			memberSize = struct.unpack("<I", trailer[4:])[0]
+			if memberSizes and memberSize <= (len(memberSizes) - 1) * chunkLength:
+				raise ValueError(f"bad chunk table in dictzip file: {self.name}")
+			size += memberSize
+			memberOffset = trailerOffset + _trailerSize
+		self._chunkStarts = chunkStarts
+		self._chunkOffsets = chunkOffsets
+		self._chunkSizes = chunkSizes
+		self._size = size
+
+	def _readMemberHeader(
+		self,
+		file: BinaryIO,
+		first: bool,
+	) -> tuple[int, list[int]]:
+		"""Return (chunkLength, chunkSizes) of gzip member."""
+		header = file.read(10)
+		if len(header) < 10 or header[:3] != _gzipDeflateID:
+			raise ValueError(f"not a gzip file: {self.name}")
+		flags = header[3]
+		if not flags & _FEXTRA:
+			raise ValueError(f"no chunk table in gzip file: {self.name}")
+		(extraLength,) = struct.unpack("<H", file.read(2))
+		extra = file.read(extraLength)
+		table = None
+		pos = 0
+		while pos + 4 <= len(extra):
+			subID = extra[pos : pos + 2]
+			(subLength,) = struct.unpack("<H", extra[pos + 2 : pos + 4])
+			if subID == b"RA":
+				table = extra[pos + 4 : pos + 4 + subLength]
+				break
+			pos += 4 + subLength
+		if table is None or len(table) < 6:
+			if first:
+				raise ValueError(f"no chunk table in gzip file: {self.name}")
+			raise ValueError(f"no chunk table in gzip member of {self.name}")
+		version, chunkLength, chunkCount = struct.unpack("<HHH", table[:6])
+		if version != 1 or len(table) < 6 + 2 * chunkCount:
+			raise ValueError(f"unsupported chunk table in {self.name}")
+		chunkSizes = list(struct.unpack(f"<{chunkCount}H", table[6 : 6 + 2 * chunkCount]))
+		for flag in (_FNAME, _FCOMMENT):
+			if flags & flag:
+				self._skipZeroTerminated(file)
+		if flags & _FHCRC:
+			file.read(2)
+		return chunkLength, chunkSizes
+
+	@staticmethod
+	def _skipZeroTerminated(file: BinaryIO) -> None:
+		while True:
+			b = file.read(1)
+			if not b or b == b"\x00":
+				return
+
+	def _findTrailer(self, offset: int, fileSize: int) -> int:
+		"""
+		Return offset of gzip trailer, after compressed data of last chunk.
+
+		dictzip ends the deflate stream in the last chunk, but idzip and
+		DictzipWriter add a final block after the last chunk, which is not
+		counted in chunk table.
+		"""
+		if offset + _trailerSize == fileSize:
+			return offset
+		file = self._file
+		file.seek(offset)
+		data = file.read(64)
+		decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+		try:
+			decompressor.decompress(data)
+		except zlib.error:
+			return offset
+		if not decompressor.eof:
+			return offset
+		return offset + len(data) - len(decompressor.unused_data)
+
+	# ___________________________ file object API ____________________________
+
+	def readable(self) -> bool:  # noqa: PLR6301
+		return True
+
+	def seekable(self) -> bool:  # noqa: PLR6301
+		return True
+
+	@property
+	def size(self) -> int:
+		"""Size of uncompressed data."""
+		return self._size
+
+	def tell(self) -> int:
+		return self._pos
+
+	def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+		if whence == io.SEEK_CUR:
+			offset += self._pos
+		elif whence == io.SEEK_END:
+			offset += self._size
+		elif whence != io.SEEK_SET:
+			raise ValueError(f"invalid whence: {whence}")
+		if offset < 0:
+			raise ValueError(f"negative seek position {offset}")
+		self._pos = offset
+		return offset
+
+	def read(self, size: int = -1) -> bytes:
+		start = self._pos
+		# fast path: reading inside the last used chunk
+		curStart = self._curStart
+		if size >= 0 and curStart <= start and start + size <= self._curEnd:
+			self._pos = start + size
+			return self._curChunk[start - curStart : start + size - curStart]
+		if self.closed:
+			raise ValueError("read from closed file")
+		end = self._size if size < 0 else min(start + size, self._size)
+		if start >= end:
+			return b""
+		chunkStarts = self._chunkStarts
+		chunkCount = len(chunkStarts)
+		index = bisect_right(chunkStarts, start) - 1
+		parts: list[bytes] = []
+		pos = start
+		while pos < end and index < chunkCount:
+			chunk = self._getChunk(index)
+			chunkStart = chunkStarts[index]
+			self._curStart = chunkStart
+			self._curEnd = chunkStart + len(chunk)
+			self._curChunk = chunk
+			part = chunk[pos - chunkStart : end - chunkStart]
+			if not part:
+				break
+			parts.append(part)
+			pos += len(part)
+			index += 1
+		self._pos = pos
+		if len(parts) == 1:
+			return parts[0]
+		return b"".join(parts)
+
+	def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+		data = self.read(len(buffer))
+		buffer[: len(data)] = data
+		return len(data)
+
+	def close(self) -> None:
+		if self.closed:
+			return
+		if self._pool is not None:
+			self._pool.shutdown(wait=True, cancel_futures=True)
+			self._pool = None
+		self._pending = {}
+		self._cache.clear()
+		self._curEnd = -1
+		self._curChunk = b""
+		# not set if open() failed in __init__
+		file = getattr(self, "_file", None)
+		if file is not None:
+			file.close()
+		io.RawIOBase.close(self)
+
+	# _______________________________ chunks _________________________________
+
+	def _readCompressed(self, index: int) -> bytes:
+		file = self._file
+		file.seek(self._chunkOffsets[index])
+		return file.read(self._chunkSizes[index])
+
+	def _getChunk(self, index: int) -> bytes:
+		sequential = 0 <= index - self._lastChunk <= 1
+		self._lastChunk = index
+		if self._prefetch > 0 and sequential:
+			self._prefetchAfter(index)
+
+		cache = self._cache
+		chunk = cache.get(index)
+		if chunk is not None:
+			cache.move_to_end(index)
+			return chunk
+
+		future = self._pending.pop(index, None)
+		if future is not None:
+			chunk = future.result()
+		else:
+			chunk = _decompressChunk(self._readCompressed(index))
+		cache[index] = chunk
+		while len(cache) > self._cacheSize:
+			cache.popitem(last=False)
+		return chunk
+
+	def _prefetchAfter(self, index: int) -> None:
+		pool = self._pool
+		if pool is None:
+			pool = self._pool = ThreadPoolExecutor(
+				max_workers=min(self._prefetch, os.cpu_count() or 1),
+				thread_name_prefix="dictzip",
+			)
+		pending = self._pending
+		last = min(index + self._prefetch, len(self._chunkSizes) - 1)
+		for nextIndex in range(index + 1, last + 1):
+			if nextIndex in pending or nextIndex in self._cache:
+				continue
+			pending[nextIndex] = pool.submit(
+				_decompressChunk,
+				self._readCompressed(nextIndex),
+			)
+		# drop prefetched chunks that are not going to be used
+		for pendingIndex in [i for i in pending if i < index or i > last]:
+			pending.pop(pendingIndex).cancel()
+
+
+def openDictzip(
+	filename: str,
+	cacheSize: int = 32,
+	prefetch: int = 0,
+) -> DictzipReader | gzip.GzipFile:
+	"""
+	Open a dictzip file for random-access reading.
+
+	Return gzip.GzipFile if the file has no chunk table (plain gzip).
+	"""
+	try:
+		return DictzipReader(filename, cacheSize=cacheSize, prefetch=prefetch)
+	except ValueError:
+		return gzip.GzipFile(filename, "rb")
@@ -0,0 +1,217 @@
+"""
+Streaming dictzip (``.dz``) writer.
+
+``DictzipWriter`` is a write-only binary file object that compresses data
+into dictzip format while it is being written, so there is no need for a
+separate compression pass (``runDictzip``) after the uncompressed file is
+complete. Chunks are compressed independently (each one ends with a full
+flush, like ``dictzip`` and ``idzip`` do) in a thread pool; zlib releases
+the GIL while compressing, so this runs in parallel with the caller.
+
+The output is the same as idzip: a gzip file with the "RA" (random access)
+extra field, split into multiple gzip members when the chunk table of one
+member would not fit in the gzip header.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import struct
+import tempfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from os.path import basename, dirname
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+	from collections.abc import Iterable
+	from concurrent.futures import Future
+	from types import TracebackType
+
+__all__ = ["DictzipWriter"]
+
+# uncompressed chunk size used by dictzip
+chunkLength = 58315
+
+# max number of chunks in a gzip member, limited by the max size of
+# gzip extra field. a new member is started when it is reached
+maxMemberChunks = (0xFFFF - 10) // 2
+
+compressionLevel = zlib.Z_BEST_COMPRESSION
+
+_gzipDeflateID = b"\x1f\x8b\x08"
+_FEXTRA = 4
+_FNAME = 8
+_osCodeUnix = 3
+
+# an empty final block, ends the deflate stream of a gzip member
+_deflateEnd = zlib.compressobj(
+	compressionLevel,
+	zlib.DEFLATED,
+	-zlib.MAX_WBITS,
+).flush(zlib.Z_FINISH)
+
+
+def _compressChunk(chunk: bytes) -> bytes:
+	compressor = zlib.compressobj(compressionLevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+	return compressor.compress(chunk) + compressor.flush(zlib.Z_FULL_FLUSH)
+
+
+class DictzipWriter:
+	"""Write-only file object that compresses data into a dictzip file."""
+
+	def __init__(
+		self,
+		filename: str,
+		workers: int = 0,
+		mtime: int | None = None,
+	) -> None:
+		"""
+		filename: path of output file, usually ends with ".dz".
+		workers: number of compression threads, 0 means number of CPUs.
+		mtime: modification time stored in gzip header, default is now.
+		"""
+		self.name = filename
+		self._workers = workers or os.cpu_count() or 1
+		self._mtime = int(time.time()) if mtime is None else mtime
+		origName = basename(filename).removesuffix(".dz")
+		self._origName = origName.encode("utf-8")
+
+		self._file = open(filename, "wb")
+		self._pool = ThreadPoolExecutor(
+			max_workers=self._workers,
+			thread_name_prefix="dictzip",
+		)
+		self._pending: deque[Future[bytes]] = deque()
+		self._buffer = bytearray()
+		self._pos = 0
+		self._closed = False
+		self._firstMember = True
+		self._resetMember()
+
+	def _resetMember(self) -> None:
+		# compressed chunks of current member are written to a temp file
+		# until the member is complete and its header can be written
+		self._memberData = tempfile.TemporaryFile(dir=dirname(self.name) or None)
+		self._memberChunkSizes: list[int] = []
+		self._memberChunkCount = 0
+		self._memberSize = 0
+		self._memberCRC = 0
+
+	@property
+	def closed(self) -> bool:
+		return self._closed
+
+	def tell(self) -> int:
+		"""Return position in uncompressed data."""
+		return self._pos
+
+	def write(self, data: bytes) -> int:
+		if self._closed:
+			raise ValueError("write to closed file")
+		self._buffer += data
+		self._pos += len(data)
+		if len(self._buffer) >= chunkLength:
+			self._submitChunks()
+		return len(data)
+
+	def writelines(self, lines: Iterable[bytes]) -> None:
+		for line in lines:
+			self.write(line)
+
+	def _submitChunks(self) -> None:
+		buffer = self._buffer
+		count = len(buffer) // chunkLength
+		for index in range(count):
+			self._submitChunk(
+				bytes(buffer[index * chunkLength : (index + 1) * chunkLength]),
+			)
+		del buffer[: count * chunkLength]
+
+	def _submitChunk(self, chunk: bytes) -> None:
+		if self._memberChunkCount >= maxMemberChunks:
+			self._finishMember()
+		self._memberCRC = zlib.crc32(chunk, self._memberCRC)
+		self._memberSize += len(chunk)
+		self._memberChunkCount += 1
+		self._pending.append(self._pool.submit(_compressChunk, chunk))
+		maxPending = self._workers * 2
+		while len(self._pending) > maxPending:
+			self._writeCompressed(self._pending.popleft().result())
+
+	def _writeCompressed(self, data: bytes) -> None:
+		self._memberChunkSizes.append(len(data))
+		self._memberData.write(data)
+
+	def _finishMember(self) -> None:
+		while self._pending:
+			self._writeCompressed(self._pending.popleft().result())
+
+		file = self._file
+		chunkSizes = self._memberChunkSizes
+		flags = _FEXTRA
+		mtime = 0
+		if self._firstMember:
+			flags |= _FNAME
+			if self._mtime <= 0xFFFFFFFF:
+				mtime = self._mtime
+		xfl = 2 if compressionLevel == zlib.Z_BEST_COMPRESSION else 0
+		file.write(_gzipDeflateID + struct.pack("<BIBB", flags, mtime, xfl, _osCodeUnix))
+
+		fieldLength = 6 + 2 * len(chunkSizes)
+		file.write(
+			struct.pack(
+				"<H2sHHHH",
+				fieldLength + 4,  # XLEN
+				b"RA",
+				fieldLength,
+				1,  # version
+				chunkLength,
+				len(chunkSizes),
+			),
+		)
+		file.write(struct.pack(f"<{len(chunkSizes)}H", *chunkSizes))
+		if self._firstMember:
+			file.write(self._origName + b"\x00")
+
+		self._memberData.seek(0)
+		shutil.copyfileobj(self._memberData, file)
+		self._memberData.close()
+
+		file.write(_deflateEnd)
+		file.write(struct.pack("<II", self._memberCRC, self._memberSize & 0xFFFFFFFF))
+
+		self._firstMember = False
+		self._resetMember()
+
+	def flush(self) -> None:
+		pass
+
+	def close(self) -> None:
+		if self._closed:
+			return
+		self._closed = True
+		try:
+			if self._buffer:
+				self._submitChunk(bytes(self._buffer))
+				self._buffer = bytearray()
+			if self._memberChunkCount or self._firstMember:
+				self._finishMember()
+		finally:
+			self._memberData.close()
+			self._pool.shutdown(wait=True, cancel_futures=True)
+			self._file.close()
+
+	def __enter__(self) -> Self:
+		return self
+
+	def __exit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: TracebackType | None,
+	) -> None:
+		self.close()
@@ -4,7 +4,8 @@ Glossary entry and binary data entry types.
 Defines ``Entry`` (term + definition, with alternate terms and defi formats) and
 ``DataEntry`` (embedded binary resources such as images or audio). Both extend
 ``BaseEntry`` and are the objects plugins and ``Glossary`` exchange during
-read/write.
+read/write. ``LazyEntry`` is an ``Entry`` created from UTF-8 bytes, that
+decodes them only when needed.
 """
 
 from __future__ import annotations
@@ -19,6 +20,7 @@ from typing import TYPE_CHECKING
 
 from .entry_base import BaseEntry
 from .iter_utils import unique_everseen
+from .raw_entry import rawEntryTerms
 from .text_utils import joinByBar
 
 if TYPE_CHECKING:
@@ -29,7 +31,7 @@ if TYPE_CHECKING:
 	from .glossary_types import RawEntryType
 
 
-__all__ = ["DataEntry", "Entry"]
+__all__ = ["DataEntry", "Entry", "LazyEntry"]
 
 log = logging.getLogger("pyglossary")
 
@@ -226,8 +228,7 @@ class Entry(BaseEntry):  # noqa: PLR0904
 		key: Callable[[list[str]], Any],
 	) -> Callable[[RawEntryType], Any]:
 		def newKey(x: RawEntryType) -> Any:
-			# x is rawEntry, so x[2:] is list[bytes]: list of words in bytes
-			return key([b.decode("utf-8") for b in x[2:]])
+			return key(rawEntryTerms(x))
 
 		return newKey
 
@@ -445,3 +446,80 @@ class Entry(BaseEntry):  # noqa: PLR0904
 		defi = defi[:i]
 		self._defi = defi
 		return None
+
+
+class LazyEntry(Entry):
+	"""
+	Entry created from UTF-8 encoded term(s) and definition.
+
+	Term(s) and definition are decoded on first access, and the encoded
+	values are returned by `lb_term` and `b_defi` without encoding again,
+	as long as they are not modified.
+	"""
+
+	__slots__ = [
+		"_b_defi",
+		"_lb_term",
+		"_strDefi",
+		"_strTerm",
+	]
+
+	def __init__(
+		self,
+		lb_term: list[bytes],
+		b_defi: bytes,
+		defiFormat: str = "m",
+		byteProgress: tuple[int, int] | None = None,
+	) -> None:
+		if defiFormat not in {"m", "h", "x"}:
+			raise ValueError(f"invalid defiFormat {defiFormat!r}")
+		self._lb_term: list[bytes] | None = lb_term
+		self._b_defi: bytes | None = b_defi
+		self._strTerm: MultiStr | None = None
+		self._strDefi: str | None = None
+		self._defiFormat = defiFormat
+		self._byteProgress = byteProgress
+
+	# Entry methods read and assign self._term and self._defi, these
+	# properties decode on read, and drop the encoded value on assignment
+
+	@property  # type: ignore[override]
+	def _term(self) -> MultiStr:
+		term = self._strTerm
+		if term is None:
+			if self._lb_term is None:
+				raise RuntimeError("LazyEntry: no term")
+			l_term = [b_term.decode("utf-8") for b_term in self._lb_term]
+			term = self._strTerm = l_term[0] if len(l_term) == 1 else l_term
+		return term
+
+	@_term.setter
+	def _term(self, term: MultiStr) -> None:
+		self._strTerm = term
+		self._lb_term = None
+
+	@property  # type: ignore[override]
+	def _defi(self) -> str:
+		defi = self._strDefi
+		if defi is None:
+			if self._b_defi is None:
+				raise RuntimeError("LazyEntry: no defi")
+			defi = self._strDefi = self._b_defi.decode("utf-8")
+		return defi
+
+	@_defi.setter
+	def _defi(self, defi: str) -> None:
+		self._strDefi = defi
+		self._b_defi = None
+
+	@property
+	def lb_term(self) -> list[bytes]:
+		if self._lb_term is not None:
+			return list(self._lb_term)
+		return Entry.lb_term.fget(self)  # type: ignore[attr-defined]
+
+	@property
+	def b_defi(self) -> bytes:
+		if self._b_defi is not None:
+			return self._b_defi
+		return self._defi.encode("utf-8")
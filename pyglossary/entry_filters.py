@@ -16,7 +16,7 @@ from __future__ import annotations
 import logging
 import re
 import typing
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from . import core
 from .text_utils import fixUtf8Str
@@ -62,6 +62,7 @@ class EntryFilterType(typing.Protocol):
 	name: str = ""
 	desc: str = ""
 	falseComment: str = ""
+	parallel: bool = False
 
 	def __init__(self, glos: _GlossaryType) -> None:
 		raise NotImplementedError
@@ -80,9 +81,20 @@ class EntryFilter:
 	desc: str = ""
 	falseComment: str = ""
 
+	# parallel=True means the filter does not keep any state between entries
+	# and does not use self.glos in run(), so it can run in worker processes
+	# (see parallel_filters.py)
+	parallel: bool = True
+
 	def __init__(self, glos: _GlossaryType) -> None:
 		self.glos = glos
 
+	def __getstate__(self) -> dict[str, Any]:
+		# glossary object is not picklable, and not needed in run()
+		state = self.__dict__.copy()
+		state.pop("glos", None)
+		return state
+
 	def prepare(self) -> None:
 		"""Run this after glossary info is set and ready."""
 
@@ -285,6 +297,7 @@ class StripFullHtml(EntryFilter):
 
 	name = "strip_full_html"
 	desc = "Replace a full HTML document with it's body"
+	parallel = False
 
 	def __init__(
 		self,
@@ -406,6 +419,7 @@ class PreventDuplicateTerms(EntryFilter):
 
 	name = "prevent_duplicate_terms"
 	desc = "Prevent duplicate terms"
+	parallel = False
 
 	def __init__(self, glos: _GlossaryType) -> None:
 		EntryFilter.__init__(self, glos)
@@ -463,6 +477,7 @@ class SkipEntriesWithDuplicateHeadword(EntryFilter):
 
 	name = "skip_duplicate_headword"
 	desc = "Skip entries with a duplicate headword (first term)"
+	parallel = False
 
 	def __init__(self, glos: _GlossaryType) -> None:
 		EntryFilter.__init__(self, glos)
@@ -528,6 +543,7 @@ class ShowMaxMemoryUsage(EntryFilter):
 
 	name = "max_memory_usage"
 	desc = "Show Max Memory Usage"
+	parallel = False
 	MAX_TERM_LEN = 30
 
 	def __init__(self, glos: _GlossaryType) -> None:
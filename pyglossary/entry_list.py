@@ -18,19 +18,24 @@
 """
 In-memory storage for glossary entries during conversion.
 
-``EntryList`` keeps raw entry tuples in RAM, converts to ``Entry`` objects on
-iteration, and supports in-memory sorting via a selected ``NamedSortKey``. Used
-when a glossary is small enough to avoid SQLite-backed storage.
+``EntryList`` keeps packed raw entries (see ``raw_entry.py``) in RAM, converts
+to ``Entry`` objects on iteration, and supports in-memory sorting via a selected
+``NamedSortKey``. Used when a glossary is small enough to avoid SQLite-backed
+storage.
+
+Raw entries are appended to one contiguous buffer (arena), with an array of
+their offsets, instead of keeping one Python object per entry.
 """
 
 from __future__ import annotations
 
 import logging
+from array import array
 from time import perf_counter as now
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-	from collections.abc import Callable, Iterator
+	from collections.abc import Callable, Iterable, Iterator
 	from typing import Any
 
 	from .glossary_types import EntryType, RawEntryType
@@ -51,24 +56,41 @@ class EntryList:
 		entryToRaw: Callable[[EntryType], RawEntryType],
 		entryFromRaw: Callable[[RawEntryType], EntryType],
 	) -> None:
-		self._l: list[RawEntryType] = []
 		self._entryToRaw = entryToRaw
 		self._entryFromRaw = entryFromRaw
 		self._sortKey: Callable[[RawEntryType], Any] | None = None
+		self._arena = bytearray()
+		# _offsets[i] is start of i-th raw entry in _arena, and
+		# _offsets[-1] is end of last raw entry
+		self._offsets = array("Q", [0])
+		# order of entries after sort, None means insertion order
+		self._order: array[int] | None = None
 
 	def append(self, entry: EntryType) -> None:
-		self._l.append(self._entryToRaw(entry))
+		if self._order is not None:
+			self._order.append(len(self))
+		self._arena += self._entryToRaw(entry)
+		self._offsets.append(len(self._arena))
 
 	def clear(self) -> None:
-		self._l.clear()
+		self._arena = bytearray()
+		self._offsets = array("Q", [0])
+		self._order = None
 
 	def __len__(self) -> int:
-		return len(self._l)
+		return len(self._offsets) - 1
+
+	def _indexes(self) -> Iterable[int]:
+		if self._order is None:
+			return range(len(self))
+		return self._order
 
 	def __iter__(self) -> Iterator[EntryType]:
 		entryFromRaw = self._entryFromRaw
-		for rawEntry in self._l:
-			yield entryFromRaw(rawEntry)
+		offsets = self._offsets
+		with memoryview(self._arena) as view:
+			for index in self._indexes():
+				yield entryFromRaw(view[offsets[index] : offsets[index + 1]])
 
 	def hasSortKey(self) -> bool:
 		return bool(self._sortKey)
@@ -95,7 +117,14 @@ class EntryList:
 		if self._sortKey is None:
 			raise ValueError("EntryList.sort: sortKey is not set")
 		t0 = now()
-		self._l.sort(key=self._sortKey)
+		sortKey = self._sortKey
+		offsets = self._offsets
+		with memoryview(self._arena) as view:
+			order = sorted(
+				self._indexes(),
+				key=lambda index: sortKey(view[offsets[index] : offsets[index + 1]]),
+			)
+		self._order = array("Q", order)
 		log.info(f"Sorting took {now() - t0:.1f} seconds")
 
 	def close(self) -> None:
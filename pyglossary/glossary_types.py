@@ -15,7 +15,6 @@ from __future__ import annotations
 from collections.abc import (
 	Callable,
 	Iterator,
-	Sequence,
 )
 from typing import TYPE_CHECKING, Any, Protocol
 
@@ -34,10 +33,8 @@ __all__ = [
 
 type MultiStr = str | list[str]
 
-# str(rawEntry[0]): defiFormat or ""
-# rawEntry[1]: b_defi
-# rawEntry[2:]: b_term_list
-type RawEntryType = Sequence[bytes]
+# packed record of defiFormat, b_defi and b_term_list, see raw_entry.py
+type RawEntryType = bytes
 
 
 class EntryType(Protocol):  # noqa: PLR0904
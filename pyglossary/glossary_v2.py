@@ -22,9 +22,10 @@ Provides ``Glossary`` (subclass of ``GlossaryCommon``), the main entry point for
 loading, converting, and writing dictionary files. Conversion is driven by
 ``ConvertArgs`` and format plugins discovered via ``PluginHandler``.
 
-Key responsibilities: entry storage (in-memory or SQLite via ``SqEntryList``),
-entry filter pipeline (``entry_filters``), sort-key selection, reader/writer
-orchestration, and progress reporting.
+Key responsibilities: entry storage (in-memory, SQLite via ``SqEntryList``, or
+external merge sort via ``MergeSortEntryList``), entry filter pipeline
+(``entry_filters``), sort-key selection, reader/writer orchestration, and
+progress reporting.
 
 For programmatic output without loading everything into RAM, see
 ``GlossaryCreator`` instead.
@@ -49,7 +50,7 @@ from uuid import uuid1
 
 from . import core
 from .core import cacheDir, log
-from .entry import DataEntry, Entry
+from .entry import DataEntry, Entry, LazyEntry
 from .entry_filters import (
 	MarkdownToHtml,
 	PreventDuplicateTerms,
@@ -71,8 +72,10 @@ from .info import c_name
 from .os_utils import rmtree, showMemoryUsage
 from .plugin_handler import PluginHandler
 from .queued_iter import QueuedIterator
+from .raw_entry import packRawEntry, unpackRawEntryBytes
 from .sort_keys import defaultSortKeyName, lookupSortKey
 from .sq_entry_list import SqEntryList
+from .stage_profiler import StageProfiler
 
 if TYPE_CHECKING:
 	from collections.abc import Callable, Iterable, Iterator
@@ -208,6 +211,7 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 		self._sqlite = False
 		self._cleanupPathList: set[str] = set()
 		self._readOptions: dict[str, Any] | None = None
+		self._profiler: StageProfiler | None = None
 
 		self.initVars()
 
@@ -250,16 +254,85 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 				log.error(f"no such file or directory: {cleanupPath}")
 		self._cleanupPathList = set()
 
+	@property
+	def profiler(self) -> StageProfiler | None:
+		"""StageProfiler if profiling is enabled, None otherwise."""
+		return self._profiler
+
+	def enableProfiling(
+		self,
+		cprofile: Iterable[str] = (),
+		tracemalloc: Iterable[str] = (),
+	) -> StageProfiler:
+		"""
+		Record time spent in each stage of reading, filtering and writing.
+
+		cprofile, tracemalloc: stages to run cProfile / tracemalloc on,
+			see stage_profiler.py for names of stages.
+
+		Use `glos.profiler.report()` after conversion to get the report.
+		"""
+		self._profiler = StageProfiler(
+			cprofile=cprofile,
+			tracemalloc=tracemalloc,
+		)
+		return self._profiler
+
+	def _enableProfilingByConfig(self) -> None:
+		config = self._config
+		cprofile = config.get("profile_cprofile", "")
+		tracemalloc = config.get("profile_tracemalloc", "")
+		if not (config.get("profile_report") or cprofile or tracemalloc):
+			return
+		if self._profiler is not None:
+			return
+		self.enableProfiling(
+			cprofile=[name.strip() for name in cprofile.split(",") if name.strip()],
+			tracemalloc=[name.strip() for name in tracemalloc.split(",") if name.strip()],
+		)
+
+	def _finishProfiling(self) -> None:
+		profiler = self._profiler
+		if profiler is None:
+			return
+		log.info(f"Slowest stages: {profiler.summary()}")
+		reportPath = self._config.get("profile_report", "")
+		if reportPath:
+			profiler.saveReport(reportPath)
+			log.info(f"Saved profile report to {reportPath!r}")
+		profiler.close()
+
+	def _profiled(self, stage: str, func: Callable[..., Any], *args: Any) -> Any:
+		"""Call func, as one call of stage if profiling is enabled."""
+		if self._profiler is None:
+			return func(*args)
+		with self._profiler.stage(stage):
+			return func(*args)
+
+	@staticmethod
+	def _pluginStageName(obj: Any) -> str:
+		"""Return format name of a plugin Reader or Writer object."""
+		moduleName = type(obj).__module__
+		parts = moduleName.split(".")
+		if len(parts) > 1 and parts[-1] in {"reader", "writer"}:
+			parts.pop()
+		moduleName = parts[-1]
+		for plugin in PluginHandler.plugins.values():
+			if plugin.moduleName == moduleName:
+				return plugin.name
+		return moduleName
+
 	def _dataEntryToRaw(self, entry: DataEntry) -> RawEntryType:
 		b_fpath = b""
 		if self.tmpDataDir:
 			b_fpath = entry.save(self.tmpDataDir).encode("utf-8")
-		return (b"b", b_fpath, entry.getFileName().encode("utf-8"))
+		return packRawEntry("b", b_fpath, [entry.getFileName().encode("utf-8")])
 
 	def _entryToRaw(self, entry: EntryType) -> RawEntryType:
 		"""
-		Return a tuple (word, defi) or (word, defi, defiFormat)
-		where both word and defi might be string or list of strings.
+		Return packed raw entry record of defiFormat, definition and terms.
+
+		See raw_entry.py for record format.
 		"""
 		if entry.isData():
 			return self._dataEntryToRaw(cast("DataEntry", entry))
@@ -268,23 +341,20 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 		if defiFormat is None or defiFormat == self._defaultDefiFormat:
 			defiFormat = ""
 
-		return [defiFormat.encode("ascii"), entry.b_defi] + entry.lb_term
+		return packRawEntry(defiFormat, entry.b_defi, entry.lb_term)
 
 	def _entryFromRaw(self, rawEntry: RawEntryType) -> EntryType:
-		defiFormat = rawEntry[0].decode("ascii") or self._defaultDefiFormat
-		defi = rawEntry[1].decode("utf-8")
+		defiFormat, b_defi, lb_term = unpackRawEntryBytes(rawEntry)
+		defiFormat = defiFormat or self._defaultDefiFormat
 
 		if defiFormat == "b":
-			fname = rawEntry[2].decode("utf-8")
-			if isinstance(fname, list):
-				fname = fname[0]  # NESTED 4
-			return DataEntry(fname, tmpPath=defi)
+			return DataEntry(
+				lb_term[0].decode("utf-8"),
+				tmpPath=b_defi.decode("utf-8"),
+			)
 
-		return Entry(
-			[b.decode("utf-8") for b in rawEntry[2:]],
-			defi,
-			defiFormat=defiFormat,
-		)
+		# decoding is deferred, writers may only need lb_term and b_defi
+		return LazyEntry(lb_term, b_defi, defiFormat=defiFormat)
 
 	@property
 	def rawEntryCompress(self) -> bool:
@@ -417,6 +487,11 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 		)
 
 	def _loadedEntryGen(self) -> Iterator[EntryType]:
+		profiler = self._profiler
+		if profiler is not None:
+			yield from self._loadedEntryGenProfiled(profiler)
+			return
+
 		if not self.progressbar:
 			yield from self._data
 			return
@@ -439,17 +514,41 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 			yield entry
 		self.progressEnd()
 
+	def _loadedEntryGenProfiled(
+		self,
+		profiler: StageProfiler,
+	) -> Iterator[EntryType]:
+		# same as _loadedEntryGen, extra filters only run with progressbar
+		progressbar = self.progressbar
+		iterable = profiler.iterate("fetch", self._progressIter(self._data))
+		runList = []
+		if progressbar:
+			runList = [
+				profiler.wrap(f"filter:{type(f).__name__}", f.run)
+				for f in self._entryFiltersExtra
+			]
+			self.progressInit("Writing")
+		for entry_ in iterable:
+			entry = entry_
+			for run in runList:
+				entry = run(entry)
+			yield entry
+		if progressbar:
+			self.progressEnd()
+
 	def _readersEntryGen(self) -> Iterator[EntryType]:
 		for reader in self._readers:
 			self.progressInit("Converting")
 
-			iterator = self._progressIter(reader)
+			iterator = self._readerIter(reader)
 
 			iterator = self._applyEntryFiltersGen(iterator)
 
 			# turn iterator into background-queued, like buffered channel in Go
 			queueSize = os.getenv("PYGLOSSARY_ASYNC_ITER_SIZE")
-			if queueSize:
+			if queueSize and self._profiler is not None:
+				log.warning("Ignoring PYGLOSSARY_ASYNC_ITER_SIZE while profiling")
+			elif queueSize:
 				iterator = QueuedIterator(iterator, int(queueSize))
 
 			try:
@@ -458,6 +557,15 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 				reader.close()
 			self.progressEnd()
 
+	def _readerIter(self, reader: Any) -> Iterable[EntryType]:
+		iterable = self._progressIter(reader)
+		if self._profiler is None:
+			return iterable
+		return self._profiler.iterate(
+			f"read:{self._pluginStageName(reader)}",
+			iterable,
+		)
+
 	# This iterator/generator does not give None entries.
 	# And Entry is not falsable, so bool(entry) is always True.
 	# Since ProgressBar is already handled with an EntryFilter, there is
@@ -467,12 +575,35 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 		iterable: Iterable[EntryType],
 	) -> Iterator[EntryType]:
 		entry: EntryType | None
+		profiler = self._profiler
+
+		workers = self._config.get("filter_workers", 0)
+		if workers > 0:
+			from .parallel_filters import applyEntryFiltersParallel
+
+			iterator = applyEntryFiltersParallel(
+				iterable,
+				self._entryFilters,
+				workers=workers,
+			)
+			if profiler is not None:
+				iterator = profiler.iterate("filter:parallel", iterator)
+			yield from iterator
+			return
+
+		if profiler is not None:
+			runList = [
+				profiler.wrap(f"filter:{type(f).__name__}", f.run)
+				for f in self._entryFilters
+			]
+		else:
+			runList = [entryFilter.run for entryFilter in self._entryFilters]
 
 		for entry in iterable:
 			if entry is None:
 				continue
-			for entryFilter in self._entryFilters:
-				entry = entryFilter.run(entry)  # noqa: PLW2901
+			for run in runList:
+				entry = run(entry)  # noqa: PLW2901
 				if entry is None:
 					break
 			else:
@@ -714,7 +845,11 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 		# reader.open returns "Iterator[tuple[int, int]] | None"
 		progressbar: bool = self.progressbar
 		try:
-			openResult = reader.open(filename)
+			openResult = self._profiled(
+				f"read.open:{self._pluginStageName(reader)}",
+				reader.open,
+				filename,
+			)
 			if openResult is not None:
 				self.progressInit("Reading metadata")
 				lastPos = -100_000
@@ -816,11 +951,14 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 		showMemoryUsage()
 
 		self.progressInit("Reading")
-		iterator = self._progressIter(reader)
+		iterator = self._readerIter(reader)
 		iterator = self._applyEntryFiltersGen(iterator)
+		addEntry = self.addEntry
+		if self._profiler is not None:
+			addEntry = self._profiler.wrap("store", addEntry)
 		try:
 			for entry in iterator:
-				self.addEntry(entry)
+				addEntry(entry)
 		finally:
 			reader.close()
 
@@ -928,11 +1066,13 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 	) -> None:
 		writer = writerList[0]
 		genList = []
+		stageNames = []
 		gen = writer.write()
 		if gen is None:
 			log.error(f"{format} write function is not a generator")
 		else:
 			genList.append(gen)
+			stageNames.append(f"write:{self._pluginStageName(writer)}")
 
 		if self._config.get("save_info_json", False):
 			from .info_writer import InfoWriter
@@ -943,16 +1083,23 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 			infoWriter.open(f"{filenameNoExt}.info")
 			genList.append(infoWriter.write())
 			writerList.append(infoWriter)
-
-		for gen in genList:
-			gen.send(None)
+			stageNames.append(f"write:{self._pluginStageName(infoWriter)}")
+
+		sendList = [gen.send for gen in genList]
+		if self._profiler is not None:
+			sendList = [
+				self._profiler.wrap(stageName, send)
+				for stageName, send in zip(stageNames, sendList, strict=True)
+			]
+		for send in sendList:
+			send(None)
 		for entry in self:
-			for gen in genList:
-				gen.send(entry)
+			for send in sendList:
+				send(entry)
 		# suppress() on the whole for-loop does not work
-		for gen in genList:
+		for send in sendList:
 			with suppress(StopIteration):
-				gen.send(None)
+				send(None)
 
 	@staticmethod
 	def _openWriter(
@@ -997,13 +1144,18 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 		self._sort = sort
 
 		if sort:
-			self._data.sort()
+			self._profiled("sort", self._data.sort)
 
 		if self._readers:
 			self._iter = self._readersEntryGen()
 		else:
 			self._iter = self._loadedEntryGen()
-		self._openWriter(writer, filename)
+		self._profiled(
+			f"write.open:{self._pluginStageName(writer)}",
+			self._openWriter,
+			writer,
+			filename,
+		)
 
 		showMemoryUsage()
 
@@ -1018,7 +1170,10 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 			showMemoryUsage()
 			log.debug("Running writer.finish()")
 			for writer in writerList:
-				writer.finish()
+				self._profiled(
+					f"finish:{self._pluginStageName(writer)}",
+					writer.finish,
+				)
 			self.clear()
 
 		showMemoryUsage()
@@ -1047,7 +1202,32 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 			create=True,
 		)
 		self._cleanupPathList.add(sq_fpath)
+		self._enableSQLiteMode()
 
+	def _switchToMergeSort(
+		self,
+		inputFilename: str,
+	) -> None:
+		from .merge_entry_list import MergeSortEntryList
+
+		tmpDir = join(cacheDir, f"{os.path.basename(inputFilename)}.sort")
+		if isdir(tmpDir):
+			log.info(f"Removing and re-creating {tmpDir!r}")
+			rmtree(tmpDir)
+
+		ramBudget = self._config.get("external_sort_ram", 256)
+		self._data = MergeSortEntryList(
+			entryToRaw=self._entryToRaw,
+			entryFromRaw=self._entryFromRaw,
+			tmpDir=tmpDir,
+			ramBudget=ramBudget * 1024 * 1024,
+		)
+		self._cleanupPathList.add(tmpDir)
+		# MergeSortEntryList limits RAM usage just like SqEntryList, so
+		# plugins should behave the same as SQLite mode
+		self._enableSQLiteMode()
+
+	def _enableSQLiteMode(self) -> None:
 		if not self.alts:
 			log.warning(
 				"SQLite mode only works with enable_alts=True, force-enabling it.",
@@ -1122,7 +1302,11 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 		)
 		namedSortKey, sortEncoding = sortKeyTuple
 
-		if sqlite:
+		if sqlite and self._config.get("external_sort", False):
+			self._switchToMergeSort(
+				inputFilename=args.inputFilename,
+			)
+		elif sqlite:
 			self._switchToSQLite(
 				inputFilename=args.inputFilename,
 			)
@@ -1240,6 +1424,17 @@ class GlossaryCommon(GlossaryInfo, GlossaryProgress):  # noqa: PLR0904
 		"""
 		self._convertValidateArgs(args)
 
+		self._enableProfilingByConfig()
+		profiler = self._profiler
+		if profiler is None:
+			return self._convertMain(args)
+		try:
+			with profiler.stage("convert"):
+				return self._convertMain(args)
+		finally:
+			self._finishProfiling()
+
+	def _convertMain(self, args: ConvertArgs) -> str:
 		tm0 = now()
 
 		outputFilename, outputFormat, compression = PluginHandler.detectOutputFormat(
@@ -0,0 +1,227 @@
+#
+# Copyright © 2025 Saeed Rasooli <saeed.gnu@gmail.com> (ilius)
+# This file is part of PyGlossary project, https://github.com/ilius/pyglossary
+#
+# This program is a free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program. Or on Debian systems, from /usr/share/common-licenses/GPL
+# If not, see <http://www.gnu.org/licenses/gpl.txt>.
+"""
+External merge sort storage for glossary entries during conversion.
+
+``MergeSortEntryList`` keeps packed raw entries with their sort keys in a
+bounded in-memory buffer. When the buffer exceeds the RAM budget, it is sorted
+and spilled to a temporary "run" file. Iterating the list does a k-way merge of
+all runs. Mirrors the ``EntryList`` / ``SqEntryList`` API, and uses the same
+``NamedSortKey`` factories as ``EntryList``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import os
+import pickle
+import sys
+from operator import itemgetter
+from os.path import isfile, join
+from time import perf_counter as now
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Iterable, Iterator
+	from typing import Any
+
+	from .glossary_types import EntryType, RawEntryType
+	from .sort_keys import NamedSortKey
+
+__all__ = ["MergeSortEntryList"]
+
+log = logging.getLogger("pyglossary")
+
+type RecordType = tuple[Any, bytes]
+
+defaultRamBudget = 256 * 1024 * 1024
+
+# rough estimate of memory used by a record tuple and its list slot
+_recordOverhead = 100
+
+# maximum number of run files that are merged at once
+maxMergeRuns = 64
+
+_fileBufferSize = 1024 * 1024
+
+_getKey = itemgetter(0)
+
+
+class MergeSortEntryList:
+	"""Entry list sorted by external merge sort."""
+
+	def __init__(
+		self,
+		entryToRaw: Callable[[EntryType], RawEntryType],
+		entryFromRaw: Callable[[RawEntryType], EntryType],
+		tmpDir: str,
+		ramBudget: int = defaultRamBudget,
+	) -> None:
+		self._entryToRaw = entryToRaw
+		self._entryFromRaw = entryFromRaw
+		self._tmpDir = tmpDir
+		self._ramBudget = ramBudget
+		self._sortKey: Callable[[list[str]], Any] | None = None
+		self._sorted = False
+		self._len = 0
+		self._buffer: list[RecordType] = []
+		self._bufferSize = 0
+		self._runPaths: list[str] = []
+		self._runCount = 0
+		os.makedirs(tmpDir, mode=0o700, exist_ok=True)
+
+	def hasSortKey(self) -> bool:
+		return bool(self._sortKey)
+
+	def setSortKey(
+		self,
+		namedSortKey: NamedSortKey,
+		sortEncoding: str | None,
+		writeOptions: dict[str, Any],
+	) -> None:
+		if self._sortKey is not None:
+			raise RuntimeError("Called setSortKey twice")
+		if self._len:
+			raise RuntimeError("setSortKey must be called before adding entries")
+		if namedSortKey.normal is None:
+			raise NotImplementedError(
+				f"sort key {namedSortKey.name!r} is not supported",
+			)
+		kwargs = writeOptions.copy()
+		if sortEncoding:
+			kwargs["sortEncoding"] = sortEncoding
+		self._sortKey = namedSortKey.normal(**kwargs)
+
+	def __len__(self) -> int:
+		return self._len
+
+	def append(self, entry: EntryType) -> None:
+		data = self._entryToRaw(entry)
+		key = self._sortKey(entry.l_term) if self._sortKey else None
+		self._buffer.append((key, data))
+		self._bufferSize += sys.getsizeof(data) + sys.getsizeof(key) + _recordOverhead
+		self._len += 1
+		if self._bufferSize >= self._ramBudget:
+			self._spill()
+
+	def __iadd__(self, other: Iterable[EntryType]) -> Self:
+		for item in other:
+			self.append(item)
+		return self
+
+	def _newRunPath(self) -> str:
+		path = join(self._tmpDir, f"run{self._runCount:05d}")
+		self._runCount += 1
+		return path
+
+	@staticmethod
+	def _writeRun(path: str, records: Iterable[RecordType]) -> None:
+		with open(path, "wb", buffering=_fileBufferSize) as file:
+			for record in records:
+				pickle.dump(record, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+	@staticmethod
+	def _readRun(path: str) -> Iterator[RecordType]:
+		with open(path, "rb", buffering=_fileBufferSize) as file:
+			while True:
+				try:
+					yield pickle.load(file)  # noqa: S301
+				except EOFError:
+					break
+
+	def _sortBuffer(self) -> None:
+		if self._sortKey is not None:
+			self._buffer.sort(key=_getKey)
+
+	def _spill(self) -> None:
+		if not self._buffer:
+			return
+		t0 = now()
+		self._sortBuffer()
+		path = self._newRunPath()
+		self._writeRun(path, self._buffer)
+		log.debug(
+			f"Wrote {len(self._buffer)} entries to sort run file {path!r}"
+			f" in {now() - t0:.1f} seconds",
+		)
+		self._runPaths.append(path)
+		self._buffer = []
+		self._bufferSize = 0
+		if self._sortKey is not None and len(self._runPaths) >= maxMergeRuns:
+			self._mergeRunFiles()
+
+	def _mergeRunFiles(self) -> None:
+		"""Merge all run files into one, to limit number of open files."""
+		t0 = now()
+		path = self._newRunPath()
+		self._writeRun(
+			path,
+			heapq.merge(
+				*[self._readRun(runPath) for runPath in self._runPaths],
+				key=_getKey,
+			),
+		)
+		for runPath in self._runPaths:
+			os.remove(runPath)
+		log.debug(
+			f"Merged {len(self._runPaths)} sort run files in {now() - t0:.1f} seconds",
+		)
+		self._runPaths = [path]
+
+	def _records(self) -> Iterator[RecordType]:
+		runs: list[Iterable[RecordType]] = [
+			self._readRun(path) for path in self._runPaths
+		]
+		if self._buffer:
+			runs.append(self._buffer)
+		if not self._sorted:
+			for run in runs:
+				yield from run
+			return
+		yield from heapq.merge(*runs, key=_getKey)
+
+	def __iter__(self) -> Iterator[EntryType]:
+		entryFromRaw = self._entryFromRaw
+		for _key, data in self._records():
+			yield entryFromRaw(data)
+
+	def sort(self) -> None:
+		if self._sorted:
+			raise NotImplementedError("can not sort more than once")
+		if self._sortKey is None:
+			raise ValueError("MergeSortEntryList.sort: sortKey is not set")
+		self._sorted = True
+		t0 = now()
+		self._sortBuffer()
+		log.info(
+			f"Sorting took {now() - t0:.1f} seconds"
+			f", {len(self._runPaths)} run files to merge",
+		)
+
+	def clear(self) -> None:
+		self.close()
+		self._len = 0
+
+	def close(self) -> None:
+		self._buffer = []
+		self._bufferSize = 0
+		for path in self._runPaths:
+			if isfile(path):
+				os.remove(path)
+		self._runPaths = []
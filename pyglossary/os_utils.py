@@ -139,18 +139,49 @@ def _dictzip(filename: str | Path) -> bool:
 	return True
 
 
+def _nativeDictzip(filename: str | Path) -> bool:
+	from pyglossary.dictzip_writer import DictzipWriter
+
+	filename = Path(filename)
+	destination = filename.parent / (filename.name + ".dz")
+	try:
+		with open(filename, "rb") as inp_file:
+			mtime = int(os.fstat(inp_file.fileno()).st_mtime)
+			log.debug("compressing %s to %s", filename, destination)
+			with DictzipWriter(str(destination), mtime=mtime) as out_file:
+				shutil.copyfileobj(inp_file, out_file, 1024 * 1024)
+		filename.unlink()
+	except OSError as error:
+		log.error(str(error))
+		return False
+	return True
+
+
 def runDictzip(filename: str | Path, method: str = "") -> None:
-	"""Compress file into dictzip format."""
+	"""
+	Compress file into dictzip format, and remove the original file.
+
+	method: "idzip" or "dictzip" to use idzip module or dictzip utility,
+		default is the built-in parallel compressor (DictzipWriter).
+
+	Writers should rather write into DictzipWriter directly, to compress
+	while writing.
+	"""
+	if method == "":
+		_nativeDictzip(filename)
+		return
 	res = None
-	if method in {"", "idzip"}:
+	if method == "idzip":
 		res = _idzip(filename)
-	if not res and method in {"", "dictzip"}:
+	elif method == "dictzip":
 		res = _dictzip(filename)
+	else:
+		raise ValueError(f"invalid dictzip method {method!r}")
 	if not res:
 		log.warning(
-			"Dictzip compression requires idzip module or dictzip utility,"
-			f" run `{pip} install python-idzip` to install or make sure"
-			" dictzip is in your $PATH",
+			f"Dictzip compression with {method} requires idzip module or"
+			f" dictzip utility, run `{pip} install python-idzip` to install"
+			" or make sure dictzip is in your $PATH",
 		)
 
 
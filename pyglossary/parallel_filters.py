@@ -0,0 +1,153 @@
+"""
+Multi-process entry filter pipeline.
+
+``applyEntryFiltersParallel`` runs the leading stateless part of the entry
+filter chain in a process pool, over batches of entries, and yields the
+filtered entries in the original order. Filters that keep state across
+entries (``EntryFilter.parallel = False``) and everything after them in the
+chain still run on the main process.
+
+Enabled with the ``filter_workers`` config parameter.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from collections.abc import Iterable, Iterator
+	from concurrent.futures import Future
+
+	from .entry_filters import EntryFilterType
+	from .glossary_types import EntryType
+
+__all__ = ["applyEntryFiltersParallel", "splitEntryFilters"]
+
+log = logging.getLogger("pyglossary")
+
+defaultBatchSize = 1000
+
+# set in worker processes by _initWorker
+_workerFilters: list[EntryFilterType] = []
+
+
+def _initWorker(entryFilters: list[EntryFilterType]) -> None:
+	global _workerFilters  # noqa: PLW0603
+	_workerFilters = entryFilters
+
+
+def _runFilters(
+	entryFilters: list[EntryFilterType],
+	entry: EntryType,
+) -> EntryType | None:
+	for entryFilter in entryFilters:
+		entry = entryFilter.run(entry)  # type: ignore[assignment]
+		if entry is None:
+			return None
+	return entry
+
+
+def _runBatch(batch: list[EntryType]) -> list[EntryType | None]:
+	entryFilters = _workerFilters
+	return [_runFilters(entryFilters, entry) for entry in batch]
+
+
+def splitEntryFilters(
+	entryFilters: list[EntryFilterType],
+) -> tuple[list[EntryFilterType], list[EntryFilterType]]:
+	"""
+	Split filter chain into (parallel, sequential).
+
+	`parallel` is the longest prefix of filters that can run in worker
+	processes, `sequential` is the rest, which must run on the main process
+	(in order, after `parallel`).
+	"""
+	for index, entryFilter in enumerate(entryFilters):
+		if not getattr(entryFilter, "parallel", False):
+			return entryFilters[:index], entryFilters[index:]
+	return list(entryFilters), []
+
+
+def _submitBatch(
+	pool: ProcessPoolExecutor,
+	batch: list[EntryType],
+) -> tuple[list[EntryType], Future[list[EntryType | None]]]:
+	# data entries are not sent to workers, to avoid pickling their content.
+	# none of the built-in parallel filters change them anyway, and they are
+	# filtered on the main process in _collectBatch
+	textEntries = [entry for entry in batch if not entry.isData()]
+	return batch, pool.submit(_runBatch, textEntries)
+
+
+def _collectBatch(
+	batch: list[EntryType],
+	future: Future[list[EntryType | None]],
+	parallelFilters: list[EntryFilterType],
+) -> Iterator[EntryType | None]:
+	results = iter(future.result())
+	for entry in batch:
+		if entry.isData():
+			yield _runFilters(parallelFilters, entry)
+			continue
+		yield next(results)
+
+
+def applyEntryFiltersParallel(
+	iterable: Iterable[EntryType | None],
+	entryFilters: list[EntryFilterType],
+	workers: int,
+	batchSize: int = defaultBatchSize,
+) -> Iterator[EntryType]:
+	"""
+	Apply `entryFilters` on entries of `iterable`, using `workers` processes.
+
+	Entries are yielded in the same order as `iterable`, and skipped entries
+	(filtered out, or None) are not yielded.
+	"""
+	parallelFilters, sequentialFilters = splitEntryFilters(entryFilters)
+	if not parallelFilters:
+		log.warning("No entry filter can run in parallel, ignoring filter_workers")
+		for entry in iterable:
+			if entry is None:
+				continue
+			result = _runFilters(sequentialFilters, entry)
+			if result is not None:
+				yield result
+		return
+
+	log.info(
+		f"Running {len(parallelFilters)} entry filters in {workers} processes"
+		f", and {len(sequentialFilters)} entry filters in main process",
+	)
+
+	iterator = (entry for entry in iterable if entry is not None)
+	maxPending = workers * 2
+	pending: deque[tuple[list[EntryType], Future[list[EntryType | None]]]] = deque()
+
+	pool = ProcessPoolExecutor(
+		max_workers=workers,
+		initializer=_initWorker,
+		initargs=(parallelFilters,),
+	)
+	try:
+		while True:
+			while len(pending) < maxPending:
+				batch = list(islice(iterator, batchSize))
+				if not batch:
+					break
+				pending.append(_submitBatch(pool, batch))
+			if not pending:
+				break
+			batch, future = pending.popleft()
+			for entry in _collectBatch(batch, future, parallelFilters):
+				if entry is None:
+					continue
+				result = _runFilters(sequentialFilters, entry)
+				if result is not None:
+					yield result
+	finally:
+		pool.shutdown(wait=True, cancel_futures=True)
@@ -25,18 +25,23 @@ format; used by DICT.org-related writers.
 
 from __future__ import annotations
 
-import gzip
 import os
 import string
 import sys
 import typing
 
+from pyglossary.dictzip_reader import openDictzip
+from pyglossary.dictzip_writer import DictzipWriter
+
 if typing.TYPE_CHECKING:
 	import io
 	from collections.abc import Iterable
 
 __all__ = ["DictDB"]
 
+# number of .dict.dz chunks to decompress ahead while reading in order
+dictzipPrefetch = 4
+
 b64_list = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
 url_headword = "00-database-url"
 short_headword = "00-database-short"
@@ -107,6 +112,7 @@ class DictDB:
 		basename: str,
 		mode: str = "read",
 		quiet: int = 0,
+		dictzip: bool = False,
 	) -> None:
 		# url = 'unknown', shortname = 'unknown',
 		# 		 longinfo = 'unknown', quiet = 0):
@@ -117,13 +123,14 @@ class DictDB:
 
 		read -- read-only access
 
-		write -- write-only access, truncates existing files, does not work
-		with .dz.  dict created if nonexistent.
+		write -- write-only access, truncates existing files.
+		dict created if nonexistent.
 
 		update -- read/write access, dict created if nonexistent.  Does not
 		work with .dz.
 
-		Read can read dict or dict.dz files.  Write and update will NOT work
+		Read can read dict or dict.dz files.  Write creates dict.dz file
+		(compressing while writing) if dictzip is True.  Update will NOT work
 		with dict.dz files.
 
 		If quiet is nonzero, status messages
@@ -137,16 +144,16 @@ class DictDB:
 		self.basename = basename
 
 		self.indexFilename = self.basename + ".index"
-		if mode == "read" and os.path.isfile(self.basename + ".dict.dz"):
-			self.useCompression = 1
+		if mode == "write":
+			self.useCompression = int(dictzip)
 		else:
-			self.useCompression = 0
+			self.useCompression = int(os.path.isfile(self.basename + ".dict.dz"))
 
 		self.dictFilename = (
 			self.basename + ".dict" + (".dz" if self.useCompression else "")
 		)
 
-		self.dictFile: io.IOBase
+		self.dictFile: io.IOBase | DictzipWriter
 		self.indexFile: io.IOBase
 		self._open(mode)
 
@@ -158,15 +165,16 @@ class DictDB:
 		if mode == "read":
 			self.indexFile = open(self.indexFilename, "rb")
 			if self.useCompression:
-				self.dictFile = gzip.GzipFile(self.dictFilename, "rb")
+				self.dictFile = openDictzip(self.dictFilename, prefetch=dictzipPrefetch)
 			else:
 				self.dictFile = open(self.dictFilename, "rb")
 			self._initIndex()
 		elif mode == "write":
 			self.indexFile = open(self.indexFilename, "wb")
 			if self.useCompression:
-				raise ValueError("'write' mode incompatible with .dz files")
-			self.dictFile = open(self.dictFilename, "wb")
+				self.dictFile = DictzipWriter(self.dictFilename)
+			else:
+				self.dictFile = open(self.dictFilename, "wb")
 		elif mode == "update":
 			self._openForUpdate()
 		else:
@@ -179,7 +187,7 @@ class DictDB:
 			self.indexFile = open(self.indexFilename, "w+b")
 		if self.useCompression:
 			# Open it read-only since we don't support mods.
-			self.dictFile = gzip.GzipFile(self.dictFilename, "rb")
+			self.dictFile = openDictzip(self.dictFilename)
 		else:
 			try:
 				self.dictFile = open(self.dictFilename, "r+b")
@@ -304,7 +312,8 @@ class DictDB:
 		definition should be indexed.  This function always adds \n
 		to the end of defstr.
 		"""
-		self.dictFile.seek(0, 2)  # Seek to end of file
+		if self.mode == "update":
+			self.dictFile.seek(0, 2)  # Seek to end of file
 		start = self.dictFile.tell()
 		s_defi += "\n"
 		b_defi = s_defi.encode("utf-8")
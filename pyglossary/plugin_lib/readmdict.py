@@ -25,12 +25,15 @@ engine versions. Used by Octopus MDict and related plugins."""
 
 from __future__ import annotations
 
+import codecs
 import logging
 import re
 import sys
 
 # zlib compression is used for engine version >=2.0
 import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from struct import pack, unpack
 
@@ -99,11 +102,17 @@ class MDict:
 		fname: str,
 		encoding: str = "",
 		passcode: tuple[bytes, bytes] | None = None,
+		workers: int = 0,
 	) -> None:
+		"""
+		workers: number of threads to decompress record blocks ahead of time,
+			0 means decompressing them in the calling thread.
+		"""
 		self._fname = fname
 		self._encoding = encoding.upper()
 		self._encrypted_key = None
 		self._passcode = passcode
+		self._workers = workers
 
 		self.header = self._read_header()
 
@@ -129,6 +138,8 @@ class MDict:
 				) + xxhash.xxh64_digest(uuid[mid:])
 
 		self._key_list = self._read_keys()
+		# index -> decompressed record block, see MDX.link_candidates
+		self._block_cache: dict[int, bytes] = {}
 
 	def __repr__(self) -> str:
 		return (
@@ -567,101 +578,118 @@ class MDict:
 		"""
 		return self._read_records()
 
-	def _read_records(self):
-		if self._version >= 3:
-			yield from self._read_records_v3()
-		else:
-			yield from self._read_records_v1v2()
-
-	def _read_records_v3(self):
-		f = open(self._fname, "rb")
-		f.seek(self._record_block_offset)
-
+	def _read_record_block_data(self):
+		"""Yield (compressed_block, decompressed_size) of each record block."""
+		with open(self._fname, "rb") as f:
+			f.seek(self._record_block_offset)
+			if self._version >= 3:
+				num_record_blocks = self._read_int32(f)
+				self._read_number(f)  # num_bytes
+				for _ in range(num_record_blocks):
+					decompressed_size = self._read_int32(f)
+					compressed_size = self._read_int32(f)
+					yield f.read(compressed_size), decompressed_size
+				return
+
+			num_record_blocks = self._read_number(f)
+			num_entries = self._read_number(f)
+			assert num_entries == self._num_entries
+			record_block_info_size = self._read_number(f)
+			self._read_number(f)  # record_block_size
+
+			# record block info section
+			record_block_info_list = []
+			size_counter = 0
+			for _ in range(num_record_blocks):
+				compressed_size = self._read_number(f)
+				decompressed_size = self._read_number(f)
+				record_block_info_list += [(compressed_size, decompressed_size)]
+				size_counter += self._number_width * 2
+			assert size_counter == record_block_info_size
+
+			# actual record block
+			for compressed_size, decompressed_size in record_block_info_list:
+				yield f.read(compressed_size), decompressed_size
+
+	def _read_record_blocks(self):
+		"""
+		Yield (index, compressed_block, decompressed_size, spans) of each
+		record block, spans is a list of (key_text, start, end) of records
+		in the decompressed block.
+		"""
+		key_list = self._key_list
+		key_count = len(key_list)
 		offset = 0
 		i = 0
-		# size_counter = 0
-
-		num_record_blocks = self._read_int32(f)
-		self._read_number(f)  # num_bytes
-		for _ in range(num_record_blocks):
-			decompressed_size = self._read_int32(f)
-			compressed_size = self._read_int32(f)
-			record_block = self._decode_block(
-				f.read(compressed_size),
-				decompressed_size,
-			)
-
+		for index, (block, size) in enumerate(self._read_record_block_data()):
 			# split record block according to the offset info from key block
-			while i < len(self._key_list):
-				record_start, key_text = self._key_list[i]
+			spans = []
+			while i < key_count:
+				record_start, key_text = key_list[i]
 				# reach the end of current record block
-				if record_start - offset >= len(record_block):
+				if record_start - offset >= size:
 					break
 				# record end index
-				if i < len(self._key_list) - 1:
-					record_end = self._key_list[i + 1][0]
-				else:
-					record_end = len(record_block) + offset
+				record_end = key_list[i + 1][0] if i < key_count - 1 else size + offset
 				i += 1
-				data = record_block[record_start - offset : record_end - offset]
-				yield key_text, self._treat_record_data(data)
-			offset += len(record_block)
-			# size_counter += compressed_size
+				spans.append((key_text, record_start - offset, record_end - offset))
+			yield index, block, size, spans
+			offset += size
+
+	def _decode_record_block(self, block, decompressed_size):
+		try:
+			return self._decode_block(block, decompressed_size)
+		except zlib.error:
+			log.error("zlib decompress error")
+			log.debug(f"record_block_compressed = {block!r}")
+			return None
+
+	def _decode_record_blocks(self, decode, blocks):
+		"""
+		Yield (index, record_block, spans) for each item of `blocks`, in order.
 
-	def _read_records_v1v2(self):
-		f = open(self._fname, "rb")
-		f.seek(self._record_block_offset)
-
-		num_record_blocks = self._read_number(f)
-		num_entries = self._read_number(f)
-		assert num_entries == self._num_entries
-		record_block_info_size = self._read_number(f)
-		self._read_number(f)  # record_block_size
-
-		# record block info section
-		record_block_info_list = []
-		size_counter = 0
-		for _ in range(num_record_blocks):
-			compressed_size = self._read_number(f)
-			decompressed_size = self._read_number(f)
-			record_block_info_list += [(compressed_size, decompressed_size)]
-			size_counter += self._number_width * 2
-		assert size_counter == record_block_info_size
-
-		# actual record block
-		offset = 0
-		i = 0
-		size_counter = 0
-		for compressed_size, decompressed_size in record_block_info_list:
-			record_block_compressed = f.read(compressed_size)
-			try:
-				record_block = self._decode_block(
-					record_block_compressed,
-					decompressed_size,
-				)
-			except zlib.error:
-				log.error("zlib decompress error")
-				log.debug(f"record_block_compressed = {record_block_compressed!r}")
-				continue
-			# split record block according to the offset info from key block
-			while i < len(self._key_list):
-				record_start, key_text = self._key_list[i]
-				# reach the end of current record block
-				if record_start - offset >= len(record_block):
-					break
-				# record end index
-				if i < len(self._key_list) - 1:
-					record_end = self._key_list[i + 1][0]
-				else:
-					record_end = len(record_block) + offset
-				i += 1
-				data = record_block[record_start - offset : record_end - offset]
-				yield key_text, self._treat_record_data(data)
-			offset += len(record_block)
-			size_counter += compressed_size
-		# assert size_counter == record_block_size
+		record_block is decode(index, block, size), which may run in one of
+		self._workers threads up to 2 * self._workers blocks ahead.
+		zlib releases the GIL, so blocks are decompressed in parallel.
+		"""
+		workers = self._workers
+		if workers <= 0:
+			for index, block, size, spans in blocks:
+				yield index, decode(index, block, size), spans
+			return
+		maxPending = workers * 2
+		with ThreadPoolExecutor(
+			max_workers=workers,
+			thread_name_prefix="readmdict",
+		) as pool:
+			pending = deque()
+			for index, block, size, spans in blocks:
+				pending.append((index, pool.submit(decode, index, block, size), spans))
+				while len(pending) > maxPending:
+					index, future, spans = pending.popleft()  # noqa: PLW2901
+					yield index, future.result(), spans
+			while pending:
+				index, future, spans = pending.popleft()
+				yield index, future.result(), spans
 
-		f.close()
+	def _read_records(self):
+		block_cache = self._block_cache
+		self._block_cache = {}
+
+		def decode(index, block, size):
+			record_block = block_cache.pop(index, None)
+			if record_block is None:
+				record_block = self._decode_record_block(block, size)
+			return record_block
+
+		for _, record_block, spans in self._decode_record_blocks(
+			decode,
+			self._read_record_blocks(),
+		):
+			if record_block is None:
+				continue
+			for key_text, start, end in spans:
+				yield key_text, self._treat_record_data(record_block[start:end])
 
 	def _treat_record_data(self, data):  # noqa: PLR6301
 		return data
@@ -681,8 +709,15 @@ class MDD(MDict):
 		self,
 		fname: str,
 		passcode: tuple[bytes, bytes] | None = None,
+		workers: int = 0,
 	) -> None:
-		MDict.__init__(self, fname, encoding="UTF-16", passcode=passcode)
+		MDict.__init__(
+			self,
+			fname,
+			encoding="UTF-16",
+			passcode=passcode,
+			workers=workers,
+		)
 
 
 class MDX(MDict):
@@ -701,10 +736,51 @@ class MDX(MDict):
 		encoding: str = "",
 		substyle: bool = False,
 		passcode: tuple[bytes, bytes] | None = None,
+		workers: int = 0,
 	) -> None:
-		MDict.__init__(self, fname, encoding, passcode)
+		MDict.__init__(self, fname, encoding, passcode, workers=workers)
 		self._substyle = substyle
 
+	def link_candidates(self, cache_size: int = 0):
+		"""
+		Yield (key, content) of records that are short enough to be
+		a "@@@LINK=" redirect to another key, other records are not decoded.
+
+		Up to `cache_size` bytes of decompressed record blocks are kept and
+		used by the next items() call, so they are not decompressed twice.
+		"""
+		if not self._key_list:
+			return
+		# keys are UTF-8, a character takes at most twice as many bytes
+		# in other encodings
+		width = 1 if codecs.lookup(self._encoding).name == "utf-8" else 2
+		max_key_size = max(len(key_text) for _, key_text in self._key_list)
+		# 64 bytes for surrounding whitespace and null characters
+		max_size = width * (len(b"@@@LINK=") + max_key_size) + 64
+
+		def blocks():
+			for index, block, size, spans in self._read_record_blocks():
+				small = [span for span in spans if span[2] - span[1] <= max_size]
+				if small:
+					yield index, block, size, small
+
+		def decode(_index, block, size):
+			return self._decode_record_block(block, size)
+
+		block_cache = self._block_cache = {}
+		cached_size = 0
+		for index, record_block, small in self._decode_record_blocks(
+			decode,
+			blocks(),
+		):
+			if record_block is None:
+				continue
+			if cached_size + len(record_block) <= cache_size:
+				block_cache[index] = record_block
+				cached_size += len(record_block)
+			for key_text, start, end in small:
+				yield key_text, self._treat_record_data(record_block[start:end])
+
 	def _substitute_stylesheet(self, txt):
 		# substitute stylesheet definition
 		txt_list = re.split(r"`\d+`", txt)
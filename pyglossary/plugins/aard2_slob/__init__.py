@@ -87,6 +87,10 @@ optionsProp: dict[str, Option] = {
 	"audio_goldendict": BoolOption(
 		comment="Convert audio links for GoldenDict (desktop)",
 	),
+	"workers": IntOption(
+		comment="Number of threads for compressing bins, 0 means no thread",
+		minim=0,
+	),
 }
 
 docTail = """### pyicu
@@ -50,6 +50,7 @@ class Writer:
 	_version_info: bool = False
 
 	_audio_goldendict: bool = False
+	_workers: int = 0
 
 	resourceMimeTypes = {
 		"bmp": "image/bmp",
@@ -111,6 +112,7 @@ class Writer:
 			workdir=cacheDir,
 			compression=self._compression,
 			version_info=self._version_info,
+			workers=self._workers,
 		)
 
 		# "label" tag is a dictionary name shown in UI
@@ -184,7 +186,7 @@ class Writer:
 
 	def addEntry(self, entry: EntryType) -> None:
 		terms = entry.l_term
-		b_defi = entry.defi.encode("utf-8")
+		b_defi = entry.b_defi
 		ctype = self._content_type
 		writer = self._slobWriter
 		if writer is None:
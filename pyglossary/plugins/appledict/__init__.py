@@ -32,6 +32,7 @@ from typing import TYPE_CHECKING
 from pyglossary.option import (
 	BoolOption,
 	DictOption,
+	IntOption,
 	StrOption,
 )
 
@@ -75,6 +76,11 @@ relatedFormats: list[str] = ["AppleDictBin"]
 # FIXME: rename indexes arg/option to indexes_lang?
 optionsProp: dict[str, Option] = {
 	"clean_html": BoolOption(comment="use BeautifulSoup parser"),
+	"clean_html_parser": StrOption(
+		customValue=False,
+		values=["bs4", "lxml"],
+		comment="parser for clean_html, lxml is faster with the same output",
+	),
 	"css": StrOption(
 		comment="custom .css file path",
 	),
@@ -112,6 +118,12 @@ optionsProp: dict[str, Option] = {
 		values=["", "ru", "zh"],
 		comment="Additional indexes to dictionary entries",
 	),
+	"workers": IntOption(
+		comment=(
+			"Number of worker processes for preparing entries, 0 means no worker process"
+		),
+		minim=0,
+	),
 }
 
 docTail = """### Also see:
@@ -37,6 +37,8 @@ from xml.sax.saxutils import quoteattr, unescape
 from pyglossary.text_utils import toStr
 
 if TYPE_CHECKING:
+	from collections.abc import Iterator
+
 	import bs4 as BeautifulSoup
 	import bs4.element
 
@@ -45,6 +47,9 @@ __all__ = ["prepare_content"]
 
 log = logging.getLogger("pyglossary")
 
+# tag of BeautifulSoup tree, or of tree made by prepare_content_with_lxml
+type _TagType = bs4.element.Tag | _Element
+
 
 _re_brhr = re.compile("<(BR|HR)>", re.IGNORECASE)
 _re_nonprintable = re.compile("[\x00-\x07\x0e-\x1f]")
@@ -67,10 +72,14 @@ def prepare_content(
 	title: str | None,
 	body: str,
 	BeautifulSoup: Any,
+	htmlParser: str = "bs4",
 ) -> str:
 	# heavily integrated with output of dsl reader plugin!
 	# and with xdxf also.
-	""":param title: str | None"""
+	"""
+	:param title: str | None
+	:param htmlParser: "bs4" or "lxml", used if BeautifulSoup is given.
+	"""
 	# class="sec" => d:priority="2"
 	# style="color:steelblue" => class="ex"
 	# class="p" style="color:green" => class="p"
@@ -79,10 +88,12 @@ def prepare_content(
 	# <s> => <del>
 
 	# xhtml is strict
-	if BeautifulSoup:
-		content = prepare_content_with_soup(title, body, BeautifulSoup)
-	else:
+	if not BeautifulSoup:
 		content = prepare_content_without_soup(title, body)
+	elif htmlParser == "lxml":
+		content = prepare_content_with_lxml(title, body)
+	else:
+		content = prepare_content_with_soup(title, body, BeautifulSoup)
 
 	content = content.replace("&nbsp;", "&#160;")
 	content = _re_nonprintable.sub("", content)
@@ -128,7 +139,7 @@ def prepare_content_without_soup(
 	return content  # noqa: RET504
 
 
-def _prepare_href(tag: bs4.element.Tag) -> None:
+def _prepare_href(tag: _TagType) -> None:
 	href = tag["href"]
 	assert isinstance(href, str)
 	href = _cleanup_link_target(href)
@@ -150,37 +161,96 @@ def _prepare_href(tag: bs4.element.Tag) -> None:
 		tag["href"] = f"x-dictionary:d:{href}"
 
 
+_pic_thumb_onclick = (
+	'this.setAttribute("style", "display:none"); '
+	'this.nextElementSibling.setAttribute("style", "display:block")'
+)
+
+_big_pic_onclick = (
+	'this.setAttribute("style", "display:none"), '
+	'this.previousElementSibling.setAttribute("style", "display:block")'
+)
+
+# to unfold(expand) and fold(collapse) blocks
+# TODO: simplify this!
+_toggle_infl_onclick = (
+	r"var e = this.parentElement.parentElement.parentElement"
+	r'.querySelector("res-g vp-gs"); style = window.'
+	r"getComputedStyle(e), display = style.getPropertyValue"
+	r'("display"), "none" === e.style.display || "none" === display'
+	r' ? e.style.display = "block" : e.style.display = "none", '
+	r"this.className.match(/(?:^|\s)Clicked(?!\S)/) ? this."
+	r"className = this.className.replace("
+	r'/(?:^|\s)Clicked(?!\S)/g, "") : this.setAttribute('
+	r'"class", "Clicked")'
+)
+
+
 def _prepare_onclick(soup: BeautifulSoup.BeautifulSoup) -> None:
 	for thumb in soup.find_all("div", "pic_thumb"):
-		thumb["onclick"] = (
-			'this.setAttribute("style", "display:none"); '
-			'this.nextElementSibling.setAttribute("style", "display:block")'
-		)
+		thumb["onclick"] = _pic_thumb_onclick
 
 	for pic in soup.find_all("div", "big_pic"):
-		pic["onclick"] = (
-			'this.setAttribute("style", "display:none"), '
-			'this.previousElementSibling.setAttribute("style", "display:block")'
-		)
+		pic["onclick"] = _big_pic_onclick
 
-	# to unfold(expand) and fold(collapse) blocks
 	for pos in soup.find_all("pos", onclick="toggle_infl(this)"):
-		# TODO: simplify this!
-		pos["onclick"] = (
-			r"var e = this.parentElement.parentElement.parentElement"
-			r'.querySelector("res-g vp-gs"); style = window.'
-			r"getComputedStyle(e), display = style.getPropertyValue"
-			r'("display"), "none" === e.style.display || "none" === display'
-			r' ? e.style.display = "block" : e.style.display = "none", '
-			r"this.className.match(/(?:^|\s)Clicked(?!\S)/) ? this."
-			r"className = this.className.replace("
-			r'/(?:^|\s)Clicked(?!\S)/g, "") : this.setAttribute('
-			r'"class", "Clicked")'
-		)
+		pos["onclick"] = _toggle_infl_onclick
+
+
+def _prepare_sec(tag: _TagType) -> None:
+	tag["class"].remove("sec")
+	if not tag["class"]:
+		del tag["class"]
+	tag["d:priority"] = "2"
+
+
+def _is_steelblue(x: _TagType) -> bool:
+	return "color:steelblue" in x.get("style", "")
+
+
+def _prepare_steelblue(tag: _TagType) -> None:
+	_remove_style(tag, "color:steelblue")
+	if "ex" not in tag.get("class", []):
+		tag["class"] = tag.get("class", []) + ["ex"]
+
+
+def _prepare_green(tag: _TagType) -> None:
+	_remove_style(tag, "color:green")
+	if "p" not in tag.get("class", ""):
+		tag["class"] = tag.get("class", []) + ["c"]
+
+
+def _prepare_margin(tag: _TagType) -> None:
+	if "style" in tag.attrs:
+		m = _re_margin.search(tag["style"])
+		if m:
+			_remove_style(tag, m.group(0))
+			tag["class"] = tag.get("class", []) + ["m" + m.group(1)]
+
+
+def _is_xhtml(x: _TagType) -> bool:
+	return "xhtml:" in x.name
+
+
+def _prepare_xhtml(tag: _TagType) -> None:
+	old_tag_name = tag.name
+	tag.name = old_tag_name[len("xhtml:") :]
+	if tag.string:
+		tag.string = f"{tag.string} "
+
 
+def _prepare_src(tag: _TagType) -> None:
+	src = tag["src"]
+	if src.startswith("/"):
+		tag["src"] = src[1:]
 
-# TODO: PLR0912 Too many branches (18 > 12)
-def prepare_content_with_soup(  # noqa: PLR0912
+
+def _prepare_u(tag: _TagType) -> None:
+	tag.name = "span"
+	tag["class"] = tag.get("class", []) + ["u"]
+
+
+def prepare_content_with_soup(
 	title: str | None,
 	body: str,
 	BeautifulSoup: BeautifulSoup,  # type: ignore[valid-type]
@@ -191,33 +261,19 @@ def prepare_content_with_soup(  # noqa: PLR0912
 		soup = soup.body
 
 	for tag in soup(class_="sec"):
-		tag["class"].remove("sec")
-		if not tag["class"]:
-			del tag["class"]
-		tag["d:priority"] = "2"
+		_prepare_sec(tag)
 
-	for tag in soup(lambda x: "color:steelblue" in x.get("style", "")):
-		_remove_style(tag, "color:steelblue")
-		if "ex" not in tag.get("class", []):
-			tag["class"] = tag.get("class", []) + ["ex"]
+	for tag in soup(_is_steelblue):
+		_prepare_steelblue(tag)
 
 	for tag in soup(_is_green):
-		_remove_style(tag, "color:green")
-		if "p" not in tag.get("class", ""):
-			tag["class"] = tag.get("class", []) + ["c"]
+		_prepare_green(tag)
 
 	for tag in soup(True):
-		if "style" in tag.attrs:
-			m = _re_margin.search(tag["style"])
-			if m:
-				_remove_style(tag, m.group(0))
-				tag["class"] = tag.get("class", []) + ["m" + m.group(1)]
-
-	for tag in soup(lambda x: "xhtml:" in x.name):
-		old_tag_name = tag.name
-		tag.name = old_tag_name[len("xhtml:") :]
-		if tag.string:
-			tag.string = f"{tag.string} "
+		_prepare_margin(tag)
+
+	for tag in soup(_is_xhtml):
+		_prepare_xhtml(tag)
 
 	for tag in soup.select("[href]"):
 		_prepare_href(tag)
@@ -225,12 +281,9 @@ def prepare_content_with_soup(  # noqa: PLR0912
 	_prepare_onclick(soup)
 
 	for tag in soup.select("[src]"):
-		src = tag["src"]
-		if src.startswith("/"):
-			tag["src"] = src[1:]
+		_prepare_src(tag)
 	for tag in soup("u"):
-		tag.name = "span"
-		tag["class"] = tag.get("class", []) + ["u"]
+		_prepare_u(tag)
 	for tag in soup("s"):
 		tag.name = "del"
 
@@ -244,6 +297,68 @@ def prepare_content_with_soup(  # noqa: PLR0912
 	return toStr(soup.encode_contents())
 
 
+def _prepare_element_attrs(tag: _Element) -> None:
+	if "sec" in tag.get("class", ()):
+		_prepare_sec(tag)
+	if _is_steelblue(tag):
+		_prepare_steelblue(tag)
+	if _is_green(tag):
+		_prepare_green(tag)
+	_prepare_margin(tag)
+	if _is_xhtml(tag):
+		_prepare_xhtml(tag)
+
+
+def _prepare_element_links(tag: _Element) -> None:
+	name = tag.name
+	if "href" in tag.attrs:
+		_prepare_href(tag)
+	if name == "div":
+		classes = tag.get("class", ())
+		if "pic_thumb" in classes:
+			tag["onclick"] = _pic_thumb_onclick
+		if "big_pic" in classes:
+			tag["onclick"] = _big_pic_onclick
+	elif name == "pos" and tag.get("onclick") == "toggle_infl(this)":
+		tag["onclick"] = _toggle_infl_onclick
+	if "src" in tag.attrs:
+		_prepare_src(tag)
+	if name == "u":
+		_prepare_u(tag)
+	elif name == "s":
+		tag.name = "del"
+
+
+def prepare_content_with_lxml(
+	title: str | None,
+	body: str,
+) -> str:
+	"""
+	Same as prepare_content_with_soup, without BeautifulSoup.
+
+	Parses with lxml into a light tree that is built the same way as
+	BeautifulSoup's tree, and applies the same changes in two passes over
+	the tree, instead of searching the whole tree for each change.
+	"""
+	soup = _parse_html(body)
+	bodyElem = soup.find("body")
+	if bodyElem is not None:
+		soup = bodyElem
+
+	# links need xhtml tags to be renamed first (like <xhtml:audio>)
+	for tag in list(soup.descendants()):
+		_prepare_element_attrs(tag)
+	for tag in soup.descendants():
+		_prepare_element_links(tag)
+
+	if title and "<h" not in body:
+		h1 = _Element("h1", {})
+		h1.string = title
+		soup.children.insert(0, h1)
+
+	return soup.decode_contents()
+
+
 def _cleanup_link_target(href: str) -> str:
 	return href.removeprefix("bword://")
 
@@ -276,7 +391,7 @@ def _remove_style(tag: dict[str, Any], line: str) -> None:
 		del tag["style"]
 
 
-def _fix_sound_link(href: str, tag: bs4.element.Tag) -> None:
+def _fix_sound_link(href: str, tag: _TagType) -> None:
 	tag["href"] = f'javascript:new Audio("{href[len("sound://") :]}").play();'
 
 
@@ -301,3 +416,302 @@ def _link_is_url(href: str) -> bool:
 		if href.startswith(prefix):
 			return True
 	return False
+
+
+# ____________ tree for prepare_content_with_lxml ____________
+# Built and written the same way as BeautifulSoup with "lxml" feature
+# and "minimal" formatter, so both give the same output.
+
+# written as <tag/> if empty
+_void_tags = frozenset(
+	{
+		"area",
+		"base",
+		"basefont",
+		"bgsound",
+		"br",
+		"col",
+		"command",
+		"embed",
+		"frame",
+		"hr",
+		"image",
+		"img",
+		"input",
+		"isindex",
+		"keygen",
+		"link",
+		"menuitem",
+		"meta",
+		"nextid",
+		"param",
+		"source",
+		"spacer",
+		"track",
+		"wbr",
+	},
+)
+
+# whitespace-only strings are kept inside these tags
+_preserve_tags = frozenset({"pre", "textarea"})
+
+# strings inside these tags are not escaped
+_cdata_tags = frozenset({"script", "style"})
+
+# attributes that are kept as lists of values, like class="a b"
+_list_attrs = frozenset({"class", "accesskey", "dropzone"})
+_list_attrs_by_tag = {
+	tag: _list_attrs | attrs
+	for tag, attrs in {
+		"a": {"rel", "rev"},
+		"link": {"rel", "rev"},
+		"td": {"headers"},
+		"th": {"headers"},
+		"form": {"accept-charset"},
+		"object": {"archive"},
+		"area": {"rel"},
+		"icon": {"sizes"},
+		"iframe": {"sandbox"},
+		"output": {"for"},
+	}.items()
+}
+
+_ascii_spaces = " \n\t\f\r"
+
+_re_meta_charset = re.compile(r"((^|;)\s*charset=)([^;]*)", re.MULTILINE)
+
+# BeautifulSoup feeds lxml parser in chunks of this size
+_feed_chunk_size = 512
+
+
+class _Comment(str):
+	__slots__ = ()
+
+
+class _Doctype(str):
+	__slots__ = ()
+
+
+class _ProcessingInstruction(str):
+	__slots__ = ()
+
+
+_markup_affixes: dict[type, tuple[str, str]] = {
+	_Comment: ("<!--", "-->"),
+	_Doctype: ("<!DOCTYPE ", ">\n"),
+	_ProcessingInstruction: ("<?", ">"),
+}
+
+
+def _escape(text: str) -> str:
+	return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _quote_attr(value: str | list[str]) -> str:
+	if isinstance(value, list):
+		value = " ".join(value)
+	value = _escape(value)
+	if '"' not in value:
+		return f'"{value}"'
+	if "'" not in value:
+		return f"'{value}'"
+	return '"' + value.replace('"', "&quot;") + '"'
+
+
+class _Element:
+	"""Element with the parts of bs4.element.Tag API that are used here."""
+
+	__slots__ = ("attrs", "children", "name", "void")
+
+	def __init__(
+		self,
+		name: str,
+		attrs: dict[str, Any],
+		void: bool = False,
+	) -> None:
+		self.name = name
+		self.attrs = attrs
+		self.children: list[_Element | str] = []
+		# decided by name at creation, like BeautifulSoup
+		self.void = void
+
+	def __getitem__(self, key: str) -> Any:
+		return self.attrs[key]
+
+	def __setitem__(self, key: str, value: Any) -> None:
+		self.attrs[key] = value
+
+	def __delitem__(self, key: str) -> None:
+		del self.attrs[key]
+
+	def get(self, key: str, default: Any = None) -> Any:
+		return self.attrs.get(key, default)
+
+	def descendants(self) -> Iterator[_Element]:
+		"""Yield descendant elements in document order."""
+		stack = [iter(self.children)]
+		while stack:
+			for child in stack[-1]:
+				if isinstance(child, _Element):
+					yield child
+					stack.append(iter(child.children))
+					break
+			else:
+				stack.pop()
+
+	def find(self, name: str) -> _Element | None:
+		for elem in self.descendants():
+			if elem.name == name:
+				return elem
+		return None
+
+	@property
+	def audio(self) -> _Element | None:
+		return self.find("audio")
+
+	@property
+	def string(self) -> str | None:
+		if len(self.children) != 1:
+			return None
+		child = self.children[0]
+		if isinstance(child, _Element):
+			return child.string
+		return child
+
+	@string.setter
+	def string(self, string: str) -> None:
+		self.children = [string]
+
+	def decode_contents(self) -> str:
+		parts: list[str] = []
+		self._write_contents(parts)
+		return "".join(parts)
+
+	def _write_contents(self, parts: list[str]) -> None:
+		cdata = self.name in _cdata_tags
+		for child in self.children:
+			if isinstance(child, _Element):
+				child._write(parts)
+				continue
+			affixes = _markup_affixes.get(type(child))
+			if affixes is not None:
+				parts += (affixes[0], child, affixes[1])
+			elif cdata:
+				parts.append(child)
+			else:
+				parts.append(_escape(child))
+
+	def _write(self, parts: list[str]) -> None:
+		name = self.name
+		attrs = "".join(
+			f" {key}={_quote_attr(value)}" for key, value in sorted(self.attrs.items())
+		)
+		if self.void and not self.children:
+			parts.append(f"<{name}{attrs}/>")
+			return
+		parts.append(f"<{name}{attrs}>")
+		self._write_contents(parts)
+		parts.append(f"</{name}>")
+
+
+class _TreeBuilder:
+	"""Parser target for lxml.etree.HTMLParser, builds a tree of _Element."""
+
+	def __init__(self) -> None:
+		self.root = _Element("", {})
+		self._stack = [self.root]
+		self._data: list[str] = []
+		# number of open tags in _preserve_tags
+		self._preserve = 0
+
+	def _flush(self, cls: type[str] = str) -> None:
+		if not self._data:
+			return
+		text = "".join(self._data)
+		self._data = []
+		if not self._preserve and not text.strip(_ascii_spaces):
+			text = "\n" if "\n" in text else " "
+		self._stack[-1].children.append(cls(text))
+
+	def start(self, tag: str, attrib: dict[str, str]) -> None:
+		self._flush()
+		attrs: dict[str, Any] = dict(attrib)
+		list_attrs = _list_attrs_by_tag.get(tag.lower(), _list_attrs)
+		for key, value in attrs.items():
+			if key in list_attrs:
+				attrs[key] = value.split()
+		if tag == "meta":
+			_set_meta_charset(attrs)
+		elem = _Element(tag, attrs, void=tag in _void_tags)
+		self._stack[-1].children.append(elem)
+		self._stack.append(elem)
+		if tag in _preserve_tags:
+			self._preserve += 1
+
+	def end(self, tag: str) -> None:
+		self._flush()
+		stack = self._stack
+		for index in range(len(stack) - 1, 0, -1):
+			if stack[index].name != tag:
+				continue
+			for elem in stack[index:]:
+				if elem.name in _preserve_tags:
+					self._preserve -= 1
+			del stack[index:]
+			return
+
+	def data(self, data: str) -> None:
+		self._data.append(data)
+
+	def comment(self, text: str) -> None:
+		self._flush()
+		self._data.append(text)
+		self._flush(_Comment)
+
+	def pi(self, target: str, data: str) -> None:
+		self._flush()
+		self._data.append(f"{target} {data}")
+		self._flush(_ProcessingInstruction)
+
+	def doctype(self, name: str, pubid: str | None, system: str | None) -> None:
+		self._flush()
+		value = name or ""
+		if pubid is not None:
+			value += f' PUBLIC "{pubid}"'
+			if system is not None:
+				value += f' "{system}"'
+		elif system is not None:
+			value += f' SYSTEM "{system}"'
+		self._data.append(value)
+		self._flush(_Doctype)
+
+	def close(self) -> _Element:
+		self._flush()
+		return self.root
+
+
+def _set_meta_charset(attrs: dict[str, Any]) -> None:
+	# BeautifulSoup replaces charset of <meta> with output encoding
+	if attrs.get("charset") is not None:
+		attrs["charset"] = "utf-8"
+		return
+	content = attrs.get("content")
+	http_equiv = attrs.get("http-equiv")
+	if (
+		content is not None
+		and http_equiv is not None
+		and http_equiv.lower() == "content-type"
+	):
+		attrs["content"] = _re_meta_charset.sub(r"\g<1>utf-8", content)
+
+
+def _parse_html(body: str) -> _Element:
+	from lxml import etree
+
+	builder = _TreeBuilder()
+	parser = etree.HTMLParser(target=builder, recover=True)
+	body = body.removeprefix("\N{BYTE ORDER MARK}")
+	parser.feed(body[:_feed_chunk_size])
+	for pos in range(_feed_chunk_size, len(body), _feed_chunk_size):
+		parser.feed(body[pos : pos + _feed_chunk_size])
+	return parser.close()
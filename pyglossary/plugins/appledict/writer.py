@@ -23,6 +23,13 @@ Write AppleDict Dictionary Development Kit XML sources.
 Emits ``.apple`` directory bundles with entry XML, CSS, plist metadata, and
 optional extended indexes. Normalizes HTML definitions and validates output
 against the Jing RELAX NG schema when enabled.
+
+With ``workers > 0``, content of entries (titles, indexes and cleaned HTML)
+is prepared in worker processes, in batches, and written in the same order.
+
+With ``clean_html_parser=lxml``, HTML of definitions is cleaned on a light
+tree built from lxml parser events, instead of a BeautifulSoup tree
+(BeautifulSoup is still used for titles).
 """
 
 from __future__ import annotations
@@ -31,6 +38,7 @@ import os
 import pkgutil
 import shutil
 import sys
+from collections import deque
 from os.path import basename, isdir, join
 from typing import TYPE_CHECKING, Any
 
@@ -48,7 +56,8 @@ from ._normalize import title_long as normalize_title_long
 
 if TYPE_CHECKING:
 	import io
-	from collections.abc import Generator
+	from collections.abc import Callable, Generator
+	from concurrent.futures import Future
 
 	from pyglossary.glossary_types import EntryType, WriterGlossaryType
 
@@ -56,6 +65,14 @@ __all__ = ["Writer"]
 
 sys.setrecursionlimit(10000)
 
+# number of entries sent to a worker process at once
+batchSize = 200
+
+# (word, alts, defi, defiFormat) of entry
+type EntryDataType = tuple[str, list[str], str, str]
+
+# (quoted_title, indexes + content) of entry, None if entry is skipped
+type PreparedEntryType = tuple[str, str] | None
 
 BeautifulSoup = None
 
@@ -78,6 +95,76 @@ def _loadBeautifulSoup() -> None:
 		)
 
 
+class _ContentPreparer:
+	"""Prepare title, indexes and content of entries."""
+
+	def __init__(
+		self,
+		indexes: str,
+		BeautifulSoup: Any,
+		htmlParser: str = "bs4",
+	) -> None:
+		from pyglossary.xdxf.py_transform import XdxfTransformer
+
+		self.BeautifulSoup = BeautifulSoup
+		self.htmlParser = htmlParser
+		self.xdxf_to_html = XdxfTransformer(encoding="utf-8")
+		self.generate_indexes = indexes_generator(indexes)
+
+	def prepare(
+		self,
+		word: str,
+		alts: list[str],
+		defi: str,
+		defiFormat: str,
+	) -> PreparedEntryType:
+		BeautifulSoup = self.BeautifulSoup
+		long_title = normalize_title_long(
+			normalize_title(word, BeautifulSoup),
+		)
+		if not long_title:
+			return None
+
+		quoted_title = quote_string(long_title, BeautifulSoup)
+
+		content_title: str | None = long_title
+		if defiFormat == "x":
+			defi = self.xdxf_to_html.transformByInnerString(defi)
+			content_title = None
+		content = prepare_content(
+			content_title,
+			defi,
+			BeautifulSoup,
+			self.htmlParser,
+		)
+
+		return (
+			quoted_title,
+			self.generate_indexes(long_title, alts, content, BeautifulSoup) + content,
+		)
+
+
+# set in worker processes by _initWorker
+_workerPreparer: _ContentPreparer | None = None
+
+
+def _initWorker(cleanHtml: bool, indexes: str, htmlParser: str) -> None:
+	global _workerPreparer  # noqa: PLW0603
+	if cleanHtml and BeautifulSoup is None:
+		_loadBeautifulSoup()
+	_workerPreparer = _ContentPreparer(
+		indexes,
+		BeautifulSoup if cleanHtml else None,
+		htmlParser,
+	)
+
+
+def _prepareBatch(batch: list[EntryDataType]) -> list[PreparedEntryType]:
+	preparer = _workerPreparer
+	assert preparer is not None
+	return [preparer.prepare(*data) for data in batch]
+
+
 def _abspath_or_None(path: str | None) -> str | None:
 	if not path:
 		return None
@@ -153,6 +240,7 @@ class Writer:
 	}
 
 	_clean_html: bool = True
+	_clean_html_parser: str = "bs4"
 	_css: str = ""
 	_xsl: str = ""
 	_default_prefs: dict[str, Any] | None = None
@@ -160,6 +248,7 @@ class Writer:
 	_front_back_matter: str = ""
 	_jing: bool = False
 	_indexes: str = ""  # FIXME: rename to indexes_lang?
+	_workers: int = 0
 
 	def __init__(self, glos: WriterGlossaryType) -> None:
 		self._glos = glos
@@ -173,10 +262,54 @@ class Writer:
 		if not isdir(dirname):
 			os.mkdir(dirname)
 
-	# TODO: PLR0915 Too many statements (74 > 50)
-	def write(self) -> Generator[None, EntryType, None]:  # noqa: PLR0912, PLR0915
+	def _writeParallel(
+		self,
+		writeEntry: Callable[[PreparedEntryType], None],
+		resDir: str,
+	) -> Generator[None, EntryType, None]:
+		from concurrent.futures import ProcessPoolExecutor
+
+		workers = self._workers
+		log.info(f"Preparing entries in {workers} processes")
+		maxPending = workers * 2
+		pending: deque[Future[list[PreparedEntryType]]] = deque()
+		batch: list[EntryDataType] = []
+		pool = ProcessPoolExecutor(
+			max_workers=workers,
+			initializer=_initWorker,
+			initargs=(
+				BeautifulSoup is not None,
+				self._indexes,
+				self._clean_html_parser,
+			),
+		)
+		try:
+			while True:
+				entry = yield
+				if entry is None:
+					break
+				if entry.isData():
+					entry.save(resDir)
+					continue
+				terms = entry.l_term
+				batch.append((terms[0], terms[1:], entry.defi, entry.defiFormat))
+				if len(batch) < batchSize:
+					continue
+				pending.append(pool.submit(_prepareBatch, batch))
+				batch = []
+				while len(pending) > maxPending:
+					for prepared in pending.popleft().result():
+						writeEntry(prepared)
+			if batch:
+				pending.append(pool.submit(_prepareBatch, batch))
+			while pending:
+				for prepared in pending.popleft().result():
+					writeEntry(prepared)
+		finally:
+			pool.shutdown(wait=True, cancel_futures=True)
+
+	def write(self) -> Generator[None, EntryType, None]:  # noqa: PLR0912
 		global BeautifulSoup
-		from pyglossary.xdxf.py_transform import XdxfTransformer
 
 		glos = self._glos
 		clean_html = self._clean_html
@@ -188,8 +321,6 @@ class Writer:
 		jing = self._jing
 		indexes = self._indexes
 
-		xdxf_to_html = XdxfTransformer(encoding="utf-8")
-
 		if clean_html:
 			if BeautifulSoup is None:
 				_loadBeautifulSoup()
@@ -212,7 +343,6 @@ class Writer:
 		front_back_matter = _abspath_or_None(front_back_matter)
 
 		generate_id = id_generator()
-		generate_indexes = indexes_generator(indexes)
 
 		myResDir = join(dirname, "OtherResources")
 		if not isdir(myResDir):
@@ -220,40 +350,43 @@ class Writer:
 
 		with open(filePathBase + ".xml", mode="w", encoding="utf-8") as toFile:
 			_write_header(toFile, front_back_matter)
-			while True:
-				entry = yield
-				if entry is None:
-					break
-				if entry.isData():
-					entry.save(myResDir)
-					continue
-
-				terms = entry.l_term
-				word, alts = terms[0], terms[1:]
-				defi = entry.defi
-
-				long_title = normalize_title_long(
-					normalize_title(word, BeautifulSoup),
-				)
-				if not long_title:
-					continue
 
+			def writeEntry(prepared: PreparedEntryType) -> None:
+				if prepared is None:
+					return
+				quoted_title, body = prepared
 				id_ = next(generate_id)
-				quoted_title = quote_string(long_title, BeautifulSoup)
-
-				content_title: str | None = long_title
-				if entry.defiFormat == "x":
-					defi = xdxf_to_html.transformByInnerString(defi)
-					content_title = None
-				content = prepare_content(content_title, defi, BeautifulSoup)
-
 				toFile.write(
 					f'<d:entry id="{id_}" d:title={quoted_title}>\n'
-					+ generate_indexes(long_title, alts, content, BeautifulSoup)
-					+ content
+					+ body
 					+ "\n</d:entry>\n",
 				)
 
+			if self._workers > 0:
+				yield from self._writeParallel(writeEntry, myResDir)
+			else:
+				preparer = _ContentPreparer(
+					indexes,
+					BeautifulSoup,
+					self._clean_html_parser,
+				)
+				while True:
+					entry = yield
+					if entry is None:
+						break
+					if entry.isData():
+						entry.save(myResDir)
+						continue
+					terms = entry.l_term
+					writeEntry(
+						preparer.prepare(
+							terms[0],
+							terms[1:],
+							entry.defi,
+							entry.defiFormat,
+						),
+					)
+
 			toFile.write("</d:dictionary>\n")
 
 		if xsl:
@@ -32,6 +32,7 @@ from pyglossary.option import (
 	BoolOption,
 	EncodingOption,
 	HtmlColorOption,
+	IntOption,
 	StrOption,
 )
 
@@ -79,6 +80,12 @@ optionsProp: dict[str, Option] = {
 		multiline=True,
 		comment="Characters to strip from right-side of keys",
 	),
+	"workers": IntOption(
+		comment=(
+			"Number of worker processes for decoding entries, 0 means no worker process"
+		),
+		minim=0,
+	),
 	"search_char_samples": BoolOption(
 		comment="(debug) Search character samples",
 	),
@@ -87,6 +87,7 @@ class Reader(
 	# process keys and alternates as HTML
 	_process_html_in_key: bool = True
 	_key_rstrip_chars: str = ""
+	_workers: int = 0
 
 	##########################################################################
 	"""
@@ -145,6 +146,8 @@ class Reader(
 		self.specialCharPattern = re.compile(r"[^\s\w.]", re.UNICODE)
 		###
 		self.file = None
+		# entry and resource blocks, saved by readInfo
+		self._blockFile = None
 		# offset of gzip header, set in self.open()
 		self.gzipOffset = None
 		# must be a in RRGGBB format
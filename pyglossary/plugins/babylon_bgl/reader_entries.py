@@ -24,10 +24,14 @@ Babylon BGL glossary entry iteration.
 
 Walks the BGL index and yields headword records with offsets into definition
 data. Core entry loop coordinating I/O, charset, and data helper modules.
+
+With ``workers > 0``, entry blocks are read on the main process and decoded
+in worker processes, in batches, and entries are yielded in the same order.
 """
 
 from __future__ import annotations
 
+from collections import deque
 from typing import TYPE_CHECKING
 
 from pyglossary.core import log
@@ -37,16 +41,68 @@ from .reader_data import Block, EntryWordData
 
 if TYPE_CHECKING:
 	from collections.abc import Iterator
+	from concurrent.futures import Future
+	from typing import Any
 
 	from pyglossary.glossary_types import EntryType
 
+	from .reader import Reader
+
 __all__ = ["_BglReaderEntries"]
 
+# number of entry blocks sent to a worker process at once
+batchSize = 200
+
+# (type, offset, data) of block
+type RawBlockType = tuple[int, int, bytes]
+
+# (terms, defi) of each block (None if failed), wordLenMax, defiMaxBytes
+type DecodedBatchType = tuple[list[tuple[list[str], str] | None], int, int]
+
+# set in worker processes by _initWorker
+_workerReader: Reader | None = None
+
+
+def _initWorker(options: dict[str, Any]) -> None:
+	global _workerReader  # noqa: PLW0603
+	from .reader import Reader
+
+	reader = Reader(None)  # type: ignore[arg-type]
+	for name, value in options.items():
+		setattr(reader, name, value)
+	_workerReader = reader
+
+
+def _decodeBatch(rawBlocks: list[RawBlockType]) -> DecodedBatchType:
+	reader = _workerReader
+	assert reader is not None
+	reader.wordLenMax = 0
+	reader.defiMaxBytes = 0
+	decoded = []
+	for blockType, offset, data in rawBlocks:
+		block = Block()
+		block.type = blockType
+		block.offset = offset
+		block.data = data
+		decoded.append(reader.decodeEntryBlock(block))
+	return decoded, reader.wordLenMax, reader.defiMaxBytes
+
 
 class _BglReaderEntries:
 	"""Entry iteration and per-block entry parsing."""
 
-	def __iter__(self) -> Iterator[EntryType]:  # noqa: PLR0912
+	# attributes used by decodeEntryBlock, passed to worker processes
+	_decodeOptions = (
+		"sourceEncoding",
+		"targetEncoding",
+		"_part_of_speech_color",
+		"_no_control_sequence_in_defi",
+		"_strict_string_conversion",
+		"_process_html_in_key",
+		"_key_rstrip_chars",
+	)
+
+	def __iter__(self) -> Iterator[EntryType]:
 		if not self.file:
 			raise RuntimeError("iterating over a reader while it's not open")
 
@@ -59,53 +115,116 @@ class _BglReaderEntries:
 				self.aboutBytes,
 			)
 
-		block = Block()
-		while not self.isEndOfDictData():
-			if not self.readBlock(block):
-				break
-			if not block.data:
-				continue
+		if self._workers > 0:
+			yield from self._iterParallel()
+			return
 
+		for block in self.iterSavedBlocks():
 			if block.type == 2:
 				yield self.readType2(block)
+				continue
+			decoded = self.decodeEntryBlock(block)
+			if decoded is None:
+				continue
+			yield self._glos.newEntry(*decoded)
 
-			elif block.type == 11:
-				succeed, u_word, u_alts, u_defi = self.readEntry_Type11(block)
-				if not succeed:
-					continue
+	def decodeEntryBlock(self, block: Block) -> tuple[list[str], str] | None:
+		"""
+		Decode entry block (type 1, 7, 10, 11 or 13).
 
-				yield self._glos.newEntry(
-					[u_word] + u_alts,
-					u_defi,
-				)
+		Return (terms, defi), or None if failed.
+		"""
+		if block.type == 11:
+			succeed, u_word, u_alts, u_defi = self.readEntry_Type11(block)
+			if not succeed:
+				return None
+			return [u_word] + u_alts, u_defi
 
-			elif block.type in {1, 7, 10, 11, 13}:
-				pos = 0
-				# word:
-				wordData = self.readEntryWord(block, pos)
-				if not wordData:
-					continue
-				pos = wordData.pos
-				# defi:
-				succeed, pos, u_defi, _b_defi = self.readEntryDefi(
-					block,
-					pos,
-					wordData,
-				)
-				if not succeed:
-					continue
-				# now pos points to the first char after definition
-				succeed, pos, u_alts = self.readEntryAlts(
-					block,
-					pos,
-					wordData,
-				)
-				if not succeed:
+		if block.type not in {1, 7, 10, 13}:
+			return None
+
+		pos = 0
+		# word:
+		wordData = self.readEntryWord(block, pos)
+		if not wordData:
+			return None
+		pos = wordData.pos
+		# defi:
+		succeed, pos, u_defi, _b_defi = self.readEntryDefi(
+			block,
+			pos,
+			wordData,
+		)
+		if not succeed:
+			return None
+		# now pos points to the first char after definition
+		succeed, pos, u_alts = self.readEntryAlts(
+			block,
+			pos,
+			wordData,
+		)
+		if not succeed:
+			return None
+		return [wordData.u_word] + u_alts, u_defi
+
+	def _iterParallelItems(
+		self,
+	) -> Iterator[Block | list[RawBlockType]]:
+		"""Yield resource blocks and batches of entry blocks, in order."""
+		batch: list[RawBlockType] = []
+		for block in self.iterSavedBlocks():
+			if block.type == 2:
+				if batch:
+					yield batch
+					batch = []
+				yield block
+				continue
+			batch.append((block.type, block.offset, block.data))
+			if len(batch) >= batchSize:
+				yield batch
+				batch = []
+		if batch:
+			yield batch
+
+	def _iterParallel(self) -> Iterator[EntryType]:
+		from concurrent.futures import ProcessPoolExecutor
+
+		workers = self._workers
+		log.info(f"Decoding entries in {workers} processes")
+		items = self._iterParallelItems()
+		maxPending = workers * 2
+		# resource blocks are read in main process, in their place
+		pending: deque[Future[DecodedBatchType] | Block] = deque()
+		pool = ProcessPoolExecutor(
+			max_workers=workers,
+			initializer=_initWorker,
+			initargs=({name: getattr(self, name) for name in self._decodeOptions},),
+		)
+		try:
+			while True:
+				while len(pending) < maxPending:
+					item = next(items, None)
+					if item is None:
+						break
+					if isinstance(item, Block):
+						pending.append(item)
+						continue
+					pending.append(pool.submit(_decodeBatch, item))
+				if not pending:
+					break
+				item = pending.popleft()
+				if isinstance(item, Block):
+					yield self.readType2(item)
 					continue
-				yield self._glos.newEntry(
-					[wordData.u_word] + u_alts,
-					u_defi,
-				)
+				decodedList, wordLenMax, defiMaxBytes = item.result()
+				self.wordLenMax = max(self.wordLenMax, wordLenMax)
+				self.defiMaxBytes = max(self.defiMaxBytes, defiMaxBytes)
+				for decoded in decodedList:
+					if decoded is None:
+						continue
+					yield self._glos.newEntry(*decoded)
+		finally:
+			pool.shutdown(wait=True, cancel_futures=True)
 
 	def readType2(self, block: Block) -> EntryType | None:
 		"""
@@ -24,11 +24,18 @@ Babylon BGL binary stream I/O helpers.
 
 Reads length-prefixed records and seeks within ``.bgl`` byte streams during
 import. Low-level I/O layer used by the Babylon BGL reader entry parser.
+
+The gzip stream is decompressed once: ``iterBlocks`` reads it in large chunks
+and parses block headers from the buffer, and ``readInfo`` saves entry and
+resource blocks to a spill file (kept in memory while small), which
+``iterSavedBlocks`` reads back when iterating over entries.
 """
 
 from __future__ import annotations
 
 import io
+import struct
+import tempfile
 from typing import TYPE_CHECKING, Any
 
 from pyglossary.core import log
@@ -36,14 +43,24 @@ from pyglossary.text_utils import uintFromBytes
 
 from .bgl_gzip import GzipFile
 from .bgl_text import unknownHtmlEntries
+from .reader_data import Block
 
 if TYPE_CHECKING:
-	from .reader_data import Block
+	from collections.abc import Iterator
 
 __all__ = ["BGLGzipFile", "FileOffS", "_BglReaderIO"]
 
 file = io.BufferedReader
 
+# size of decompressed data to read at once
+readChunkSize = 256 * 1024
+
+# max size of saved blocks to keep in memory, before spilling to disk
+spillMaxMemory = 64 * 1024 * 1024
+
+# header of saved block: type, offset in gzip stream, data length
+_savedBlockHead = struct.Struct("<BQI")
+
 
 class FileOffS(file):
 	"""
@@ -113,6 +130,68 @@ class BGLGzipFile(GzipFile):
 			self.fileobj.close()
 
 
+class _BlockBuffer:
+	"""Parse blocks from a file object, reading it in large chunks."""
+
+	def __init__(self, fileObj: io.IOBase) -> None:
+		self._file = fileObj
+		self._buf = b""
+		# offset of self._buf in file
+		self._bufOffset = 0
+		# position in self._buf
+		self._pos = 0
+		self._eof = False
+
+	def tell(self) -> int:
+		return self._bufOffset + self._pos
+
+	def _fill(self, size: int) -> int:
+		"""Read until `size` bytes are buffered, return number of bytes buffered."""
+		while len(self._buf) - self._pos < size and not self._eof:
+			chunk = self._file.read(max(size, readChunkSize))
+			if not chunk:
+				self._eof = True
+				break
+			self._buf = self._buf[self._pos :] + chunk
+			self._bufOffset += self._pos
+			self._pos = 0
+		return len(self._buf) - self._pos
+
+	def _read(self, size: int) -> bytes:
+		self._fill(size)
+		pos = self._pos
+		data = self._buf[pos : pos + size]
+		self._pos = pos + len(data)
+		return data
+
+	def readBlock(self, block: Block) -> bool:
+		"""Same as _BglReaderIO.readBlock, return False at the end."""
+		block.offset = self.tell()
+		if self._fill(1) < 1:
+			log.debug("readBlock: end of file")
+			return False
+		length = self._buf[self._pos]
+		self._pos += 1
+		block.type = length & 0xF
+		length >>= 4
+		if length < 4:
+			num = length + 1
+			b_length = self._read(num)
+			if len(b_length) != num:
+				if b_length:
+					log.error(
+						f"readBlock: expected to read {num} bytes"
+						f", but found {len(b_length)} bytes",
+					)
+				log.error("readBlock: length = -1")
+				return False
+			length = uintFromBytes(b_length)
+		else:
+			length -= 4
+		block.data = self._read(length) if length > 0 else b""
+		return True
+
+
 class _BglReaderIO:
 	"""Low-level BGL stream I/O."""
 
@@ -160,6 +239,9 @@ class _BglReaderIO:
 		if self.file:
 			self.file.close()
 			self.file = None
+		if self._blockFile:
+			self._blockFile.close()
+			self._blockFile = None
 
 	def __del__(self) -> None:
 		self.close()
@@ -193,6 +275,60 @@ class _BglReaderIO:
 		"""
 		return False
 
+	def iterBlocks(self) -> Iterator[Block]:
+		"""
+		Read all blocks from the beginning of gzip stream.
+
+		Same as calling self.readBlock until it returns False, but reads
+		the stream in large chunks instead of a few bytes at a time.
+		"""
+		self.file.seek(0)
+		buffer = _BlockBuffer(self.file)
+		while True:
+			block = Block()
+			offset = buffer.tell()
+			try:
+				if not buffer.readBlock(block):
+					return
+			except Exception:
+				# broken gzip stream, continue with self.readBlock to
+				# handle the error the same way
+				log.debug(f"iterBlocks: failed to read block at {offset}")
+				self.file.seek(offset)
+				break
+			yield block
+		while True:
+			block = Block()
+			if not self.readBlock(block):
+				return
+			yield block
+
+	def newBlockFile(self) -> None:
+		if self._blockFile:
+			self._blockFile.close()
+		self._blockFile = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+			max_size=spillMaxMemory,
+		)
+
+	def saveBlock(self, block: Block) -> None:
+		"""Save block to block file, to be read by iterSavedBlocks."""
+		self._blockFile.write(
+			_savedBlockHead.pack(block.type, block.offset, len(block.data)),
+		)
+		self._blockFile.write(block.data)
+
+	def iterSavedBlocks(self) -> Iterator[Block]:
+		"""Read blocks saved by self.saveBlock, in the same order."""
+		blockFile = self._blockFile
+		blockFile.seek(0)
+		headSize = _savedBlockHead.size
+		unpack = _savedBlockHead.unpack
+		while head := blockFile.read(headSize):
+			block = Block()
+			block.type, block.offset, length = unpack(head)
+			block.data = blockFile.read(length)
+			yield block
+
 	# returns False if error
 	def readBlock(self, block: Block) -> bool:
 		block.offset = self.file.tell()
@@ -28,6 +28,8 @@ Supplies glossary info and encoding hints to the Babylon BGL reader.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from pyglossary.core import log
 from pyglossary.text_utils import uintFromBytes
 
@@ -35,7 +37,9 @@ from .bgl_info import (
 	charsetInfoDecode,
 	infoType3ByCode,
 )
-from .reader_data import Block
+
+if TYPE_CHECKING:
+	from .reader_data import Block
 
 __all__ = ["_BglReaderMeta"]
 
@@ -52,10 +56,10 @@ class _BglReaderMeta:
 		self.numEntries = 0
 		self.numBlocks = 0
 		self.numResources = 0
-		block = Block()
-		while not self.isEndOfDictData():
-			if not self.readBlock(block):
-				break
+		# entry and resource blocks are saved for __iter__, so the gzip
+		# stream is not decompressed again
+		self.newBlockFile()
+		for block in self.iterBlocks():
 			self.numBlocks += 1
 			if not block.data:
 				continue
@@ -63,8 +67,10 @@ class _BglReaderMeta:
 				self.readType0(block)
 			elif block.type in {1, 7, 10, 11, 13}:
 				self.numEntries += 1
+				self.saveBlock(block)
 			elif block.type == 2:
 				self.numResources += 1
+				self.saveBlock(block)
 			elif block.type == 3:
 				self.readType3(block)
 			else:  # Unknown block.type
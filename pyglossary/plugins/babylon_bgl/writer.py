@@ -120,9 +120,10 @@ def writePayload(
 		terms = entry.l_term
 		if not terms:
 			continue
-		b_word = terms[0].encode("utf-8")
-		b_defi = entry.defi.encode("utf-8")
-		b_alts = [t.encode("utf-8") for t in terms[1:]]
+		lb_term = entry.lb_term
+		b_word = lb_term[0]
+		b_defi = entry.b_defi
+		b_alts = lb_term[1:]
 		if len(b_word) > 255 or any(len(a) > 255 for a in b_alts) or len(b_defi) > 65535:
 			gz.write(_pack_block(11, _pack_entry_type11(b_word, b_defi, b_alts)))
 		else:
@@ -32,6 +32,7 @@ from typing import TYPE_CHECKING, cast
 
 from pyglossary.compress import (
 	compressionOpen,
+	progressFileSize,
 	stdCompressions,
 )
 from pyglossary.core import log
@@ -90,12 +91,8 @@ class Reader:
 		)
 
 		if self._glos.progressbar:
-			if cfile.seekable():
-				cfile.seek(0, 2)
-				self._fileSize = cfile.tell()
-				cfile.seek(0)
-				# self._glos.setInfo("input_file_size", f"{self._fileSize}")
-			else:
+			self._fileSize = progressFileSize(cfile)
+			if not self._fileSize:
 				log.warning("CSV Reader: file is not seekable")
 
 		self._file = TextFilePosWrapper(cfile, self._encoding)
@@ -72,14 +72,10 @@ class Writer:
 		self._dictdb: DictDB | None = None
 
 	def finish(self) -> None:
-		from pyglossary.os_utils import runDictzip
-
 		if self._dictdb is None:
 			raise RuntimeError("self._dictdb is None")
 
 		self._dictdb.finish(dosort=True)
-		if self._dictzip:
-			runDictzip(f"{self._filename}.dict")
 		if self._install:
 			_installToDictd(
 				self._filename,
@@ -91,7 +87,7 @@ class Writer:
 		filename_nox, ext = splitext(filename)
 		if ext.lower() == ".index":
 			filename = filename_nox
-		self._dictdb = DictDB(filename, "write", 1)
+		self._dictdb = DictDB(filename, "write", 1, dictzip=self._dictzip)
 		self._filename = filename
 
 	def write(self) -> Generator[None, EntryType, None]:
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING
 from pyglossary.option import (
 	BoolOption,
 	EncodingOption,
+	IntOption,
 	StrOption,
 )
 
@@ -63,6 +64,13 @@ optionsProp: dict[str, Option] = {
 		values=["", "hover"],
 		comment="Load and apply abbreviation file (`_abrv.dsl`)",
 	),
+	"workers": IntOption(
+		comment=(
+			"Number of worker processes for transforming entries"
+			", 0 means no worker process"
+		),
+		minim=0,
+	),
 }
 
 # ABBYY is a Russian company
@@ -3,10 +3,16 @@ ABBYY Lingvo DSL lexer and token parser.
 
 Tokenizes ``.dsl`` source lines into markup tokens for titles, abbreviations,
 examples, and media references. Feeds the DSL reader transformation pipeline.
+
+``lexRoot`` consumes a whole run of plain text, or a whole tag without
+attributes, with one regex match. Other markup (escapes, ``~``, newlines,
+``<<...>>``, tags with attributes, and malformed markup) is handled one
+character at a time by the state functions.
 """
 
 from __future__ import annotations
 
+import re
 from os.path import splitext
 from typing import TYPE_CHECKING
 from xml.sax.saxutils import escape, quoteattr
@@ -18,6 +24,10 @@ if TYPE_CHECKING:
 
 __all__ = ["lexRoot"]
 
+# group 1: run of characters that are added as text by lexRoot
+# group 2: name of a tag without attributes, like "b", "/b", "m1" or "ref"
+_re_root = re.compile(r"((?:[^\\\[\]~\n<]|<(?!<))+)|\[([^\[\] \t]+)\]")
+
 
 # rename to lexText?
 def lexRoot(tr: TransformerType) -> tuple[LexType, ErrorType]:
@@ -29,6 +39,18 @@ def lexRoot(tr: TransformerType) -> tuple[LexType, ErrorType]:
 		# 	return None, "unexpected: unclosed '('"
 		return None, None
 
+	m = _re_root.match(tr.input, tr.pos)
+	if m is not None:
+		tr.pos = m.end()
+		text = m.group(1)
+		if text is not None:
+			tr.addText(text)
+			tr.resetBuf()
+			return lexRoot, None
+		tr.resetBuf()
+		tr.start = m.start(2)
+		return processTag(tr, m.group(2))
+
 	c = tr.next()
 	if tr.end():
 		tr.addText(c)
@@ -22,6 +22,9 @@ Read Dsl glossary files.
 Tokenizes and parses ABBYY Lingvo DSL source, resolving ``#include`` directives
 and DSL markup into HTML definitions. Applies reader options for abbreviations,
 example styling, and linked audio objects.
+
+With ``workers`` read option, batches of entry blocks are transformed in a
+process pool, and entries are yielded in the same order as the file.
 """
 
 from __future__ import annotations
@@ -29,11 +32,13 @@ from __future__ import annotations
 import html.entities
 import re
 import zipfile
+from collections import deque
 from os.path import abspath, dirname, isfile, join, splitext
 from typing import TYPE_CHECKING, cast
 
 from pyglossary.compress import (
 	compressionOpen,
+	progressFileSize,
 	stdCompressions,
 )
 from pyglossary.core import log
@@ -47,12 +52,23 @@ from .transform import Transformer
 if TYPE_CHECKING:
 	import io
 	from collections.abc import Iterator
+	from concurrent.futures import Future
+	from typing import Any
 
 	from pyglossary.glossary_types import EntryType, ReaderGlossaryType
 
 
 __all__ = ["Reader"]
 
+# number of entry blocks sent to a worker process at once
+batchSize = 200
+
+# (term_lines, text_lines)
+type EntryBlockType = tuple[list[str], list[str]]
+
+# (terms, defi) of main entry and sub-entries of each block
+type RenderedBatchType = tuple[list[list[tuple[list[str], str]]], set[str]]
+
 htmlEntityPattern = re.compile(r"&#?\w+;")
 
 
@@ -90,6 +106,26 @@ def _unwrap_quotes(s: str) -> str:
 	return _re_wrapped_in_quotes.sub("\\2", s)
 
 
+# set in worker processes by _initWorker
+_workerReader: Reader | None = None
+
+
+def _initWorker(options: dict[str, Any]) -> None:
+	global _workerReader  # noqa: PLW0603
+	reader = Reader(None)  # type: ignore[arg-type]
+	for name, value in options.items():
+		setattr(reader, name, value)
+	_workerReader = reader
+
+
+def _renderBatch(blocks: list[EntryBlockType]) -> RenderedBatchType:
+	reader = _workerReader
+	assert reader is not None
+	reader._resFileSet = set()
+	rendered = [reader.renderEntryBlock(*block) for block in blocks]
+	return rendered, reader._resFileSet
+
+
 class Reader:
 	"""Read Dsl glossary files."""
 
@@ -100,6 +136,15 @@ class Reader:
 	_audio: bool = True
 	_example_color: str = "steelblue"
 	_abbrev: str = "hover"
+	_workers: int = 0
+
+	# attributes used by renderEntryBlock, passed to worker processes
+	_renderOptions = (
+		"_audio",
+		"_example_color",
+		"_abbrev",
+		"_abbrevDict",
+	)
 
 	def __init__(self, glos: ReaderGlossaryType) -> None:
 		self._glos = glos
@@ -172,12 +217,8 @@ class Reader:
 			),
 		)
 
-		if cfile.seekable():
-			cfile.seek(0, 2)
-			self._fileSize = cfile.tell()
-			cfile.seek(0)
-			# self._glos.setInfo("input_file_size", f"{self._fileSize}")
-		else:
+		self._fileSize = progressFileSize(cfile)
+		if not self._fileSize:
 			log.warning("DSL Reader: file is not seekable")
 
 		self._file = TextFilePosWrapper(cfile, encoding)
@@ -263,6 +304,7 @@ class Reader:
 		reader = Reader(self._glos)
 		reader._audio = self._audio
 		reader._example_color = self._example_color
+		reader._workers = self._workers
 		with indir(self._dirPath):
 			reader.open(filename)
 		self._includes.append(reader)
@@ -281,11 +323,7 @@ class Reader:
 	# 	line = line.replace("[/']", "")
 	# 	return line  # noqa: RET504
 
-	def __iter__(self) -> Iterator[EntryType]:
-		for reader in self._includes:
-			yield from reader
-			reader.close()
-
+	def _iterBlocks(self) -> Iterator[EntryBlockType]:
 		term_lines: list[str] = []
 		text_lines: list[str] = []
 		for line in self._iterLines():
@@ -297,14 +335,72 @@ class Reader:
 
 			# header or alt
 			if text_lines:
-				yield from self.parseEntryBlock(term_lines, text_lines)
+				yield term_lines, text_lines
 				term_lines = []
 				text_lines = []
 
 			term_lines.append(line)
 
 		if text_lines:
-			yield from self.parseEntryBlock(term_lines, text_lines)
+			yield term_lines, text_lines
+
+	def _iterBatches(self) -> Iterator[list[EntryBlockType]]:
+		batch: list[EntryBlockType] = []
+		for block in self._iterBlocks():
+			batch.append(block)
+			if len(batch) >= batchSize:
+				yield batch
+				batch = []
+		if batch:
+			yield batch
+
+	def _iterParallel(self) -> Iterator[EntryType]:
+		from concurrent.futures import ProcessPoolExecutor
+
+		workers = self._workers
+		log.info(f"Transforming entries in {workers} processes")
+		batches = self._iterBatches()
+		maxPending = workers * 2
+		pending: deque[Future[RenderedBatchType]] = deque()
+		pool = ProcessPoolExecutor(
+			max_workers=workers,
+			initializer=_initWorker,
+			initargs=({name: getattr(self, name) for name in self._renderOptions},),
+		)
+		try:
+			while True:
+				while len(pending) < maxPending:
+					batch = next(batches, None)
+					if batch is None:
+						break
+					pending.append(pool.submit(_renderBatch, batch))
+				if not pending:
+					break
+				rendered, resFileSet = pending.popleft().result()
+				self._resFileSet.update(resFileSet)
+				byteProgress = (
+					(self._file.tell(), self._fileSize) if self._fileSize else None
+				)
+				for entries in rendered:
+					for terms, defi in entries:
+						yield self._glos.newEntry(
+							terms,
+							defi,
+							byteProgress=byteProgress,
+						)
+		finally:
+			pool.shutdown(wait=True, cancel_futures=True)
+
+	def __iter__(self) -> Iterator[EntryType]:
+		for reader in self._includes:
+			yield from reader
+			reader.close()
+
+		if self._workers > 0:
+			yield from self._iterParallel()
+		else:
+			for term_lines, text_lines in self._iterBlocks():
+				yield from self.parseEntryBlock(term_lines, text_lines)
 
 		resFileSet = self._resFileSet.copy()
 
@@ -332,11 +428,30 @@ class Reader:
 				data = file.read()
 			yield self._glos.newDataEntry(fname, data)
 
-	def parseEntryBlock(  # noqa: PLR0912 Too many branches (14 > 12)
+	def parseEntryBlock(
 		self,
 		term_lines: list[str],
 		text_lines: list[str],
 	) -> Iterator[EntryType]:
+		entries = self.renderEntryBlock(term_lines, text_lines)
+		byteProgress = (self._file.tell(), self._fileSize) if self._fileSize else None
+		for terms, defi in entries:
+			yield self._glos.newEntry(
+				terms,
+				defi,
+				byteProgress=byteProgress,
+			)
+
+	def renderEntryBlock(  # noqa: PLR0912 Too many branches (14 > 12)
+		self,
+		term_lines: list[str],
+		text_lines: list[str],
+	) -> list[tuple[list[str], str]]:
+		"""
+		Return (terms, defi) of main entry and sub-entries of entry block.
+
+		Resource files referred to in the block are added to _resFileSet.
+		"""
 		terms: list[str] = []
 		defiTitles: list[str] = []
 		for line in term_lines:
@@ -387,7 +502,7 @@ class Reader:
 
 		if not terms:
 			log.warning(f"No terms: {main_text=}")
-			return
+			return []
 
 		defi = self.transform(
 			text=main_text,
@@ -396,20 +511,15 @@ class Reader:
 		if defiTitles:
 			defi = "<br/>".join(defiTitles + [defi])
 
-		byteProgress = (self._file.tell(), self._fileSize) if self._fileSize else None
-
-		yield self._glos.newEntry(
-			terms,
-			defi,
-			byteProgress=byteProgress,
-		)
-
+		entries = [(terms, defi)]
 		for term, text in subglos_list:
-			yield self._glos.newEntry(
-				[term],
-				self.transform(
-					text=text,
-					header=term,
+			entries.append(
+				(
+					[term],
+					self.transform(
+						text=text,
+						header=term,
+					),
 				),
-				byteProgress=byteProgress,
 			)
+		return entries
@@ -16,7 +16,12 @@ from io import BytesIO
 from os.path import dirname, isfile, join
 from typing import TYPE_CHECKING, cast
 
-from pyglossary.compress import compressionOpen, stdCompressions
+from pyglossary.compress import (
+	compressionOpen,
+	progressFile,
+	progressFileSize,
+	stdCompressions,
+)
 from pyglossary.core import exc_note, log, pip
 from pyglossary.html_utils import unescape_unicode
 from pyglossary.io_utils import nullBinaryIO
@@ -714,7 +719,7 @@ class Reader(ReaderUtils):
 
 		defi = buff.getvalue().decode("utf-8")
 		# defi = defi.replace("\xa0", "&nbsp;")  # do we need to do this?
-		file = self._file
+		file = progressFile(self._file)
 		return self._glos.newEntry(
 			keywords,
 			defi,
@@ -875,9 +880,7 @@ class Reader(ReaderUtils):
 		cfile = compressionOpen(filename, mode="rb")
 
 		if cfile.seekable():
-			cfile.seek(0, 2)
-			self._fileSize = cfile.tell()
-			cfile.seek(0)
+			self._fileSize = progressFileSize(cfile)
 			self._glos.setInfo("input_file_size", str(self._fileSize))
 		else:
 			log.warning("FreeDict Reader: file is not seekable")
@@ -11,9 +11,9 @@ from __future__ import annotations
 import html
 import os
 import re
-import time
-from functools import lru_cache
-from os.path import isdir, isfile, join
+from itertools import groupby
+from operator import itemgetter
+from os.path import isdir, join
 from typing import IO, TYPE_CHECKING
 
 from pyglossary.core import log
@@ -24,7 +24,7 @@ from pyglossary.text_utils import (
 
 if TYPE_CHECKING:
 	import io
-	from collections.abc import Generator
+	from collections.abc import Generator, Iterable, Iterator
 	from re import Pattern
 
 	from pyglossary.glossary_types import (
@@ -128,12 +128,11 @@ class Writer:
 		entry_url_fmt: str,
 		inFile: IO[bytes],
 		outFile: IO[bytes],
-		linkLine: str,
+		link: tuple[int, int, int, bytes],
 	) -> None:
-		outFile.flush()
-		b_x_start, b_x_size, b_target = linkLine.rstrip(b"\n").split(b"\t")
-		outFile.write(inFile.read(int(b_x_start, 16) - inFile.tell()))
-		curLink = inFile.read(int(b_x_size, 16))
+		_, x_start, x_size, b_target = link
+		outFile.write(inFile.read(x_start - inFile.tell()))
+		curLink = inFile.read(x_size)
 
 		if b_target:
 			outFile.write(
@@ -162,7 +161,30 @@ class Writer:
 			(st[:i] + f'class="broken" href="{url}"' + st[j + 1 :]).encode("utf-8"),
 		)
 
-	def fixLinks(self, linkTargetSet: set[str]) -> None:  # noqa: PLR0912
+	@staticmethod
+	def _iterLinks(
+		dirn: str,
+		targetByWord: dict[str, bytes],
+	) -> Iterator[tuple[int, int, int, bytes]]:
+		"""
+		Yield (fileIndex, x_start, x_size, b_target) from links.txt.
+
+		b_target is empty if link target is not found.
+		"""
+		with open(join(dirn, "links.txt"), encoding="utf-8") as linksFile:
+			for line in linksFile:
+				line = line.rstrip("\n")  # noqa: PLW2901
+				if not line:
+					continue
+				target, fileIndexStr, x_start, x_size = line.split("\t")
+				yield (
+					int(fileIndexStr),
+					int(x_start, 16),
+					int(x_size, 16),
+					targetByWord.get(unescapeNTB(target), b""),
+				)
+
+	def fixLinks(self, linkTargetSet: set[str]) -> None:
 		import gc
 
 		gc.collect()
@@ -170,58 +192,23 @@ class Writer:
 
 		filenameList = self._filenameList
 
-		fileByWord: dict[str, list[tuple[str, int]]] = {}
-		for line in open(join(dirn, "index.txt"), encoding="utf-8"):
-			line = line.rstrip("\n")  # noqa: PLW2901
-			if not line:
-				continue
-			entryIndexStr, termEscaped, filename, _ = line.split("\t")
-			entryIndex = int(entryIndexStr)
-			# entryId = f"entry{entryIndex}"
-			term = unescapeNTB(termEscaped)
-			if term not in linkTargetSet:
-				continue
-			if term in fileByWord:
-				fileByWord[term].append((filename, entryIndex))
-			else:
-				fileByWord[term] = [(filename, entryIndex)]
-
-		# with open(join(dirn, "fileByWord.json"), "w") as fileByWordFile:
-		# 	json.dump(fileByWord, fileByWordFile, ensure_ascii=False, indent="\t")
-
-		@lru_cache(maxsize=10)
-		def getLinksByFile(fileIndex: int) -> io.TextIOBase:
-			return open(
-				join(dirn, f"links{fileIndex}"),
-				mode="a",
-				encoding="utf-8",
-			)
-
-		log.info("")
-		for line in open(join(dirn, "links.txt"), encoding="utf-8"):
-			line = line.rstrip("\n")  # noqa: PLW2901
-			if not line:
-				continue
-			target, fileIndexStr, x_start, x_size = line.split("\t")
-			target = unescapeNTB(target)
-			if target not in fileByWord:
-				targetNew = ""
-			else:
-				targetFilename, targetEntryIndex = fileByWord[target][0]
-				targetNew = f"{targetFilename}#entry{targetEntryIndex}"
-			file = getLinksByFile(int(fileIndexStr))
-			file.write(
-				f"{x_start}\t{x_size}\t{targetNew}\n",
-			)
-			file.flush()
+		# link target of each linked term: its first entry
+		targetByWord: dict[str, bytes] = {}
+		with open(join(dirn, "index.txt"), encoding="utf-8") as indexFile:
+			for line in indexFile:
+				line = line.rstrip("\n")  # noqa: PLW2901
+				if not line:
+					continue
+				entryIndexStr, termEscaped, filename, _ = line.split("\t")
+				term = unescapeNTB(termEscaped)
+				if term not in linkTargetSet or term in targetByWord:
+					continue
+				targetByWord[term] = f"{filename}#entry{entryIndexStr}".encode()
 
 		linkTargetSet.clear()
-		del fileByWord, linkTargetSet
+		del linkTargetSet
 		gc.collect()
 
-		if os.sep == "\\":
-			time.sleep(0.1)
-
 		entry_url_fmt = self._glos.getInfo("entry_url")
 
 		re_href = re.compile(
@@ -229,24 +216,42 @@ class Writer:
 			re.IGNORECASE,
 		)
 
-		for fileIndex, filename in enumerate(filenameList):
-			if not isfile(join(dirn, f"links{fileIndex}")):
-				continue
-			with open(join(dirn, filename), mode="rb") as inFile:
-				with open(join(dirn, f"{filename}.new"), mode="wb") as outFile:
-					for linkLine in open(join(dirn, f"links{fileIndex}"), "rb"):
-						self._fixLinkItem(
-							re_href,
-							entry_url_fmt,
-							inFile,
-							outFile,
-							linkLine,
-						)
-					outFile.write(inFile.read())
-
-			os.remove(join(dirn, filename))
-			os.rename(join(dirn, f"{filename}.new"), join(dirn, filename))
-			os.remove(join(dirn, f"links{fileIndex}"))
+		# links.txt is written along with html files, so links are ordered
+		# by file index and then by position in file: each html file is
+		# patched in one pass, without sorting links or writing them again
+		for fileIndex, links in groupby(
+			self._iterLinks(dirn, targetByWord),
+			key=itemgetter(0),
+		):
+			self._fixFileLinks(
+				join(dirn, filenameList[fileIndex]),
+				links,
+				re_href,
+				entry_url_fmt,
+			)
+
+	def _fixFileLinks(
+		self,
+		fpath: str,
+		links: Iterable[tuple[int, int, int, bytes]],
+		re_href: Pattern[bytes],
+		entry_url_fmt: str,
+	) -> None:
+		with (
+			open(fpath, mode="rb") as inFile,
+			open(f"{fpath}.new", mode="wb") as outFile,
+		):
+			for link in links:
+				self._fixLinkItem(
+					re_href,
+					entry_url_fmt,
+					inFile,
+					outFile,
+					link,
+				)
+			outFile.write(inFile.read())
+
+		os.replace(f"{fpath}.new", fpath)
 
 	def writeInfo(self, filename: str, header: str) -> None:
 		glos = self._glos
@@ -406,7 +411,6 @@ class Writer:
 					f"{pos + b_start:x}\t"
 					f"{b_size:x}\n",
 				)
-				linksTxtFileObj.flush()
 
 		self.writeInfo(filename, header)
 
@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, cast
 
 from pyglossary.compress import (
 	compressionOpen,
+	progressFile,
 	stdCompressions,
 )
 from pyglossary.core import exc_note, pip
@@ -210,7 +211,7 @@ class Reader:
 				)
 
 		defi = f.getvalue().decode("utf-8")
-		file = self._file
+		file = progressFile(self._file)
 		byteProgress = (file.tell(), self._fileSize)
 		return self._glos.newEntry(
 			keywords,
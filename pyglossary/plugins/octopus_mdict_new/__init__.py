@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING
 from pyglossary.option import (
 	BoolOption,
 	EncodingOption,
+	IntOption,
 )
 
 from .reader import Reader
@@ -59,6 +60,10 @@ optionsProp: dict[str, Option] = {
 	"audio": BoolOption(
 		comment="Enable audio objects",
 	),
+	"workers": IntOption(
+		comment="Number of threads for decompressing, 0 means no thread",
+		minim=0,
+	),
 }
 
 docTail = """### `python-lzo` is required for **some** MDX glossaries.
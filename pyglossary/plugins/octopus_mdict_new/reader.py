@@ -43,6 +43,10 @@ if TYPE_CHECKING:
 
 __all__ = ["Reader"]
 
+# max total size of decompressed record blocks that are kept in memory
+# after extracting links, to avoid decompressing them again
+blockCacheSize = 256 * 1024 * 1024
+
 
 class Reader:
 	"""Read Octopus MDict (new) glossary files."""
@@ -52,6 +56,7 @@ class Reader:
 	_substyle: bool = True
 	_same_dir_data_files: bool = False
 	_audio: bool = False
+	_workers: int = 0
 
 	depends = {
 		"xxhash": "xxhash",
@@ -87,16 +92,21 @@ class Reader:
 		from pyglossary.plugin_lib.readmdict import MDD, MDX
 
 		self._filename = filename
-		self._mdx = MDX(filename, self._encoding, self._substyle)
+		self._mdx = MDX(
+			filename,
+			self._encoding,
+			self._substyle,
+			workers=self._workers,
+		)
 
 		filenameNoExt, _ext = splitext(self._filename)
 		mddBase = filenameNoExt + extsep
 		for fname in (f"{mddBase}mdd", f"{mddBase}1.mdd"):
 			if isfile(fname):
-				self._mdd.append(MDD(fname))
+				self._mdd.append(MDD(fname, workers=self._workers))
 		mddN = 2
 		while isfile(f"{mddBase}{mddN}.mdd"):
-			self._mdd.append(MDD(f"{mddBase}{mddN}.mdd"))
+			self._mdd.append(MDD(f"{mddBase}{mddN}.mdd", workers=self._workers))
 			mddN += 1
 
 		dataEntryCount = 0
@@ -128,38 +138,41 @@ class Reader:
 		self.loadLinks()
 
 	def loadLinks(self) -> None:
-		from pyglossary.plugin_lib.readmdict import MDX
+		"""
+		Collect "@@@LINK=" redirects as alternates of their target terms.
 
+		Only short records are decoded, and decompressed record blocks
+		(up to blockCacheSize bytes) are kept for __iter__.
+		"""
 		mdx = self._mdx
 		if mdx is None:
 			raise ValueError("mdx is None")
 
 		log.info("extracting links...")
 		linksDict: dict[str, str] = {}
-		term = ""
-		entryCount = 0
-		for b_term, b_defi in mdx.items():
-			term = b_term.decode("utf-8")
+		linkCount = 0
+		for b_term, b_defi in mdx.link_candidates(cache_size=blockCacheSize):
 			defi = b_defi.decode("utf-8").strip()
-			if defi.startswith("@@@LINK="):
-				if not term:
-					log.warning(f"unexpected defi: {defi}")
-					continue
-				mainWord = defi[8:]
-				if mainWord in linksDict:
-					linksDict[mainWord] += "\n" + term
-				else:
-					linksDict[mainWord] = term
+			if not defi.startswith("@@@LINK="):
+				continue
+			linkCount += 1
+			term = b_term.decode("utf-8")
+			if not term:
+				log.warning(f"unexpected defi: {defi}")
 				continue
-			entryCount += 1
+			mainWord = defi[8:]
+			if mainWord in linksDict:
+				linksDict[mainWord] += "\n" + term
+			else:
+				linksDict[mainWord] = term
 
 		log.info(
 			f"extracting links done, sizeof(linksDict)={sys.getsizeof(linksDict)}",
 		)
+		entryCount = len(mdx) - linkCount
 		log.info(f"{entryCount = }")
 		self._linksDict = linksDict
 		self._entryCount = entryCount
-		self._mdx = MDX(self._filename, self._encoding, self._substyle)
 
 	def fixDefi(self, defi: str) -> str:
 		defi = self._re_internal_link.sub(r"href=\1bword://", defi)
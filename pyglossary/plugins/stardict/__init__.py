@@ -100,6 +100,9 @@ optionsProp: dict[str, Option] = {
 		],
 		comment="What to do with Unicode decoding errors",
 	),
+	"lazy_index": BoolOption(
+		comment="Memory-map index files and parse them while reading entries",
+	),
 	"audio_goldendict": BoolOption(
 		comment="Convert audio links for GoldenDict (desktop)",
 	),
@@ -0,0 +1,189 @@
+"""
+Lazily decoded StarDict ``.idx`` / ``.syn`` index.
+
+Used by the StarDict reader when ``lazy_index`` read option is enabled.
+Plain index files are memory-mapped, ``.idx`` records are parsed while
+iterating over entries, and the synonym map is kept in two arrays instead of
+a dict of lists, so that alternates are decoded only when they are needed.
+"""
+
+from __future__ import annotations
+
+import gzip
+import mmap
+import struct
+from array import array
+from os.path import isfile
+from typing import TYPE_CHECKING
+
+from pyglossary.core import log
+
+if TYPE_CHECKING:
+	from collections.abc import Iterator
+
+	type BufferType = bytes | mmap.mmap
+
+__all__ = ["SynIndex", "countIdxRecords", "iterIdxRecords", "loadIndexBuffer"]
+
+
+_unpackUint32 = struct.Struct(">I").unpack_from
+_unpackUint64 = struct.Struct(">Q").unpack_from
+
+
+def loadIndexBuffer(path: str, gzPath: str) -> BufferType | None:
+	"""
+	Return a read-only buffer of index file `path` (or `gzPath`).
+
+	Plain files are memory-mapped, gzip files are decompressed into memory.
+	Return None if neither file exists.
+	"""
+	if isfile(path):
+		with open(path, "rb") as file:
+			try:
+				return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+			except ValueError:  # empty file
+				return b""
+	if isfile(gzPath):
+		with gzip.open(gzPath, mode="rb") as zfile:
+			return zfile.read()
+	return None
+
+
+def iterIdxRecords(
+	buf: BufferType,
+	largeFile: bool,
+) -> Iterator[tuple[bytes, int, int]]:
+	"""Yield (b_term, offset, size) for each record of .idx buffer."""
+	if largeFile:
+		offsetSize = 8
+		unpackOffset = _unpackUint64
+	else:
+		offsetSize = 4
+		unpackOffset = _unpackUint32
+	recordTail = offsetSize + 4
+	bufLen = len(buf)
+	find = buf.find
+	pos = 0
+	while pos < bufLen:
+		beg = pos
+		pos = find(b"\x00", beg)
+		if pos < 0:
+			log.error("Index file is corrupted")
+			break
+		b_term = buf[beg:pos]
+		pos += 1
+		if pos + recordTail > bufLen:
+			log.error("Index file is corrupted")
+			break
+		offset = unpackOffset(buf, pos)[0]
+		size = _unpackUint32(buf, pos + offsetSize)[0]
+		pos += recordTail
+		yield b_term, offset, size
+
+
+def countIdxRecords(buf: BufferType, largeFile: bool) -> int:
+	"""Count records of .idx buffer, without decoding them."""
+	recordTail = (8 if largeFile else 4) + 4
+	bufLen = len(buf)
+	find = buf.find
+	count = 0
+	pos = find(b"\x00")
+	while pos >= 0:
+		pos += 1 + recordTail
+		if pos > bufLen:
+			break
+		count += 1
+		if pos >= bufLen:
+			break
+		pos = find(b"\x00", pos)
+	return count
+
+
+class SynIndex:
+	"""
+	Compact map of entry index to synonyms, built from a .syn buffer.
+
+	Synonym offsets in `buf` are grouped by entry index (stable, so the order
+	of synonyms for each entry is the same as in the .syn file):
+	synonyms of entry ``i`` start at ``buf`` offsets
+	``offsets[starts[i]:starts[i + 1]]``
+	"""
+
+	def __init__(
+		self,
+		buf: BufferType,
+		entryCount: int,
+		unicode_errors: str,
+	) -> None:
+		self._buf = buf
+		self._unicode_errors = unicode_errors
+		self._starts = array("I")
+		self._offsets = array("Q")
+		self._build(entryCount)
+
+	def __len__(self) -> int:
+		return len(self._offsets)
+
+	def _build(self, entryCount: int) -> None:
+		buf = self._buf
+		bufLen = len(buf)
+		find = buf.find
+		entryIndexes = array("I")
+		altOffsets = array("Q")
+		counts = array("I", bytes(4 * entryCount))
+		pos = 0
+		while pos < bufLen:
+			beg = pos
+			pos = find(b"\x00", beg)
+			if pos < 0:
+				log.error("Synonym file is corrupted")
+				break
+			pos += 1
+			if pos + 4 > bufLen:
+				log.error("Synonym file is corrupted")
+				break
+			entryIndex = _unpackUint32(buf, pos)[0]
+			pos += 4
+			if entryIndex >= entryCount:
+				log.error(
+					f"Corrupted synonym file. Word {buf[beg : pos - 5]!r}"
+					" references invalid item",
+				)
+				continue
+			entryIndexes.append(entryIndex)
+			altOffsets.append(beg)
+			counts[entryIndex] += 1
+
+		# counting sort by entry index
+		starts = array("I", bytes(4 * (entryCount + 1)))
+		total = 0
+		for index, count in enumerate(counts):
+			starts[index] = total
+			total += count
+		starts[entryCount] = total
+		del counts
+
+		offsets = array("Q", bytes(8 * total))
+		nextPos = array("I", starts)
+		for entryIndex, altOffset in zip(entryIndexes, altOffsets, strict=True):
+			offsets[nextPos[entryIndex]] = altOffset
+			nextPos[entryIndex] += 1
+
+		self._starts = starts
+		self._offsets = offsets
+
+	def get(self, entryIndex: int) -> list[str] | None:
+		"""Return synonyms of entry `entryIndex`, or None if it has none."""
+		beg = self._starts[entryIndex]
+		end = self._starts[entryIndex + 1]
+		if beg == end:
+			return None
+		buf = self._buf
+		unicode_errors = self._unicode_errors
+		return [
+			buf[offset : buf.find(b"\x00", offset)].decode(
+				"utf-8",
+				errors=unicode_errors,
+			)
+			for offset in self._offsets[beg:end]
+		]
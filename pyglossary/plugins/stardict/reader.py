@@ -4,6 +4,8 @@ Read StarDict glossary files.
 Parses ``.ifo`` metadata plus ``.idx``/``.dict``/``.syn`` (plain or gzip).
 Supports optional XDXF transformation of definitions and reports progress by entry
 count. Handles both 32-bit and 64-bit StarDict index layouts.
+With ``lazy_index`` option, index files are memory-mapped and parsed while
+reading entries (see ``lazyidx.py``).
 """
 
 from __future__ import annotations
@@ -20,14 +22,23 @@ from os.path import (
 from typing import TYPE_CHECKING, Protocol
 
 from pyglossary.core import log
+from pyglossary.dictzip_reader import openDictzip
 from pyglossary.os_utils import countFilesRecursive, listFilesRecursiveRelPath
 from pyglossary.text_utils import (
 	uint32FromBytes,
 	uint64FromBytes,
 )
 
+from .lazyidx import (
+	SynIndex,
+	countIdxRecords,
+	iterIdxRecords,
+	loadIndexBuffer,
+)
+
 if TYPE_CHECKING:
 	import io
+	import mmap
 	from collections.abc import Iterator
 
 	from pyglossary.glossary_types import EntryType, ReaderGlossaryType
@@ -40,6 +51,12 @@ if TYPE_CHECKING:
 
 __all__ = ["Reader"]
 
+# buffer size for reading .dict file, entries are mostly read in order
+_dictBufferSize = 1024 * 1024
+
+# number of .dict.dz chunks to decompress ahead while reading in order
+dictzipPrefetch = 4
+
 
 def _verifySameTypeSequence(s: str) -> bool:
 	if not s:
@@ -57,6 +74,7 @@ class Reader:
 	_xdxf_to_html: bool = True
 	_xsl: bool = True
 	_unicode_errors: str = "strict"
+	_lazy_index: bool = False
 
 	def __init__(self, glos: ReaderGlossaryType) -> None:
 		self._glos = glos
@@ -80,6 +98,9 @@ class Reader:
 
 		synDict:
 			a dict { entryIndex -> altList }
+
+		with lazy_index option, indexData and synDict are empty, and
+		idxBuffer and synIndex are used instead
 		"""
 
 	def xdxf_setup(self) -> XdxfTransformerType:
@@ -99,6 +120,9 @@ class Reader:
 	def close(self) -> None:
 		if self._dictFile:
 			self._dictFile.close()
+		for buf in (self._idxBuffer, self._synBuffer):
+			if buf is not None and not isinstance(buf, bytes):
+				buf.close()
 		self.clear()
 
 	def clear(self) -> None:
@@ -106,6 +130,9 @@ class Reader:
 		self._filename = ""  # base file path, no extension
 		self._indexData: list[tuple[bytes, int, int]] = []
 		self._synDict: dict[int, list[str]] = {}
+		self._idxBuffer: bytes | mmap.mmap | None = None
+		self._synBuffer: bytes | mmap.mmap | None = None
+		self._synIndex: SynIndex | None = None
 		self._sametypesequence = ""
 		self._resDir = ""
 		self._resCount = 0
@@ -124,14 +151,24 @@ class Reader:
 			sametypesequence = ""
 		if not _verifySameTypeSequence(sametypesequence):
 			raise LookupError(f"Invalid {sametypesequence = }")
-		self._indexData = self.readIdxFile()
-		self._entryCount = len(self._indexData)
-		self._synDict = self.readSynFile()
+		if self._lazy_index:
+			self.openLazyIndex()
+		else:
+			self._indexData = self.readIdxFile()
+			self._entryCount = len(self._indexData)
+			self._synDict = self.readSynFile()
 		self._sametypesequence = sametypesequence
 		if isfile(self._filename + ".dict.dz"):
-			self._dictFile = gzip.open(self._filename + ".dict.dz", mode="rb")
+			self._dictFile = openDictzip(
+				self._filename + ".dict.dz",
+				prefetch=dictzipPrefetch,
+			)
 		else:
-			self._dictFile = open(self._filename + ".dict", mode="rb")
+			self._dictFile = open(
+				self._filename + ".dict",
+				mode="rb",
+				buffering=_dictBufferSize,
+			)
 		self._resDir = join(dirname(self._filename), "res")
 		self._resCount = 0
 		if not isdir(self._resDir):
@@ -186,6 +223,28 @@ class Reader:
 			else:
 				raise ValueError(f"invalid {idxoffsetbits = }")
 
+	def openLazyIndex(self) -> None:
+		idxBuffer = loadIndexBuffer(
+			self._filename + ".idx",
+			self._filename + ".idx.gz",
+		)
+		if idxBuffer is None:
+			raise FileNotFoundError(f"No such file: {self._filename + '.idx'!r}")
+		self._idxBuffer = idxBuffer
+		self._entryCount = countIdxRecords(idxBuffer, self._large_file)
+		synBuffer = loadIndexBuffer(
+			self._filename + ".syn",
+			self._filename + ".syn.dz",
+		)
+		if synBuffer is None:
+			return
+		self._synBuffer = synBuffer
+		self._synIndex = SynIndex(
+			synBuffer,
+			self._entryCount,
+			self._unicode_errors,
+		)
+
 	def readIdxFile(self) -> list[tuple[bytes, int, int]]:
 		if isfile(self._filename + ".idx.gz"):
 			with gzip.open(self._filename + ".idx.gz") as g_file:
@@ -342,9 +401,17 @@ class Reader:
 			defis.append(defi)
 		return "\n<hr>\n".join(defis), "h"
 
+	def _iterIndexData(self) -> Iterator[tuple[bytes, int, int]]:
+		if self._idxBuffer is not None:
+			return iterIdxRecords(self._idxBuffer, self._large_file)
+		return iter(self._indexData)
+
+	def _getAlts(self, entryIndex: int) -> list[str] | None:
+		if self._synIndex is not None:
+			return self._synIndex.get(entryIndex)
+		return self._synDict.get(entryIndex)
+
 	def __iter__(self) -> Iterator[EntryType]:  # noqa: PLR0912
-		indexData = self._indexData
-		synDict = self._synDict
 		sametypesequence = self._sametypesequence
 		dictFile = self._dictFile
 		unicode_errors = self._unicode_errors
@@ -352,20 +419,27 @@ class Reader:
 		if not dictFile:
 			raise RuntimeError("iterating over a reader while it's not open")
 
-		if not indexData:
+		if not self._entryCount:
 			log.warning("indexData is empty")
 			return
 
-		for entryIndex, (b_term, defiOffset, defiSize) in enumerate(indexData):
+		# position of dictFile, to avoid seek when entries are in order
+		dictPos = -1
+		for entryIndex, (b_term, defiOffset, defiSize) in enumerate(
+			self._iterIndexData(),
+		):
 			if not b_term:
 				continue
 
-			dictFile.seek(defiOffset)
-			if dictFile.tell() != defiOffset:
-				log.error(f"Unable to read definition for word {b_term!r}")
-				continue
+			if defiOffset != dictPos:
+				dictFile.seek(defiOffset)
+				if dictFile.tell() != defiOffset:
+					log.error(f"Unable to read definition for word {b_term!r}")
+					dictPos = -1
+					continue
 
 			b_defiBlock = dictFile.read(defiSize)
+			dictPos = defiOffset + len(b_defiBlock)
 
 			if len(b_defiBlock) != defiSize:
 				log.error(f"Unable to read definition for word {b_term!r}")
@@ -385,12 +459,9 @@ class Reader:
 
 			term: str | list[str]
 			term = b_term.decode("utf-8", errors=unicode_errors)
-			try:
-				alts = synDict[entryIndex]
-			except KeyError:  # synDict is dict
-				pass
-			else:
-				term = [term] + alts
+			alts = self._getAlts(entryIndex)
+			if alts:
+				term = [term, *alts]
 
 			defi, defiFormat = self.renderRawDefiList(
 				rawDefiList,
@@ -12,6 +12,7 @@ from os.path import isfile
 from typing import TYPE_CHECKING, Any
 
 from pyglossary.core import log
+from pyglossary.sq_entry_list import tmpDatabasePragmas
 
 if TYPE_CHECKING:
 	import sqlite3
@@ -29,6 +30,9 @@ __all__ = [
 class _BaseSqList:
 	"""Internal base sq list."""
 
+	# number of buffered rows inserted at once with executemany
+	appendBatchSize = 1000
+
 	def __init__(
 		self,
 		database: str,
@@ -39,12 +43,17 @@ class _BaseSqList:
 			log.warning(f"Renaming {database} to {database}.bak")
 			os.rename(database, database + "bak")
 
+		self._buffer: list[list[Any]] = []
+
 		self._con: sqlite3.Connection | None = connect(database)
 		self._cur: sqlite3.Cursor | None = self._con.cursor()
 
 		if not database:
 			raise ValueError(f"invalid {database=}")
 
+		for pragma in tmpDatabasePragmas:
+			self._con.execute(pragma)
+
 		self._orderBy = "word_lower, word"
 		self._sorted = False
 		self._len = 0
@@ -55,14 +64,15 @@ class _BaseSqList:
 		] + self.getExtraColumns()
 
 		self._columnNames = ",".join(col[0] for col in columns)
+		self._insertQuery = (
+			f"insert into data({self._columnNames})"
+			f" values (?{', ?' * (len(columns) - 1)})"
+		)
 
 		colDefs = ",".join(f"{col[0]} {col[1]}" for col in columns)
 		self._con.execute(
 			f"CREATE TABLE data ({colDefs})",
 		)
-		self._con.execute(
-			f"CREATE INDEX sortkey ON data({self._orderBy});",
-		)
 		self._con.commit()
 
 	@classmethod
@@ -77,18 +87,36 @@ class _BaseSqList:
 		if self._cur is None or self._con is None:
 			raise RuntimeError("db is closed")
 		self._len += 1
-		extraN = len(self._columns) - 1
-		self._cur.execute(
-			f"insert into data({self._columnNames}) values (?{', ?' * extraN})",
-			[item[0].lower()] + list(item),
-		)
+		self._buffer.append([item[0].lower(), *item])
+		if len(self._buffer) >= self.appendBatchSize:
+			self._flush()
+
+	def _flush(self) -> None:
+		if not self._buffer:
+			return
+		if self._cur is None:
+			raise RuntimeError("db is closed")
+		self._cur.executemany(self._insertQuery, self._buffer)
+		self._buffer = []
 
 	def sort(self) -> None:
-		pass
+		if self._sorted:
+			return
+		if self._cur is None or self._con is None:
+			raise RuntimeError("db is closed")
+		self._flush()
+		# creating the index after loading all rows is much faster
+		# than updating it on every insert
+		self._con.execute(
+			f"CREATE INDEX sortkey ON data({self._orderBy});",
+		)
+		self._con.commit()
+		self._sorted = True
 
 	def close(self) -> None:
 		if self._cur is None or self._con is None:
 			return
+		self._flush()
 		self._con.commit()
 		self._cur.close()
 		self._con.close()
@@ -104,6 +132,7 @@ class _BaseSqList:
 	def __iter__(self) -> Iterator[EntryType]:
 		if self._cur is None:
 			raise RuntimeError("db is closed")
+		self._flush()
 		query = f"SELECT * FROM data ORDER BY {self._orderBy}"
 		self._cur.execute(query)
 		for row in self._cur:
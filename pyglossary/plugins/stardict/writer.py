@@ -5,6 +5,8 @@ Emits ``.ifo``, compressed ``.idx``/``.dict``/``.syn`` under a directory or
 single-file layout. Can buffer entries in memory (``MemSdList``) or SQLite
 (``IdxSqList``/``SynSqList``) for large glossaries. Honors glossary sort keys
 and StarDict info fields (bookname, author, etc.).
+With ``dictzip``, ``.dict.dz`` is compressed while ``.dict`` data is written
+(``DictzipWriter``), instead of a separate pass after writing.
 """
 
 from __future__ import annotations
@@ -26,6 +28,7 @@ from time import perf_counter as now
 from typing import TYPE_CHECKING, Literal
 
 from pyglossary.core import log
+from pyglossary.dictzip_writer import DictzipWriter
 from pyglossary.glossary_utils import Error
 from pyglossary.plugins.stardict.memlist import MemSdList
 from pyglossary.plugins.stardict.sqlist import IdxSqList, SynSqList
@@ -68,7 +71,7 @@ def _newlinesToBr(text: str) -> str:
 class _PartFiles:
 	"""Internal part files."""
 
-	dictFile: io.BufferedWriter
+	dictFile: io.BufferedWriter | DictzipWriter
 	idxFile: io.BufferedWriter
 	altIndexList: T_SdList[tuple[bytes, int]]
 
@@ -109,7 +112,7 @@ class Writer:
 		self._glos = glos
 		self._filename = ""
 		self._resDir = ""
-		self._openMultipartFiles: list[io.BufferedWriter] = []
+		self._openMultipartFiles: list[io.BufferedWriter | DictzipWriter] = []
 		self._sourceLang: Lang | None = None
 		self._targetLang: Lang | None = None
 		self._p_pattern = re.compile(
@@ -243,6 +246,12 @@ class Writer:
 		# defi = defi.replace(' src="./', ' src="./res/')
 		return defi.encode("utf-8")
 
+	def _entryDefiBytes(self, entry: EntryType, defiFormat: str) -> bytes:
+		if self._audio_goldendict or (self._stardict_client and defiFormat == "h"):
+			return self.fixDefi(entry.defi, defiFormat)
+		# fixDefi would not change defi, avoid decoding and encoding it again
+		return entry.b_defi
+
 	def newIdxList(self) -> T_SdList[tuple[bytes, bytes]]:
 		if not self._sqlite:
 			return MemSdList()
@@ -285,8 +294,13 @@ class Writer:
 		partIndex: int,
 	) -> _PartFiles:
 		fileBasePath = self.partBasePath(partIndex)
+		dictFile: io.BufferedWriter | DictzipWriter
+		if self._dictzip:
+			dictFile = DictzipWriter(fileBasePath + ".dict.dz")
+		else:
+			dictFile = open(fileBasePath + ".dict", "wb")
 		return _PartFiles(
-			open(fileBasePath + ".dict", "wb"),
+			dictFile,
 			open(fileBasePath + ".idx", "wb"),
 			self.newSynList(),
 		)
@@ -296,10 +310,7 @@ class Writer:
 		partState: _MultipartState,
 		partFiles: _PartFiles,
 	) -> None:
-		from pyglossary.os_utils import runDictzip
-
 		fileBasePath = self.partBasePath(partState.partIndex)
-		partFiles.dictFile.close()
 		partFiles.idxFile.close()
 
 		self.writeSynFile(partFiles.altIndexList, fileBasePath)
@@ -311,11 +322,9 @@ class Writer:
 			partNumber=partNumber,
 		)
 
-		if self._dictzip:
-			runDictzip(f"{fileBasePath}.dict")
-		syn_file = f"{fileBasePath}.syn"
-		if self._dictzip_syn and isfile(syn_file):
-			runDictzip(syn_file)
+		# closing dict file last, so that with dictzip, compression of the
+		# last chunks runs (in threads) while .syn and .ifo are written
+		partFiles.dictFile.close()
 
 	def _closePartFiles(self) -> None:
 		for partFile in self._openMultipartFiles:
@@ -394,7 +403,7 @@ class Writer:
 		t0 = now()
 		yield from self._writeMultipart(
 			lambda entry: (
-				self.fixDefi(entry.defi, defiFormat),
+				self._entryDefiBytes(entry, defiFormat),
 				entry.lb_term,
 			),
 		)
@@ -417,7 +426,7 @@ class Writer:
 		entry: EntryType,
 	) -> tuple[bytes, tuple[bytes, ...]]:
 		defiFormat = entry.detectDefiFormat("m")  # call no more than once
-		b_defi = self.fixDefi(entry.defi, defiFormat)
+		b_defi = self._entryDefiBytes(entry, defiFormat)
 		return defiFormat.encode("ascii") + b_defi + b"\x00", entry.lb_term
 
 	def writeSynFile(
@@ -442,7 +451,12 @@ class Writer:
 		)
 		log.info(f"Writing {len(altIndexList)} synonyms...")
 		t0 = now()
-		with open(fileBasePath + ".syn", "wb") as synFile:
+		synFile: io.BufferedWriter | DictzipWriter
+		if self._dictzip_syn:
+			synFile = DictzipWriter(fileBasePath + ".syn.dz")
+		else:
+			synFile = open(fileBasePath + ".syn", "wb")
+		with synFile:
 			synFile.writelines(
 				b_alt + b"\x00" + uint32ToBytes(entryIndex)
 				for b_alt, entryIndex in altIndexList
@@ -9,13 +9,15 @@ layout suitable for StarDict-compatible viewers.
 from __future__ import annotations
 
 from time import perf_counter as now
-from typing import TYPE_CHECKING, BinaryIO
+from typing import TYPE_CHECKING
 
 from pyglossary.core import log
+from pyglossary.dictzip_writer import DictzipWriter
 from pyglossary.plugins.stardict import Writer as StdWriter
 from pyglossary.text_utils import uint32ToBytes
 
 if TYPE_CHECKING:
+	import io
 	from collections.abc import Callable, Generator
 
 	from pyglossary.glossary_types import EntryType
@@ -33,22 +35,26 @@ class Writer(StdWriter):
 	def fixDefi(self, defi: str, defiFormat: str) -> bytes:  # noqa: ARG002, PLR6301
 		return defi.encode("utf-8")
 
+	def _openMergeSynsDictFile(
+		self,
+		fileBasePath: str,
+	) -> io.BufferedWriter | DictzipWriter:
+		if self._dictzip:
+			return DictzipWriter(fileBasePath + ".dict.dz")
+		return open(fileBasePath + ".dict", "wb")
+
 	def _finishMergeSynsPart(
 		self,
-		dictFile: BinaryIO,
+		dictFile: io.BufferedWriter | DictzipWriter,
 		idxBlockList: T_SdList[tuple[bytes, bytes]],
 		fileBasePath: str,
 		partNumber: int | None,
 	) -> None:
-		from pyglossary.os_utils import runDictzip
-
 		if not dictFile.closed:
 			dictFile.close()
 		self._openMultipartFiles.clear()
 		self.writeIdxFile(idxBlockList, fileBasePath)
 		self.writeIfoFile(len(idxBlockList), 0, fileBasePath, partNumber=partNumber)
-		if self._dictzip:
-			runDictzip(f"{fileBasePath}.dict")
 
 	def _writeMultipartMergeSyns(
 		self,
@@ -60,7 +66,7 @@ class Writer(StdWriter):
 		partIndex = 0
 		multiPart = False
 		fileBasePath = self.partBasePath(partIndex)
-		dictFile = open(fileBasePath + ".dict", "wb")
+		dictFile = self._openMergeSynsDictFile(fileBasePath)
 		self._openMultipartFiles[:] = [dictFile]
 		idxBlockList = self.newIdxList()
 		dictMark = 0
@@ -89,7 +95,7 @@ class Writer(StdWriter):
 					partIndex += 1
 					log.info(f"Creating {self.partBasePath(partIndex)}")
 					fileBasePath = self.partBasePath(partIndex)
-					dictFile = open(fileBasePath + ".dict", "wb")
+					dictFile = self._openMergeSynsDictFile(fileBasePath)
 					self._openMultipartFiles[:] = [dictFile]
 					idxBlockList = self.newIdxList()
 					dictMark = 0
@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, cast
 
 from pyglossary.compress import (
 	compressionOpen,
+	progressFile,
+	progressFileSize,
 	stdCompressions,
 )
 from pyglossary.core import exc_note, log, pip
@@ -84,9 +86,7 @@ class Reader:
 		cfile = compressionOpen(filename, mode="rb")
 
 		if cfile.seekable():
-			cfile.seek(0, 2)
-			self._fileSize = cfile.tell()
-			cfile.seek(0)
+			self._fileSize = progressFileSize(cfile)
 			# self._glos.setInfo("input_file_size", f"{self._fileSize}")
 		else:
 			log.warning("StarDict Textual File Reader: file is not seekable")
@@ -169,7 +169,8 @@ class Reader:
 
 		glos = self._glos
 		fileSize = self._fileSize
-		self._file = file = compressionOpen(self._filename, mode="rb")
+		self._file = compressionOpen(self._filename, mode="rb")
+		file = progressFile(self._file)
 		context = ET.iterparse(  # noqa: PGH003
 			self._file,
 			events=("end",),
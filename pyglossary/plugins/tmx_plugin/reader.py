@@ -19,7 +19,12 @@ if TYPE_CHECKING:
 
 from lxml import etree as ET
 
-from pyglossary.compress import compressionOpen, stdCompressions
+from pyglossary.compress import (
+	compressionOpen,
+	progressFile,
+	progressFileSize,
+	stdCompressions,
+)
 from pyglossary.core import log
 from pyglossary.io_utils import nullBinaryIO
 
@@ -56,9 +61,7 @@ class Reader:
 		)
 
 		if self._file.seekable():
-			self._file.seek(0, 2)
-			self._fileSize = self._file.tell()
-			self._file.seek(0)
+			self._fileSize = progressFileSize(self._file)
 		else:
 			log.warning("TMX Reader: file is not seekable")
 			self._file.close()
@@ -137,7 +140,7 @@ class Reader:
 					terms,
 					defi,
 					defiFormat="h",
-					byteProgress=(self._file.tell(), self._fileSize),
+					byteProgress=(progressFile(self._file).tell(), self._fileSize),
 				)
 
 				parent = tu.getparent()
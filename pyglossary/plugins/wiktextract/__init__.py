@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 
 from pyglossary.option import (
 	BoolOption,
+	IntOption,
 	ListOption,
 	StrOption,
 )
@@ -74,4 +75,11 @@ optionsProp: dict[str, Option] = {
 	"categories": BoolOption(
 		comment="Enable categories",
 	),
+	"workers": IntOption(
+		comment=(
+			"Number of worker processes for decoding and rendering entries"
+			", 0 means no worker process"
+		),
+		minim=0,
+	),
 }
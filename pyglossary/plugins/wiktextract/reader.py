@@ -4,12 +4,16 @@ Read Wiktionary data extracted by Wiktextract (JSON/JSONL).
 Maps Wiktextract lemma objects to glossary entries, rendering senses, tags,
 etymology, and pronunciations as HTML. Handles multilingual Wiktionary dumps
 processed through the Wiktextract tool chain.
+
+With ``workers`` read option, batches of lines are decoded and rendered in
+a process pool, and entries are yielded in the same order as the file.
 """
 
 from __future__ import annotations
 
 # mypy: ignore-errors
 import collections
+from collections import deque
 from io import BytesIO
 from json import loads as json_loads
 from typing import TYPE_CHECKING, cast
@@ -17,6 +21,7 @@ from typing import TYPE_CHECKING, cast
 if TYPE_CHECKING:
 	from collections import Counter
 	from collections.abc import Callable, Iterator
+	from concurrent.futures import Future
 	from io import IOBase
 	from typing import Any
 
@@ -26,6 +31,8 @@ if TYPE_CHECKING:
 
 from pyglossary.compress import (
 	compressionOpen,
+	progressFile,
+	progressFileSize,
 	stdCompressions,
 )
 from pyglossary.core import exc_note, log, pip
@@ -33,6 +40,35 @@ from pyglossary.io_utils import nullBinaryIO
 
 __all__ = ["Reader"]
 
+# number of lines sent to a worker process at once
+batchSize = 200
+
+# set in worker processes by _initWorker
+_workerReader: Reader | None = None
+
+
+def _initWorker(sourceLangName: str, options: dict[str, Any]) -> None:
+	from pyglossary.glossary_info import GlossaryInfo
+
+	global _workerReader  # noqa: PLW0603
+	glos = GlossaryInfo()
+	if sourceLangName:
+		glos.sourceLangName = sourceLangName
+	reader = Reader(glos)  # type: ignore[arg-type]
+	for name, value in options.items():
+		setattr(reader, name, value)
+	_workerReader = reader
+
+
+def _renderBatch(
+	lines: list[str],
+) -> tuple[list[tuple[list[str], str]], Counter[str]]:
+	reader = _workerReader
+	assert reader is not None
+	reader._warnings = collections.Counter()
+	entries = [reader.renderEntry(json_loads(line)) for line in lines]
+	return entries, reader._warnings
+
 
 class Reader:
 	"""Read Wiktextract glossary files."""
@@ -55,6 +91,18 @@ class Reader:
 
 	_categories: bool = False
 
+	_workers: int = 0
+
+	# options that affect renderEntry, passed to worker processes
+	_renderOptions = (
+		"_word_title",
+		"_gram_color",
+		"_example_padding",
+		"_audio",
+		"_audio_formats",
+		"_categories",
+	)
+
 	topicStyle = (
 		"color:white;"
 		"background:green;"
@@ -68,6 +116,7 @@ class Reader:
 		self._glos = glos
 		self._filename = ""
 		self._file: IOBase = nullBinaryIO
+		self._posFile: IOBase = nullBinaryIO
 		self._fileSize = 0
 		self._entryCount = 0
 		self._badExampleKeys = {
@@ -89,10 +138,8 @@ class Reader:
 		self._filename = filename
 		cfile = compressionOpen(filename, mode="rt", encoding="utf-8")
 
-		if cfile.seekable():
-			cfile.seek(0, 2)
-			self._fileSize = cfile.tell()
-			cfile.seek(0)
+		self._fileSize = progressFileSize(cfile)
+		if self._fileSize:
 			self._glos.setInfo("input_file_size", str(self._fileSize))
 		else:
 			self.warning("Wiktextract Reader: file is not seekable")
@@ -103,11 +150,14 @@ class Reader:
 			self._glos.setInfo("definition_has_headwords", "True")
 
 		self._file = cfile
+		# position in compressed file if compressed
+		self._posFile = progressFile(cfile)
 		self._warnings: Counter[str] = collections.Counter()
 
 	def close(self) -> None:
 		self._file.close()
 		self._file = nullBinaryIO
+		self._posFile = nullBinaryIO
 		self._filename = ""
 		self._fileSize = 0
 
@@ -118,21 +168,89 @@ class Reader:
 		return 0
 
 	def __iter__(self) -> Iterator[EntryType]:
-		while line := self._file.readline():
-			line = line.strip()
-			if not line:
-				continue
-			yield self.makeEntry(json_loads(line))
+		if self._workers > 0:
+			yield from self._iterParallel()
+		else:
+			while line := self._file.readline():
+				line = line.strip()
+				if not line:
+					continue
+				yield self.makeEntry(json_loads(line))
 		for msg_, count in self._warnings.most_common():
 			msg = msg_
 			if count > 1:
 				msg = f"[{count} times] {msg}"
 			log.warning(msg)
 
+	def _readBatches(self) -> Iterator[list[str]]:
+		batch: list[str] = []
+		while line := self._file.readline():
+			line = line.strip()
+			if not line:
+				continue
+			batch.append(line)
+			if len(batch) >= batchSize:
+				yield batch
+				batch = []
+		if batch:
+			yield batch
+
+	def _iterParallel(self) -> Iterator[EntryType]:
+		from concurrent.futures import ProcessPoolExecutor
+
+		workers = self._workers
+		log.info(f"Rendering entries in {workers} processes")
+		glos = self._glos
+		batches = self._readBatches()
+		maxPending = workers * 2
+		pending: deque[Future[tuple[list[tuple[list[str], str]], Counter[str]]]] = deque()
+		pool = ProcessPoolExecutor(
+			max_workers=workers,
+			initializer=_initWorker,
+			initargs=(
+				glos.sourceLangName,
+				{name: getattr(self, name) for name in self._renderOptions},
+			),
+		)
+		try:
+			while True:
+				while len(pending) < maxPending:
+					batch = next(batches, None)
+					if batch is None:
+						break
+					pending.append(pool.submit(_renderBatch, batch))
+				if not pending:
+					break
+				entries, warnings = pending.popleft().result()
+				self._warnings.update(warnings)
+				byteProgress = (self._posFile.tell(), self._fileSize)
+				for keywords, defi in entries:
+					yield glos.newEntry(
+						keywords,
+						defi,
+						defiFormat="h",
+						byteProgress=byteProgress,
+					)
+		finally:
+			pool.shutdown(wait=True, cancel_futures=True)
+
 	def warning(self, msg: str) -> None:
 		self._warnings[msg] += 1
 
-	def makeEntry(self, data: dict[str, Any]) -> EntryType:  # noqa: PLR0912
+	def makeEntry(self, data: dict[str, Any]) -> EntryType:
+		keywords, defi = self.renderEntry(data)
+		return self._glos.newEntry(
+			keywords,
+			defi,
+			defiFormat="h",
+			byteProgress=(self._posFile.tell(), self._fileSize),
+		)
+
+	def renderEntry(  # noqa: PLR0912
+		self,
+		data: dict[str, Any],
+	) -> tuple[list[str], str]:
+		"""Return (keywords, defi) of entry, defi is HTML."""
 		from lxml import etree as ET
 
 		glos = self._glos
@@ -229,13 +347,7 @@ class Reader:
 
 		defi = f.getvalue().decode("utf-8")
 		# defi = defi.replace("\xa0", "&nbsp;")  # do we need to do this?
-		file = self._file
-		return self._glos.newEntry(
-			keywords,
-			defi,
-			defiFormat="h",
-			byteProgress=(file.tell(), self._fileSize),
-		)
+		return keywords, defi
 
 	# "homophone" key found in Dutch and Arabic dictionaries
 	# (similar-sounding words for Arabic)
@@ -43,6 +43,8 @@ from lxml import etree as ET
 
 from pyglossary.compress import (
 	compressionOpen,
+	progressFile,
+	progressFileSize,
 	stdCompressions,
 )
 from pyglossary.core import log
@@ -153,9 +155,7 @@ class Reader:
 		del context
 
 		if cfile.seekable():
-			cfile.seek(0, 2)
-			self._fileSize = cfile.tell()
-			cfile.seek(0)
+			self._fileSize = progressFileSize(cfile)
 			self._glos.setInfo("input_file_size", str(self._fileSize))
 		else:
 			log.warning("XDXF Reader: file is not seekable")
@@ -193,7 +193,7 @@ class Reader:
 				terms,
 				defi,
 				defiFormat=defiFormat,
-				byteProgress=(self._file.tell(), self._fileSize),
+				byteProgress=(progressFile(self._file).tell(), self._fileSize),
 			)
 			# clean up preceding siblings to save memory
 			# this can reduce memory usage from 1 GB to ~25 MB
@@ -44,6 +44,8 @@ if TYPE_CHECKING:
 
 from pyglossary.compress import (
 	compressionOpen,
+	progressFile,
+	progressFileSize,
 	stdCompressions,
 )
 from pyglossary.core import log
@@ -147,9 +149,7 @@ class Reader:
 
 		self.readMetadata()
 
-		cfile.seek(0, 2)
-		self._fileSize = cfile.tell()
-		cfile.seek(0)
+		self._fileSize = progressFileSize(cfile)
 		self._glos.setInfo("input_file_size", str(self._fileSize))
 
 	def countResourceFiles(self) -> int:
@@ -191,7 +191,7 @@ class Reader:
 				terms,
 				defi,
 				defiFormat=defiFormat,
-				byteProgress=(self._file.tell(), self._fileSize),
+				byteProgress=(progressFile(self._file).tell(), self._fileSize),
 			)
 
 	def close(self) -> None:
@@ -19,7 +19,12 @@ if TYPE_CHECKING:
 
 from lxml import etree as ET
 
-from pyglossary.compress import compressionOpen, stdCompressions
+from pyglossary.compress import (
+	compressionOpen,
+	progressFile,
+	progressFileSize,
+	stdCompressions,
+)
 from pyglossary.core import log
 from pyglossary.io_utils import nullBinaryIO
 
@@ -55,9 +60,7 @@ class Reader:
 		)
 
 		if self._file.seekable():
-			self._file.seek(0, 2)
-			self._fileSize = self._file.tell()
-			self._file.seek(0)
+			self._fileSize = progressFileSize(self._file)
 		else:
 			log.warning("XLIFF Reader: file is not seekable")
 			self._file.close()
@@ -122,7 +125,7 @@ class Reader:
 						terms,
 						defi,
 						defiFormat="h",
-						byteProgress=(self._file.tell(), self._fileSize),
+						byteProgress=(progressFile(self._file).tell(), self._fileSize),
 					)
 
 					parent = elem.getparent()
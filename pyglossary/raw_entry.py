@@ -0,0 +1,122 @@
+"""
+Packed binary encoding of raw entries.
+
+Entry lists (``EntryList``, ``SqEntryList``, ``MergeSortEntryList``) keep
+each entry as one ``bytes`` record (``RawEntryType``) with this layout
+(all integers are little-endian uint32, except defiFormat)::
+
+	defiFormat (1 byte, 0 means default) | termCount | defiSize
+	| termSize * termCount | defi | term[0] | term[1] | ...
+
+Definition and terms are UTF-8 encoded. Unlike joining fields with a
+separator, no field needs to be escaped or split, and decoding can read
+the fields directly from a ``memoryview`` of a larger buffer.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from collections.abc import Sequence
+
+	type BufferType = bytes | bytearray | memoryview
+
+__all__ = [
+	"packRawEntry",
+	"rawEntryTerms",
+	"unpackRawEntry",
+	"unpackRawEntryBytes",
+]
+
+_headStruct = struct.Struct("<BII")
+_headSize = _headStruct.size
+_sizeStructs: dict[int, struct.Struct] = {}
+
+
+def _sizeStruct(count: int) -> struct.Struct:
+	try:
+		return _sizeStructs[count]
+	except KeyError:
+		st = _sizeStructs[count] = struct.Struct(f"<{count}I")
+		return st
+
+
+def packRawEntry(
+	defiFormat: str,
+	b_defi: bytes,
+	lb_term: Sequence[bytes],
+) -> bytes:
+	"""
+	Pack entry fields into a raw entry record.
+
+	defiFormat: one ASCII character, or empty string for default format
+	"""
+	termCount = len(lb_term)
+	return b"".join(
+		[
+			_headStruct.pack(
+				ord(defiFormat) if defiFormat else 0,
+				termCount,
+				len(b_defi),
+			),
+			_sizeStruct(termCount).pack(*[len(b_term) for b_term in lb_term]),
+			b_defi,
+			*lb_term,
+		],
+	)
+
+
+def _unpackSizes(data: BufferType) -> tuple[int, tuple[int, ...], int]:
+	formatCode, termCount, defiSize = _headStruct.unpack_from(data)
+	termSizes = _sizeStruct(termCount).unpack_from(data, _headSize)
+	return formatCode, termSizes, defiSize
+
+
+def unpackRawEntry(data: BufferType) -> tuple[str, str, list[str]]:
+	"""
+	Decode raw entry record.
+
+	Return (defiFormat, defi, terms), defiFormat is empty string for default.
+	"""
+	formatCode, termSizes, defiSize = _unpackSizes(data)
+	pos = _headSize + 4 * len(termSizes)
+	end = pos + defiSize
+	view = memoryview(data)
+	defi = str(view[pos:end], "utf-8")
+	terms: list[str] = []
+	for size in termSizes:
+		pos, end = end, end + size
+		terms.append(str(view[pos:end], "utf-8"))
+	return chr(formatCode) if formatCode else "", defi, terms
+
+
+def unpackRawEntryBytes(data: BufferType) -> tuple[str, bytes, list[bytes]]:
+	"""
+	Split raw entry record without decoding UTF-8.
+
+	Return (defiFormat, b_defi, lb_term), defiFormat is empty string for default.
+	Returned values are copies, they do not reference `data`.
+	"""
+	formatCode, termSizes, defiSize = _unpackSizes(data)
+	pos = _headSize + 4 * len(termSizes)
+	end = pos + defiSize
+	b_defi = bytes(data[pos:end])
+	lb_term: list[bytes] = []
+	for size in termSizes:
+		pos, end = end, end + size
+		lb_term.append(bytes(data[pos:end]))
+	return chr(formatCode) if formatCode else "", b_defi, lb_term
+
+
+def rawEntryTerms(data: BufferType) -> list[str]:
+	"""Decode only the terms of raw entry record."""
+	_, termSizes, defiSize = _unpackSizes(data)
+	pos = _headSize + 4 * len(termSizes) + defiSize
+	view = memoryview(data)
+	terms: list[str] = []
+	for size in termSizes:
+		terms.append(str(view[pos : pos + size], "utf-8"))
+		pos += size
+	return terms
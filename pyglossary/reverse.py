@@ -4,6 +4,10 @@ Reverse a glossary by swapping headwords and definitions.
 ``reverseGlossary`` walks entries, extracts definition text as new headwords
 (and vice versa), updates source/target language metadata, and reports progress
 through the host glossary's UI hooks.
+
+With ``matchWord`` (default), definitions are tokenized once into an inverted
+index (``ReverseIndex``) of word -> (entry, relevance) postings, instead of
+scanning all definitions for every output word.
 """
 
 from __future__ import annotations
@@ -11,7 +15,9 @@ from __future__ import annotations
 import logging
 import re
 import typing
+from array import array
 from operator import itemgetter
+from time import perf_counter as now
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -19,7 +25,7 @@ if TYPE_CHECKING:
 
 	from .glossary_types import EntryType
 
-__all__ = ["reverseGlossary"]
+__all__ = ["ReverseIndex", "reverseGlossary"]
 
 log = logging.getLogger("pyglossary")
 
@@ -77,10 +83,39 @@ def reverseGlossary(  # noqa: PLR0913
 	if saveStep < 2:
 		raise ValueError("saveStep must be more than 1")
 
-	entries: list[EntryType] = list(glos)
-	log.info(f"loaded {len(entries)} entries into memory")
+	if kwargs.get("matchWord", True) and kwargs.get("minRel", 0.0) >= 0:
+		index = ReverseIndex(
+			sepChars=kwargs.get("sepChars", ".,،"),
+			minWordLen=kwargs.get("minWordLen", 3),
+			includeDefs=includeDefs,
+		)
+		t0 = now()
+		outputWords = index.build(glos, collectOutputWords=not terms)
+		log.info(
+			f"indexed {len(index)} entries, {index.wordCount()} words"
+			f" in {now() - t0:.1f} seconds",
+		)
+		terms = list(terms) if terms else outputWords
 
-	terms = list(terms) if terms else takeOutputWords(glos, entries)
+		def search(term: str) -> list[str]:
+			return index.search(
+				term,
+				maxNum=kwargs.get("maxNum", 100),
+				minRel=kwargs.get("minRel", 0.0),
+				showRel=kwargs.get("showRel", "Percent"),
+			)
+	else:
+		entries: list[EntryType] = list(glos)
+		log.info(f"loaded {len(entries)} entries into memory")
+		terms = list(terms) if terms else takeOutputWords(glos, entries)
+
+		def search(term: str) -> list[str]:
+			return searchWordInDef(
+				entries,
+				term,
+				includeDefs=includeDefs,
+				**kwargs,
+			)
 
 	entryCount = len(terms)
 	log.info(
@@ -97,12 +132,7 @@ def reverseGlossary(  # noqa: PLR0913
 
 			if entryIndex % saveStep == 0 and entryIndex > 0:
 				saveFile.flush()
-			result = searchWordInDef(
-				entries,
-				term,
-				includeDefs=includeDefs,
-				**kwargs,
-			)
+			result = search(term)
 			if result:
 				try:
 					if includeDefs:
@@ -120,14 +150,139 @@ def reverseGlossary(  # noqa: PLR0913
 	yield entryCount
 
 
+def _wordPattern(minWordLen: int) -> re.Pattern[str]:
+	# f"[\\w]{{{minWordLen},}}" == fr"[\w]{{{minWordLen},}}"
+	#   == r"[\w]{%d,}" % minWordLen
+	return re.compile(rf"[\w]{{{minWordLen},}}", re.UNICODE)
+
+
+def _splitPattern(sepChars: str) -> re.Pattern[str]:
+	return re.compile(
+		"|".join(re.escape(x) for x in sepChars),
+		re.UNICODE,
+	)
+
+
+class ReverseIndex:
+	"""
+	Inverted index of definition words, for reverseGlossary.
+
+	Each definition is split into parts by `sepChars` and tokenized once.
+	For each word, the index keeps the entries whose definitions contain it,
+	with relevance of word in that entry: the maximum over definition parts of
+	(occurrences of word in part) / (number of words in part), which is the
+	same relevance as `searchWordInDef` with matchWord=True.
+
+	Postings are kept in arrays (in entry order), to limit memory usage.
+	"""
+
+	def __init__(
+		self,
+		sepChars: str = ".,،",
+		minWordLen: int = 3,
+		includeDefs: bool = False,
+	) -> None:
+		self._splitPattern = _splitPattern(sepChars)
+		self._wordPattern = _wordPattern(minWordLen)
+		self._includeDefs = includeDefs
+		self._entryTerms: list[list[str]] = []
+		self._entryDefis: list[str] = []
+		self._postEntries: dict[str, array[int]] = {}
+		self._postRels: dict[str, array[float]] = {}
+
+	def __len__(self) -> int:
+		return len(self._entryTerms)
+
+	def wordCount(self) -> int:
+		return len(self._postEntries)
+
+	def add(self, entry: EntryType) -> None:
+		defi = entry.defi
+		entryIndex = len(self._entryTerms)
+		self._entryTerms.append(entry.l_term)
+		if self._includeDefs:
+			self._entryDefis.append(defi)
+
+		findWords = self._wordPattern.findall
+		rels: dict[str, float] = {}
+		for part in self._splitPattern.split(defi):
+			if not part:
+				continue
+			partWords = findWords(part)
+			if not partWords:
+				continue
+			partLen = len(partWords)
+			for word in set(partWords):
+				rel = partWords.count(word) / partLen
+				if rel > rels.get(word, 0.0):
+					rels[word] = rel
+
+		postEntries = self._postEntries
+		postRels = self._postRels
+		for word, rel in rels.items():
+			try:
+				postEntries[word].append(entryIndex)
+			except KeyError:
+				postEntries[word] = array("I", [entryIndex])
+				postRels[word] = array("d", [rel])
+			else:
+				postRels[word].append(rel)
+
+	def build(
+		self,
+		glos: _GlossaryType,
+		collectOutputWords: bool = True,
+	) -> list[str]:
+		"""
+		Add all entries of `glos` to index.
+
+		If `collectOutputWords` is True, return sorted list of output words,
+		same as `takeOutputWords`, otherwise an empty list.
+		"""
+		termPattern = _wordPattern(3)
+		terms: set[str] = set()
+		for entry in glos:
+			self.add(entry)
+			if collectOutputWords:
+				terms.update(termPattern.findall(entry.defi))
+		return sorted(terms)
+
+	def search(
+		self,
+		st: str,
+		maxNum: int = 100,
+		minRel: float = 0.0,
+		showRel: str = "Percent",
+	) -> list[str]:
+		entryIndexes = self._postEntries.get(st)
+		if entryIndexes is None:
+			return []
+		entryTerms = self._entryTerms
+		entryDefis = self._entryDefis
+		includeDefs = self._includeDefs
+		outRel: list[tuple[str, float] | tuple[str, float, str]] = []
+		for entryIndex, rel in zip(entryIndexes, self._postRels[st], strict=True):
+			if rel <= minRel:
+				continue
+			if includeDefs:
+				defi = entryDefis[entryIndex]
+				outRel.extend((word, rel, defi) for word in entryTerms[entryIndex])
+			else:
+				outRel.extend((word, rel) for word in entryTerms[entryIndex])
+		return _formatResult(
+			outRel,
+			maxNum=maxNum,
+			includeDefs=includeDefs,
+			showRel=showRel,
+		)
+
+
 def takeOutputWords(
 	glos: _GlossaryType,
 	entryIter: Iterable[EntryType],
 	minWordLen: int = 3,
 ) -> list[str]:
-	# f"[\\w]{{{minWordLen},}}" == fr"[\w]{{{minWordLen},}}"
-	#   == r"[\w]{%d,}" % minWordLen
-	termPattern = re.compile(rf"[\w]{{{minWordLen},}}", re.UNICODE)
+	termPattern = _wordPattern(minWordLen)
 	terms = set()
 	progressbar, glos.progressbar = glos.progressbar, False
 	for entry in entryIter:
@@ -140,10 +295,8 @@ def takeOutputWords(
 	return sorted(terms)
 
 
-# C901 too complex (22 > 13)
-# PLR0912 Too many branches (27 > 12)
 # PLR0913 Too many arguments in function definition (9 > 5)
-def searchWordInDef(  # noqa: C901, PLR0912, PLR0913
+def searchWordInDef(  # noqa: PLR0913
 	entryIter: Iterable[EntryType],
 	st: str,
 	matchWord: bool = True,
@@ -155,11 +308,8 @@ def searchWordInDef(  # noqa: C901, PLR0912, PLR0913
 	showRel: str = "Percent",  # "Percent" | "Percent At First" | ""
 ) -> list[str]:
 	# searches word "st" in definitions of the glossary
-	splitPattern = re.compile(
-		"|".join(re.escape(x) for x in sepChars),
-		re.UNICODE,
-	)
-	wordPattern = re.compile(rf"[\w]{{{minWordLen},}}", re.UNICODE)
+	splitPattern = _splitPattern(sepChars)
+	wordPattern = _wordPattern(minWordLen)
 	outRel: list[tuple[str, float] | tuple[str, float, str]] = []
 	for entry in entryIter:
 		terms = entry.l_term
@@ -192,6 +342,20 @@ def searchWordInDef(  # noqa: C901, PLR0912, PLR0913
 				outRel.append((word, rel, defi))
 			else:
 				outRel.append((word, rel))
+	return _formatResult(
+		outRel,
+		maxNum=maxNum,
+		includeDefs=includeDefs,
+		showRel=showRel,
+	)
+
+
+def _formatResult(  # noqa: PLR0912
+	outRel: list[tuple[str, float] | tuple[str, float, str]],
+	maxNum: int,
+	includeDefs: bool,
+	showRel: str,
+) -> list[str]:
 	outRel.sort(
 		key=itemgetter(1),
 		reverse=True,
@@ -53,18 +53,29 @@ class BinMemWriter:
 		fout: BufferedIOBase,
 		compress: Callable[[bytes], bytes],
 	) -> None:
-		count = len(self)
-		fout.write(pack(U_INT, count))
-		fout.writelines(
+		head, content = self.pack()
+		self.write(fout, head, compress(content))
+
+	def pack(self) -> tuple[bytes, bytes]:
+		"""
+		Return (head, content) of bin, and clear the bin.
+
+		head is item count and content type ids, content is not compressed.
+		"""
+		head = pack(U_INT, len(self)) + b"".join(
 			pack(U_CHAR, content_type_id) for content_type_id in self.content_type_ids
 		)
 		content = b"".join(self.item_dir + self.items)
-		compressed = compress(content)
-		fout.write(pack(U_INT, len(compressed)))
-		fout.write(compressed)
 		self.content_type_ids.clear()
 		self.item_dir.clear()
 		self.items.clear()
+		return head, content
+
+	@staticmethod
+	def write(fout: BufferedIOBase, head: bytes, compressed: bytes) -> None:
+		fout.write(head)
+		fout.write(pack(U_INT, len(compressed)))
+		fout.write(compressed)
 
 
 class ItemList[T]:
@@ -5,25 +5,37 @@ SLOB dictionary file writer.
 Builds ``.slob`` archives: blob storage with optional compression (zlib, bz2,
 lzma), ICU-based collation for keys, redirect chains, and reproducible header
 metadata. Companion to ``slob._slob_obj.Slob`` reader.
+
+With ``workers > 0``, finished bins are compressed in a thread pool (zlib, bz2
+and lzma release the GIL) and written to the store in order, with at most
+``2 * workers`` bins in memory. The output is the same as without workers.
+
+Collation key of each ref is computed once when the ref is written. Refs are
+sorted by (sort key, position) in runs of ``sort_run_size``, which are written
+to temporary files when there is more than one, and merged in ``_sort``.
 """
 
 from __future__ import annotations
 
 import encodings
+import heapq
 import operator
 import os
 import pickle
 import sys
 import tempfile
 from builtins import open as fopen
+from collections import deque
 from collections.abc import Callable
 from datetime import UTC, datetime
 from os.path import isdir
-from struct import pack
+from struct import calcsize, pack, unpack
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, NamedTuple, Self, cast
 
 if TYPE_CHECKING:
+	from collections.abc import Iterator
+	from concurrent.futures import Future, ThreadPoolExecutor
 	from types import TracebackType
 
 from uuid import uuid4
@@ -41,7 +53,9 @@ from ._constants import (
 	MAX_TEXT_LEN,
 	MAX_TINY_TEXT_LEN,
 	U_CHAR,
+	U_INT,
 	U_INT_SIZE,
+	U_LONG_LONG,
 	U_LONG_LONG_SIZE,
 	UTF8,
 )
@@ -53,6 +67,25 @@ from ._types import Ref
 
 __all__ = ["Writer", "WriterEvent"]
 
+# record of a sort run file: ref position, sort key length, sort key
+_SORT_RECORD_HEAD = ">" + U_LONG_LONG[1:] + U_INT[1:]
+_SORT_RECORD_HEAD_SIZE = calcsize(_SORT_RECORD_HEAD)
+
+
+def _write_sort_run(filename: str, items: list[tuple[bytes, int]]) -> None:
+	with fopen(filename, "wb") as file:
+		file.writelines(
+			pack(_SORT_RECORD_HEAD, pos, len(key)) + key for key, pos in items
+		)
+
+
+def _read_sort_run(filename: str) -> Iterator[tuple[bytes, int]]:
+	with fopen(filename, "rb", buffering=1024 * 1024) as file:
+		read = file.read
+		while head := read(_SORT_RECORD_HEAD_SIZE):
+			pos, length = unpack(_SORT_RECORD_HEAD, head)
+			yield read(length), pos
+
 
 class WriterEvent(NamedTuple):
 	"""Writer Event."""
@@ -64,6 +97,9 @@ class WriterEvent(NamedTuple):
 class Writer:
 	"""Write SLOB dictionary files."""
 
+	# max number of ref sort keys to keep in memory
+	sort_run_size = 500_000
+
 	def __init__(  # noqa: PLR0913
 		self,
 		filename: str,
@@ -74,7 +110,9 @@ class Writer:
 		max_redirects: int = 5,
 		observer: Callable[[WriterEvent], None] | None = None,
 		version_info: bool = True,
+		workers: int = 0,
 	) -> None:
+		"""workers: number of threads for compressing bins, 0 means no thread."""
 		self.filename = filename
 		self.observer = observer
 		if os.path.exists(self.filename):
@@ -125,6 +163,23 @@ class Writer:
 
 		self.current_bin: BinMemWriter | None = None
 
+		self._sortkey = sortkey(IDENTICAL)
+		# (sort key, position) of refs, and files of sorted runs
+		self._ref_sort_keys: list[tuple[bytes, int]] = []
+		self._sort_runs: list[str] = []
+
+		# bins being compressed: (head, future of compressed content)
+		self._pending_bins: deque[tuple[bytes, Future[bytes]]] = deque()
+		self._max_pending_bins = 2 * workers
+		self._pool: ThreadPoolExecutor | None = None
+		if workers > 0 and compression:
+			from concurrent.futures import ThreadPoolExecutor
+
+			self._pool = ThreadPoolExecutor(
+				max_workers=workers,
+				thread_name_prefix="slob",
+			)
+
 		created_at = os.getenv("SLOB_TIMESTAMP") or datetime.now(UTC).isoformat()
 
 		self.blob_count = 0
@@ -246,12 +301,35 @@ class Writer:
 		current_bin = self.current_bin
 		if current_bin is None:
 			return
-		self.f_store_positions.write_long(self.f_store.tell())
-		current_bin.finalize(
-			self.f_store._file,
-			self.compress,
-		)
 		self.current_bin = None
+		if self._pool is None:
+			self.f_store_positions.write_long(self.f_store.tell())
+			current_bin.finalize(
+				self.f_store._file,
+				self.compress,
+			)
+			return
+		head, content = current_bin.pack()
+		self._pending_bins.append((head, self._pool.submit(self.compress, content)))
+		while len(self._pending_bins) > self._max_pending_bins:
+			self._write_pending_bin()
+
+	def _write_pending_bin(self) -> None:
+		head, future = self._pending_bins.popleft()
+		compressed = future.result()
+		self.f_store_positions.write_long(self.f_store.tell())
+		BinMemWriter.write(self.f_store._file, head, compressed)
+
+	def _flush_pending_bins(self) -> None:
+		while self._pending_bins:
+			self._write_pending_bin()
+
+	def _shutdown_pool(self) -> None:
+		if self._pool is None:
+			return
+		self._pool.shutdown(wait=True, cancel_futures=True)
+		self._pool = None
+		self._pending_bins.clear()
 
 	def _write_ref(
 		self,
@@ -260,27 +338,48 @@ class Writer:
 		item_index: int,
 		fragment: str = "",
 	) -> None:
-		self.f_ref_positions.write_long(self.f_refs.tell())
+		pos = self.f_refs.tell()
+		self.f_ref_positions.write_long(pos)
+		ref_sort_keys = self._ref_sort_keys
+		ref_sort_keys.append((self._sortkey(key), pos))
+		if len(ref_sort_keys) >= self.sort_run_size:
+			self._write_sort_run()
 		self.f_refs.write_text(key)
 		self.f_refs.write_int(bin_index)
 		self.f_refs.write_short(item_index)
 		self.f_refs.write_tiny_text(fragment)
 		self.ref_count += 1
 
+	def _write_sort_run(self) -> None:
+		ref_sort_keys = self._ref_sort_keys
+		ref_sort_keys.sort()
+		filename = os.path.join(self.tmpdir.name, f"sort-run-{len(self._sort_runs)}")
+		_write_sort_run(filename, ref_sort_keys)
+		self._sort_runs.append(filename)
+		ref_sort_keys.clear()
+
+	def _iter_sorted_refs(self) -> Iterator[tuple[bytes, int]]:
+		"""
+		Return iterator of (sort key, position) of all written refs, sorted.
+
+		Keys are not consumed, so this can be called again after writing
+		more refs (as _resolve_aliases does).
+		"""
+		if not self._sort_runs:
+			self._ref_sort_keys.sort()
+			return iter(self._ref_sort_keys)
+		if self._ref_sort_keys:
+			self._write_sort_run()
+		return heapq.merge(*[_read_sort_run(name) for name in self._sort_runs])
+
 	def _sort(self) -> None:
 		self._fire_event("begin_sort")
 		f_ref_positions_sorted = self._wbfopen("ref-positions-sorted")
 		self.f_refs.flush()
 		self.f_ref_positions.close()
-		with MultiFileReader(self.f_ref_positions.name, self.f_refs.name) as f:
-			ref_list = RefList(f, self.encoding, count=self.ref_count)
-			sortkey_func = sortkey(IDENTICAL)
-			for i in sorted(
-				range(len(ref_list)),
-				key=lambda j: sortkey_func(ref_list[j].key),
-			):
-				ref_pos = ref_list.pos(i)
-				f_ref_positions_sorted.write_long(ref_pos)
+		write = f_ref_positions_sorted._file.write
+		for _, ref_pos in self._iter_sorted_refs():
+			write(pack(U_LONG_LONG, ref_pos))
 		f_ref_positions_sorted.close()
 		os.remove(self.f_ref_positions.name)
 		os.rename(f_ref_positions_sorted.name, self.f_ref_positions.name)
@@ -383,10 +482,13 @@ class Writer:
 		self._fire_event("begin_finalize")
 		if self.current_bin is not None:
 			self._write_current_bin()
+		self._flush_pending_bins()
+		self._shutdown_pool()
 
 		self._sort()
 		if self.max_redirects:
 			self._resolve_aliases()
+		self._ref_sort_keys = []
 
 		files = (
 			self.f_ref_positions,
@@ -475,6 +577,8 @@ class Writer:
 		# Use tell(), not os.stat().st_size: buffered writers (esp. Python 3.14+
 		# DEFAULT_BUFFER_SIZE 128KiB) may not have flushed to the file yet, so stat
 		# understates size
+		# bins being compressed are written first, to get the exact size
+		self._flush_pending_bins()
 		files = (
 			self.f_ref_positions,
 			self.f_refs,
@@ -487,6 +591,7 @@ class Writer:
 		return self
 
 	def close(self) -> None:
+		self._shutdown_pool()
 		for file in (
 			self.f_ref_positions,
 			self.f_refs,
@@ -807,5 +807,69 @@ class TestBinItemNumberLimit(BaseTest):
 		writer.finalize()
 
 
+class TestWorkers(BaseTest):
+	"""Tests for compressing bins in threads."""
+
+	def setUp(self):
+		BaseTest.setUp(self)
+		self.data = [
+			(f"key{i}", MIME_TEXT, f"Hello {i} " * (i % 17 + 1)) for i in range(500)
+		]
+
+	def write(self, path: str, compression: str, workers: int) -> Writer:
+		writer = self.create(
+			path,
+			compression=compression,
+			min_bin_size=256,
+			version_info=False,
+			workers=workers,
+		)
+		for key, content_type, value in self.data:
+			writer.add(value.encode("ascii"), key, content_type=content_type)
+		writer.finalize()
+		return writer
+
+	def test_same_content(self):
+		for compression in ("zlib", "bz2", "lzma2"):
+			items = []
+			for workers in (0, 2):
+				path = os.path.join(
+					self.tmpdir.name,
+					f"test-{compression}-{workers}.slob",
+				)
+				writer = self.write(path, compression, workers)
+				with Slob(path) as r:
+					items.append(
+						(
+							writer.bin_count,
+							[(item.key, item.content) for item in r],
+						),
+					)
+			self.assertGreater(items[0][0], 10)
+			self.assertEqual(items[0], items[1], msg=f"{compression=}")
+
+
+class TestSortRuns(BaseTest):
+	"""Tests for sorting refs in runs written to temporary files."""
+
+	def test_same_order(self):
+		rnd = random.Random(1)
+		keys = ["".join(rnd.choice("abcABC-é ") for _ in range(6)) for _ in range(300)]
+		results = []
+		for sort_run_size in (Writer.sort_run_size, 7):
+			path = os.path.join(self.tmpdir.name, f"test-{sort_run_size}.slob")
+			writer = self.create(path, version_info=False)
+			writer.sort_run_size = sort_run_size
+			for i, key in enumerate(keys):
+				writer.add(str(i).encode("ascii"), key)
+				if i % 5 == 0:
+					writer.add_alias(key + "!", key)
+			writer.finalize()
+			with Slob(path) as r:
+				results.append([(item.key, item.content) for item in r])
+		self.assertEqual(len(results[0]), 360)
+		self.assertEqual(results[0], results[1])
+
+
 if __name__ == "__main__":
 	unittest.main()
@@ -44,9 +44,21 @@ __all__ = ["SqEntryList"]
 log = logging.getLogger("pyglossary")
 
 
+# pragmas for temporary databases that are thrown away after conversion,
+# so there is no need for journaling or syncing to disk
+tmpDatabasePragmas = (
+	"PRAGMA journal_mode=OFF",
+	"PRAGMA synchronous=OFF",
+	"PRAGMA temp_store=MEMORY",
+)
+
+
 class SqEntryList:
 	"""SQLite-backed collection of glossary entries."""
 
+	# number of buffered rows inserted at once with executemany
+	appendBatchSize = 1000
+
 	def __init__(  # noqa: PLR0913
 		self,
 		entryToRaw: Callable[[EntryType], RawEntryType],
@@ -60,6 +72,8 @@ class SqEntryList:
 		self._entryToRaw = entryToRaw
 		self._entryFromRaw = entryFromRaw
 		self._database = database
+		self._insertQuery = ""
+		self._buffer: list[list[Any]] = []
 
 		self._con: sqlite3.Connection | None = sqlite3.connect(database)
 		self._cur: sqlite3.Cursor | None = self._con.cursor()
@@ -75,6 +89,10 @@ class SqEntryList:
 		self._sqliteSortKey: SQLiteSortKeyType = []
 		self._columnNames = ""
 
+		if create:
+			for pragma in tmpDatabasePragmas:
+				self._con.execute(pragma)
+
 	def hasSortKey(self) -> bool:
 		return bool(self._sqliteSortKey)
 
@@ -104,6 +122,10 @@ class SqEntryList:
 
 		self._sqliteSortKey = sqliteSortKey
 		self._columnNames = ",".join(col[0] for col in sqliteSortKey)
+		self._insertQuery = (
+			f"insert into data({self._columnNames}, data)"
+			f" values (?{', ?' * len(sqliteSortKey)})"
+		)
 
 		if not self._create:
 			self._parseExistingIndex()
@@ -119,26 +141,31 @@ class SqEntryList:
 	def __len__(self) -> int:
 		return self._len
 
-	def _encode(self, entry: EntryType) -> bytes:
-		return b"\x00".join(self._entryToRaw(entry))
-
-	def _decode(self, data: bytes) -> EntryType:
-		return self._entryFromRaw(data.split(b"\x00"))
-
 	def append(self, entry: EntryType) -> None:
-		self._cur.execute(  # type: ignore
-			f"insert into data({self._columnNames}, data)"
-			f" values (?{', ?' * len(self._sqliteSortKey)})",
-			[col[2](entry.l_term) for col in self._sqliteSortKey] + [self._encode(entry)],
+		l_term = entry.l_term
+		self._buffer.append(
+			[col[2](l_term) for col in self._sqliteSortKey] + [self._entryToRaw(entry)],
 		)
 		self._len += 1
+		if len(self._buffer) >= self.appendBatchSize:
+			self._flush()
+
+	def _flush(self) -> None:
+		if not self._buffer:
+			return
+		if self._cur is None:
+			raise Error("SQLite cursor is closed")
+		self._cur.executemany(self._insertQuery, self._buffer)
+		self._buffer = []
 
 	def __iter__(self) -> Iterator[EntryType]:
 		if self._cur is None:
 			raise Error("SQLite cursor is closed")
+		self._flush()
 		self._cur.execute(f"SELECT data FROM data ORDER BY {self._orderBy}")
+		entryFromRaw = self._entryFromRaw
 		for row in self._cur:
-			yield self._decode(row[0])
+			yield entryFromRaw(row[0])
 
 	def __iadd__(self, other: Iterable[EntryType]) -> Self:
 		for item in other:
@@ -158,6 +185,7 @@ class SqEntryList:
 		if reverse:
 			self._orderBy = ",".join(f"{col[0]} DESC" for col in self._sqliteSortKey)
 		assert self._con
+		self._flush()
 		self._con.commit()
 		self._con.execute(
 			f"CREATE INDEX sortkey ON data({sortColumnNames});",
@@ -192,6 +220,7 @@ class SqEntryList:
 	def close(self) -> None:
 		if self._con is None or self._cur is None:
 			return
+		self._flush()
 		self._con.commit()
 		self._cur.close()
 		self._con.close()
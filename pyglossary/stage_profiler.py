@@ -0,0 +1,262 @@
+"""
+Per-stage timing and optional profiling of glossary conversion.
+
+``StageProfiler`` is created by ``GlossaryCommon`` when profiling is enabled
+(``Glossary.enableProfiling()``, or ``profile_report`` config parameter),
+and records cumulative time and number of calls of each stage of conversion.
+Stage names are ``kind`` or ``kind:name``:
+
+	read.open:FORMAT    opening input (``reader.open``)
+	read:FORMAT         iterating over reader, which is parsing the input
+	filter:CLASS        running each entry filter
+	store               storing entries in memory or SQLite (indirect mode)
+	sort                sorting entries
+	fetch               getting stored entries back for writing
+	write.open:FORMAT   ``writer.open``
+	write:FORMAT        writer generator steps, writing each entry
+	finish:FORMAT       ``writer.finish``, flushing and closing output
+	convert             rest of ``convert``, not covered by other stages
+
+Time of each stage excludes time of stages that run inside it, so times
+add up to total running time.
+
+cProfile and tracemalloc can be enabled for selected stages, given as
+stage kind (like ``read``) or full stage name (like ``filter:StripWhitespaces``).
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from time import perf_counter as now
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+	import cProfile
+	from collections.abc import Callable, Iterable, Iterator
+
+__all__ = ["StageProfiler"]
+
+
+class StageProfiler:
+	"""Record time and number of calls of each conversion stage."""
+
+	# max number of functions in cProfile result of each stage
+	cprofileLimit = 30
+
+	def __init__(
+		self,
+		cprofile: Iterable[str] = (),
+		tracemalloc: Iterable[str] = (),
+	) -> None:
+		self._t0 = now()
+		self._seconds: dict[str, float] = {}
+		self._calls: dict[str, int] = {}
+		# time spent in nested stages of the current stage
+		self._inner = 0.0
+
+		self._cprofileSpecs = set(cprofile)
+		self._tracemallocSpecs = set(tracemalloc)
+		self._hooked: dict[str, bool] = {}
+		self._profiles: dict[str, cProfile.Profile] = {}
+		self._profileActive = False
+		self._memNet: dict[str, int] = {}
+		self._memPeak: dict[str, int] = {}
+		self._tracemallocStarted = False
+		if self._tracemallocSpecs:
+			import tracemalloc as tm
+
+			if not tm.is_tracing():
+				tm.start()
+				self._tracemallocStarted = True
+
+	@staticmethod
+	def _matches(stage: str, specs: set[str]) -> bool:
+		return stage in specs or stage.partition(":")[0] in specs
+
+	def _isHooked(self, stage: str) -> bool:
+		"""Return True if stage needs cProfile or tracemalloc."""
+		hooked = self._hooked.get(stage)
+		if hooked is None:
+			hooked = self._hooked[stage] = self._matches(
+				stage,
+				self._cprofileSpecs,
+			) or self._matches(stage, self._tracemallocSpecs)
+		return hooked
+
+	def _add(self, stage: str, elapsed: float) -> None:
+		try:
+			self._seconds[stage] += elapsed
+			self._calls[stage] += 1
+		except KeyError:
+			self._seconds[stage] = elapsed
+			self._calls[stage] = 1
+
+	def _begin(self, stage: str) -> tuple[float, float, Any, int]:
+		profile = None
+		if not self._profileActive and self._matches(stage, self._cprofileSpecs):
+			profile = self._profiles.get(stage)
+			if profile is None:
+				import cProfile
+
+				profile = self._profiles[stage] = cProfile.Profile()
+		mem0 = -1
+		if self._matches(stage, self._tracemallocSpecs):
+			import tracemalloc as tm
+
+			mem0 = tm.get_traced_memory()[0]
+			tm.reset_peak()
+
+		inner = self._inner
+		self._inner = 0.0
+		if profile is not None:
+			self._profileActive = True
+			profile.enable()
+		return now(), inner, profile, mem0
+
+	def _end(self, stage: str, state: tuple[float, float, Any, int]) -> None:
+		t0, inner, profile, mem0 = state
+		if profile is not None:
+			profile.disable()
+			self._profileActive = False
+		elapsed = now() - t0
+		self._add(stage, elapsed - self._inner)
+		self._inner = inner + elapsed
+		if mem0 >= 0:
+			import tracemalloc as tm
+
+			mem, peak = tm.get_traced_memory()
+			self._memNet[stage] = self._memNet.get(stage, 0) + mem - mem0
+			self._memPeak[stage] = max(self._memPeak.get(stage, 0), peak - mem0)
+
+	def _call(
+		self,
+		stage: str,
+		func: Callable[..., Any],
+		*args: Any,
+	) -> Any:
+		if self._isHooked(stage):
+			state = self._begin(stage)
+			try:
+				return func(*args)
+			finally:
+				self._end(stage, state)
+		# same as _begin and _end, without cProfile and tracemalloc
+		inner = self._inner
+		self._inner = 0.0
+		t0 = now()
+		try:
+			return func(*args)
+		finally:
+			elapsed = now() - t0
+			self._add(stage, elapsed - self._inner)
+			self._inner = inner + elapsed
+
+	@contextmanager
+	def stage(self, stage: str) -> Iterator[None]:
+		"""Record the time of `with` block as one call of stage."""
+		state = self._begin(stage)
+		try:
+			yield
+		finally:
+			self._end(stage, state)
+
+	def wrap(
+		self,
+		stage: str,
+		func: Callable[..., Any],
+	) -> Callable[..., Any]:
+		"""Return a function that calls `func` as one call of stage."""
+		call = self._call
+
+		def wrapper(*args: Any) -> Any:
+			return call(stage, func, *args)
+
+		return wrapper
+
+	def iterate(
+		self,
+		stage: str,
+		iterable: Iterable[Any],
+	) -> Iterator[Any]:
+		"""Iterate over `iterable`, getting each item is one call of stage."""
+		call = self._call
+		iterator = iter(iterable)
+		sentinel = object()
+		while True:
+			item = call(stage, next, iterator, sentinel)
+			if item is sentinel:
+				return
+			yield item
+
+	@property
+	def elapsed(self) -> float:
+		"""Time since profiler was created, in seconds."""
+		return now() - self._t0
+
+	def stageSeconds(self) -> dict[str, float]:
+		return dict(self._seconds)
+
+	def _cprofileReport(self, profile: cProfile.Profile) -> list[dict[str, Any]]:
+		import pstats
+
+		stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+		items = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)
+		result = []
+		for (filename, lineno, funcName), (_, ncalls, tottime, cumtime, _) in items[
+			: self.cprofileLimit
+		]:
+			result.append(
+				{
+					"function": f"{filename}:{lineno}({funcName})",
+					"ncalls": ncalls,
+					"tottime": round(tottime, 6),
+					"cumtime": round(cumtime, 6),
+				},
+			)
+		return result
+
+	def report(self) -> dict[str, Any]:
+		"""Return report as a JSON-serializable dict."""
+		report: dict[str, Any] = {
+			"elapsed": round(self.elapsed, 6),
+			"stages": {
+				stage: {
+					"seconds": round(seconds, 6),
+					"calls": self._calls[stage],
+				}
+				for stage, seconds in self._seconds.items()
+			},
+		}
+		if self._profiles:
+			report["cprofile"] = {
+				stage: self._cprofileReport(profile)
+				for stage, profile in self._profiles.items()
+			}
+		if self._memPeak:
+			report["tracemalloc"] = {
+				stage: {
+					"netBytes": self._memNet[stage],
+					"peakBytes": self._memPeak[stage],
+				}
+				for stage in self._memPeak
+			}
+		return report
+
+	def saveReport(self, filename: str) -> None:
+		with open(filename, mode="w", encoding="utf-8") as file:
+			json.dump(self.report(), file, indent="\t")
+			file.write("\n")
+
+	def summary(self, count: int = 10) -> str:
+		"""Return slowest stages as a human-readable string."""
+		items = sorted(self._seconds.items(), key=lambda item: item[1], reverse=True)
+		return ", ".join(f"{stage}: {seconds:.2f}s" for stage, seconds in items[:count])
+
+	def close(self) -> None:
+		"""Stop tracemalloc if it was started by this profiler."""
+		if self._tracemallocStarted:
+			import tracemalloc as tm
+
+			tm.stop()
+			self._tracemallocStarted = False
@@ -11,10 +11,11 @@ from __future__ import annotations
 from os.path import splitext
 from typing import TYPE_CHECKING
 
-from pyglossary.entry import DataEntry, Entry
+from pyglossary.entry import DataEntry, LazyEntry
 from pyglossary.glossary_v2 import Glossary
 from pyglossary.os_utils import runDictzip
 from pyglossary.plugins.stardict import Writer
+from pyglossary.raw_entry import packRawEntry, unpackRawEntryBytes
 from pyglossary.sort_keys import lookupSortKey
 from pyglossary.sq_entry_list import SqEntryList
 
@@ -33,12 +34,14 @@ class StarDictCreator:
 		tmpDbFile: str,
 		defiFormat: str = "h",
 		info: dict[str, str] | None = None,
+		dictzip: bool = False,
 	) -> None:
+		"""dictzip: write .dict.dz, compressing while writing."""
 		self._filename = filename
 		self._defiFormat = defiFormat
-		self._defiFormatB = defiFormat.encode("ascii")
 		glos = self._glos = Glossary(info=info)
 		w = self._writer = Writer(glos)
+		w._dictzip = dictzip
 
 		# w._sametypesequence = "h" # generally not needed
 
@@ -61,23 +64,19 @@ class StarDictCreator:
 		entryList.sort()
 
 	def entryToRaw(self, entry: EntryType) -> RawEntryType:
-		return [self._defiFormatB, entry.b_defi] + entry.lb_term
+		return packRawEntry(self._defiFormat, entry.b_defi, entry.lb_term)
 
 	def entryFromRaw(self, rawEntry: RawEntryType) -> EntryType:
-		defiFormat = rawEntry[0].decode("ascii") or self._defiFormat
-		defi = rawEntry[1].decode("utf-8")
+		defiFormat, b_defi, lb_term = unpackRawEntryBytes(rawEntry)
+		defiFormat = defiFormat or self._defiFormat
 
 		if defiFormat == "b":
-			fname = rawEntry[2].decode("utf-8")
-			if isinstance(fname, list):
-				fname = fname[0]
-			return DataEntry(fname, tmpPath=defi)
-
-		return Entry(
-			[b.decode("utf-8") for b in rawEntry[2:]],
-			defi,
-			defiFormat=defiFormat,
-		)
+			return DataEntry(
+				lb_term[0].decode("utf-8"),
+				tmpPath=b_defi.decode("utf-8"),
+			)
+
+		return LazyEntry(lb_term, b_defi, defiFormat=defiFormat)
 
 	def addEntry(self, terms: list[str], defi: str) -> None:
 		self._entryList.append(self._glos.newEntry(terms, defi))
@@ -95,7 +94,11 @@ class StarDictCreator:
 			pass
 
 	def finish(self, dictzip: bool = False) -> None:
+		"""
+		dictzip: compress .dict file after writing, prefer passing
+			dictzip=True to constructor to compress while writing.
+		"""
 		self._writer.finish()
 		outPathNoExt, _ = splitext(self._filename)
-		if dictzip:
+		if dictzip and not self._writer._dictzip:
 			runDictzip(f"{outPathNoExt}.dict")
@@ -3,7 +3,8 @@ Generic text-file glossary reader.
 
 ``TextGlossaryReader`` parses tab-separated dictionary files (optionally
 compressed), yields ``Entry`` objects, and can walk companion resource
-directories. ``TextFilePosWrapper`` tracks byte offsets for progress reporting.
+directories. ``TextFilePosWrapper`` tracks byte offsets for progress reporting
+(offsets in the compressed file, for compressed files).
 
 This module is used in plugins.
 """
@@ -17,7 +18,9 @@ from os.path import isdir, isfile, join, splitext
 from typing import TYPE_CHECKING, cast
 
 from .compress import (
+	compressedRawFile,
 	compressionOpen,
+	progressFileSize,
 	stdCompressions,
 )
 from .entry import DataEntry
@@ -50,11 +53,18 @@ type nextBlockResultType = (
 
 
 class TextFilePosWrapper(io.TextIOBase):
-	"""Text File Pos Wrapper."""
+	"""
+	Text File Pos Wrapper.
+
+	tell() returns the number of bytes read so far, or the position in
+	compressed file if fileobj was opened by compressionOpen and is
+	compressed, to be used with size given by progressFileSize.
+	"""
 
 	def __init__(self, fileobj: io.TextIOBase, encoding: str) -> None:
 		self.fileobj = fileobj
 		self._encoding = encoding
+		self._rawFile = compressedRawFile(fileobj)
 		self.pos = 0
 
 	def __iter__(self) -> Iterator[str]:  # type: ignore
@@ -65,10 +75,13 @@ class TextFilePosWrapper(io.TextIOBase):
 
 	def __next__(self) -> str:  # type: ignore
 		line = self.fileobj.__next__()
-		self.pos += len(line.encode(self._encoding))
+		if self._rawFile is None:
+			self.pos += len(line.encode(self._encoding))
 		return line
 
 	def tell(self) -> int:
+		if self._rawFile is not None:
+			return self._rawFile.tell()
 		return self.pos
 
 
@@ -137,9 +150,7 @@ class TextGlossaryReader:
 	def _calcFilzeSize(self, cfile: io.TextIOBase, filename: str) -> None:
 		if cfile.seekable():
 			log.info("Calculating file size")
-			cfile.seek(0, 2)
-			self._fileSize = cfile.tell()
-			cfile.seek(0)
+			self._fileSize = progressFileSize(cfile)
 			log.debug(f"File size of {filename}: {self._fileSize}")
 			self._glos.setInfo("input_file_size", str(self._fileSize))
 		else:
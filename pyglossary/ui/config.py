@@ -78,6 +78,42 @@ configDefDict: dict[str, Option] = {
 			"mode is not possible. Can override with --no-sqlite"
 		),
 	),
+	"external_sort": BoolOption(
+		hasFlag=True,
+		comment=(
+			"Use external merge sort (temporary files) instead of\n"
+			"SQLite when sorting in --sqlite mode"
+		),
+		falseComment="Use SQLite when sorting in --sqlite mode",
+	),
+	"external_sort_ram": IntOption(
+		hasFlag=True,
+		comment="Max RAM (in MiB) used for in-memory runs of external sort",
+		minim=1,
+	),
+	"filter_workers": IntOption(
+		hasFlag=True,
+		comment=(
+			"Number of worker processes for running entry filters\n"
+			"(stateless filters only), 0 means no worker process"
+		),
+		minim=0,
+	),
+	"profile_report": StrOption(
+		hasFlag=True,
+		comment=(
+			"Record time of each stage of conversion,\n"
+			"and save the report as JSON into this file"
+		),
+	),
+	"profile_cprofile": StrOption(
+		hasFlag=True,
+		comment="Comma-separated conversion stages to run cProfile on",
+	),
+	"profile_tracemalloc": StrOption(
+		hasFlag=True,
+		comment="Comma-separated conversion stages to measure memory allocations of",
+	),
 	"enable_alts": BoolOption(
 		hasFlag=True,
 		customFlag="alts",
@@ -36,6 +36,16 @@ def registerConfigOption(
 	if not flag:
 		flag = key.replace("_", "-")
 
+	if option.typ == "int":
+		parser.add_argument(
+			f"--{flag}",
+			dest=key,
+			type=int,
+			default=None,
+			help=option.comment,
+		)
+		return
+
 	if option.typ != "bool":
 		parser.add_argument(
 			f"--{flag}",
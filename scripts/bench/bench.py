@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+"""
+Benchmark end-to-end conversions on synthetic glossaries.
+
+A synthetic glossary is generated (once per set of parameters, cached in the
+work directory) in every input format, then each conversion runs in a fresh
+subprocess, which reports the time spent in each stage, number of entries per
+second, peak RSS, peak temporary disk usage and output size.
+
+Stages (sums of pyglossary.stage_profiler stages, which are also reported
+under "profile" key of each result):
+	read: iterating over the reader (parsing input format)
+	filter: entry filters
+	load: opening input, storing entries in indirect/SQLite mode
+	sort: sorting entries (with --sort)
+	write: writing output (including getting entries back in indirect mode)
+	other: the rest of conversion, like detecting formats and compression
+
+Use `--config profile_cprofile=read` (or other stages) to get cProfile
+results too.
+
+Examples:
+	scripts/bench/bench.py -n 50000 -o new.json
+	scripts/bench/bench.py --pair Tabfile:Stardict --pair Stardict:Tabfile --sort
+	scripts/bench/bench.py --compare old.json new.json --max-slowdown 1.2
+
+By default, every input format is converted to Tabfile, and Tabfile is
+converted to every output format.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from os.path import abspath, dirname, getsize, isdir, isfile, join
+from time import perf_counter
+from typing import Any
+
+from synth import SynthParams, generateInput, readOnlyFormats
+
+rootDir = dirname(dirname(dirname(abspath(__file__))))
+sys.path.insert(0, rootDir)
+
+defaultReadFormats = [
+	"Tabfile",
+	"Stardict",
+	"Aard2Slob",
+	"ABBYYLingvoDSL",
+	"Xdxf",
+	"FreeDict",
+	"OctopusMdict",
+	"Yomichan",
+]
+defaultWriteFormats = [
+	"Tabfile",
+	"Stardict",
+	"Aard2Slob",
+	"Json",
+	"Sql",
+	"Yomichan",
+]
+
+stageNames = ("read", "filter", "load", "sort", "write", "other")
+
+# StageProfiler stage kind -> bench stage
+stageKinds = {
+	"read": "read",
+	"filter": "filter",
+	"read.open": "load",
+	"store": "load",
+	"sort": "sort",
+	"fetch": "write",
+	"write.open": "write",
+	"write": "write",
+	"finish": "write",
+}
+
+
+def dirSize(path: str) -> int:
+	if isfile(path):
+		return getsize(path)
+	total = 0
+	for parent, _, files in os.walk(path):
+		for fname in files:
+			try:
+				total += getsize(join(parent, fname))
+			except OSError:  # noqa: PERF203
+				pass
+	return total
+
+
+def formatFileName(formatName: str, baseDir: str) -> str:
+	"""Return path of glossary file in `baseDir` for given format."""
+	if formatName in readOnlyFormats:
+		return join(baseDir, "bench" + readOnlyFormats[formatName][0])
+	from pyglossary.glossary_v2 import Glossary
+
+	plugin = Glossary.plugins[formatName]
+	ext = plugin.extensions[0] if plugin.extensions else ""
+	if not plugin.singleFile:
+		baseDir = join(baseDir, "bench")
+	return join(baseDir, "bench" + ext)
+
+
+# ______________________________ child process _______________________________
+
+
+def splitStages(value: str) -> list[str]:
+	return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def aggregateStages(stageSeconds: dict[str, float]) -> dict[str, float]:
+	"""Sum StageProfiler stage times into bench stages."""
+	times = dict.fromkeys(stageNames, 0.0)
+	for stage, seconds in stageSeconds.items():
+		times[stageKinds.get(stage.partition(":")[0], "other")] += seconds
+	return {name: round(value, 4) for name, value in times.items()}
+
+
+def writtenEntryCount(stageCalls: dict[str, int]) -> int:
+	"""
+	Return number of written entries from number of writer generator steps.
+
+	Writer generator is sent None once before and once after the entries.
+	"""
+	counts = [
+		calls
+		for stage, calls in stageCalls.items()
+		if stage.startswith("write:") and stage != "write:info_writer"
+	]
+	if not counts:
+		return 0
+	return max(0, max(counts) - 2)
+
+
+class DiskSampler(threading.Thread):
+	"""Sample total size of a directory, and keep the maximum."""
+
+	def __init__(self, path: str, interval: float = 0.1) -> None:
+		threading.Thread.__init__(self, daemon=True)
+		self.path = path
+		self.interval = interval
+		self.peak = 0
+		self._stopEvent = threading.Event()
+
+	def run(self) -> None:
+		while not self._stopEvent.is_set():
+			self.peak = max(self.peak, dirSize(self.path))
+			self._stopEvent.wait(self.interval)
+
+	def stop(self) -> None:
+		self._stopEvent.set()
+		self.join()
+		self.peak = max(self.peak, dirSize(self.path))
+
+
+def maxRssMiB() -> float | None:
+	try:
+		import resource
+	except ImportError:
+		return None
+	maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	if sys.platform == "darwin":
+		return round(maxrss / 1024**2, 1)
+	return round(maxrss / 1024, 1)
+
+
+def loadConfig(overrides: dict[str, Any]) -> dict[str, Any]:
+	from pyglossary.core import rootConfJsonFile
+	from pyglossary.ui.config import configDefDict
+
+	with open(rootConfJsonFile, encoding="utf-8") as file:
+		data = json.load(file)
+	config = {key: value for key, value in data.items() if key in configDefDict}
+	config.update(overrides)
+	return config
+
+
+def runCase(spec: dict[str, Any]) -> dict[str, Any]:
+	from pyglossary.core import log
+	from pyglossary.glossary_v2 import ConvertArgs, Glossary
+
+	log.setVerbosity(spec["verbosity"])
+	Glossary.init()
+
+	config = loadConfig(spec["config"])
+	glos = Glossary()
+	glos.config = config
+	profiler = glos.enableProfiling(
+		cprofile=splitStages(config.get("profile_cprofile", "")),
+		tracemalloc=splitStages(config.get("profile_tracemalloc", "")),
+	)
+
+	sampler = DiskSampler(spec["scratchDir"])
+	sampler.start()
+	t0 = perf_counter()
+	try:
+		glos.convert(
+			ConvertArgs(
+				inputFilename=spec["inputFilename"],
+				inputFormat=spec["inputFormat"],
+				outputFilename=spec["outputFilename"],
+				outputFormat=spec["outputFormat"],
+				direct=spec["direct"],
+				sort=spec["sort"],
+				sqlite=spec["sqlite"],
+			),
+		)
+	finally:
+		total = perf_counter() - t0
+		sampler.stop()
+
+	report = profiler.report()
+	entryCount = writtenEntryCount(
+		{stage: item["calls"] for stage, item in report["stages"].items()},
+	)
+	result = {
+		"entries": entryCount,
+		"total": round(total, 4),
+		"stages": aggregateStages(profiler.stageSeconds()),
+		"profile": report["stages"],
+		"entriesPerSec": round(entryCount / total, 1) if total else None,
+		"maxRssMiB": maxRssMiB(),
+		"tempPeakBytes": sampler.peak,
+		"outputBytes": dirSize(dirname(spec["outputFilename"])),
+	}
+	for key in ("cprofile", "tracemalloc"):
+		if key in report:
+			result[key] = report[key]
+	return result
+
+
+def childMain(specPath: str) -> None:
+	from pyglossary.core import log
+
+	with open(specPath, encoding="utf-8") as file:
+		spec = json.load(file)
+	try:
+		result = runCase(spec)
+	except Exception as e:
+		if spec["verbosity"] >= 3:  # noqa: PLR2004
+			log.exception("")
+		result = {"error": f"{type(e).__name__}: {e}"}
+	with open(spec["resultPath"], "w", encoding="utf-8") as file:
+		json.dump(result, file)
+
+
+# ______________________________ parent process ______________________________
+
+
+def gitCommit() -> str | None:
+	try:
+		commit = subprocess.check_output(
+			["git", "-C", rootDir, "rev-parse", "--short", "HEAD"],
+			stderr=subprocess.DEVNULL,
+			text=True,
+		).strip()
+		dirty = subprocess.check_output(
+			["git", "-C", rootDir, "status", "--porcelain", "--untracked-files=no"],
+			stderr=subprocess.DEVNULL,
+			text=True,
+		).strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+	return commit + ("-dirty" if dirty else "")
+
+
+def prepareInput(
+	params: SynthParams,
+	formatName: str,
+	inputsDir: str,
+) -> str:
+	baseDir = join(inputsDir, params.key(), formatName)
+	path = formatFileName(formatName, baseDir)
+	doneMark = join(baseDir, ".done")
+	if isfile(doneMark):
+		return path
+	if isdir(baseDir):
+		shutil.rmtree(baseDir)
+	print(f"Generating {formatName} input: {path}", file=sys.stderr)
+	generateInput(params, formatName, path)
+	with open(doneMark, "w", encoding="utf-8"):
+		pass
+	return path
+
+
+def runPair(  # noqa: PLR0913
+	args: argparse.Namespace,
+	params: SynthParams,
+	inputFormat: str,
+	outputFormat: str,
+	workDir: str,
+	config: dict[str, Any],
+) -> dict[str, Any]:
+	result: dict[str, Any] = {
+		"input": inputFormat,
+		"output": outputFormat,
+	}
+	try:
+		inputFilename = prepareInput(params, inputFormat, join(workDir, "inputs"))
+	except Exception as e:
+		result["error"] = f"generating input failed: {e}"
+		return result
+	result["inputBytes"] = dirSize(dirname(inputFilename))
+
+	caseDir = tempfile.mkdtemp(
+		prefix=f"{inputFormat}-{outputFormat}-",
+		dir=join(workDir, "cases"),
+	)
+	scratchDir = join(caseDir, "scratch")
+	homeDir = join(scratchDir, "home")
+	tmpDir = join(scratchDir, "tmp")
+	os.makedirs(homeDir)
+	os.makedirs(tmpDir)
+	spec = {
+		"inputFilename": inputFilename,
+		"inputFormat": inputFormat,
+		"outputFilename": formatFileName(outputFormat, join(caseDir, "out")),
+		"outputFormat": outputFormat,
+		"direct": args.direct,
+		"sort": args.sort,
+		"sqlite": args.sqlite,
+		"config": config,
+		"scratchDir": scratchDir,
+		"resultPath": join(caseDir, "result.json"),
+		"verbosity": args.verbosity,
+	}
+	os.makedirs(dirname(spec["outputFilename"]), exist_ok=True)
+	specPath = join(caseDir, "spec.json")
+	with open(specPath, "w", encoding="utf-8") as file:
+		json.dump(spec, file)
+
+	# cache dir and temp files of child go to scratchDir, to measure
+	# temp disk usage and to not depend on user config and plugins
+	env = dict(os.environ)
+	env["HOME"] = homeDir
+	env["TMPDIR"] = tmpDir
+	env["TEMP"] = tmpDir
+	env["LOCALAPPDATA"] = homeDir
+	proc = subprocess.run(
+		[sys.executable, abspath(__file__), "--run-case", specPath],
+		env=env,
+		cwd=caseDir,
+		check=False,
+	)
+	if proc.returncode == 0 and isfile(spec["resultPath"]):
+		with open(spec["resultPath"], encoding="utf-8") as file:
+			result.update(json.load(file))
+	else:
+		result["error"] = f"exit code {proc.returncode}"
+
+	if not args.keep:
+		shutil.rmtree(caseDir, ignore_errors=True)
+	return result
+
+
+def parsePairs(args: argparse.Namespace) -> list[tuple[str, str]]:
+	if args.pair:
+		pairs = []
+		for pairStr in args.pair:
+			inputFormat, sep, outputFormat = pairStr.partition(":")
+			if not sep:
+				raise SystemExit(f"invalid --pair {pairStr!r}, must be INPUT:OUTPUT")
+			pairs.append((inputFormat, outputFormat))
+		return pairs
+	readFormats = args.read.split(",") if args.read else defaultReadFormats
+	writeFormats = args.write.split(",") if args.write else defaultWriteFormats
+	pairs = [(name, "Tabfile") for name in readFormats]
+	pairs += [("Tabfile", name) for name in writeFormats if name != "Tabfile"]
+	return pairs
+
+
+def parseConfig(items: list[str]) -> dict[str, Any]:
+	config: dict[str, Any] = {}
+	for item in items:
+		key, sep, valueStr = item.partition("=")
+		if not sep:
+			raise SystemExit(f"invalid --config {item!r}, must be KEY=VALUE")
+		try:
+			config[key] = json.loads(valueStr)
+		except json.JSONDecodeError:
+			config[key] = valueStr
+	return config
+
+
+def formatRow(result: dict[str, Any]) -> str:
+	name = f"{result['input']} -> {result['output']}"
+	if "error" in result:
+		return f"{name:<32} ERROR: {result['error']}"
+	stages = " ".join(f"{stage}={result['stages'][stage]:.2f}" for stage in stageNames)
+	return (
+		f"{name:<32} {result['total']:8.2f}s {result['entriesPerSec']:>10.0f}/s"
+		f" {result['maxRssMiB']}MiB  {stages}"
+	)
+
+
+def runBench(args: argparse.Namespace) -> None:
+	from pyglossary.core import VERSION
+	from pyglossary.glossary_v2 import Glossary
+
+	Glossary.init()
+
+	params = SynthParams(
+		entries=args.entries,
+		altRatio=args.alt_ratio,
+		defiLength=args.defi_length,
+		html=not args.plain,
+		resources=args.resources,
+		resourceSize=args.resource_size,
+		seed=args.seed,
+	)
+	config = parseConfig(args.config)
+	workDir = abspath(args.work_dir or join(tempfile.gettempdir(), "pyglossary-bench"))
+	os.makedirs(join(workDir, "cases"), exist_ok=True)
+
+	results = []
+	for inputFormat, outputFormat in parsePairs(args):
+		for run in range(args.repeat):
+			result = runPair(args, params, inputFormat, outputFormat, workDir, config)
+			result["run"] = run
+			print(formatRow(result), file=sys.stderr)
+			results.append(result)
+
+	report = {
+		"version": VERSION,
+		"commit": gitCommit(),
+		"time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+		"python": platform.python_version(),
+		"platform": platform.platform(),
+		"cpuCount": os.cpu_count(),
+		"params": asdict(params),
+		"options": {
+			"direct": args.direct,
+			"sort": args.sort,
+			"sqlite": args.sqlite,
+			"config": config,
+		},
+		"results": results,
+	}
+	data = json.dumps(report, indent="\t")
+	if args.output:
+		with open(args.output, "w", encoding="utf-8") as file:
+			file.write(data + "\n")
+	else:
+		print(data)
+
+
+def bestResults(report: dict[str, Any]) -> dict[tuple[str, str], dict[str, Any]]:
+	best: dict[tuple[str, str], dict[str, Any]] = {}
+	for result in report["results"]:
+		if "error" in result:
+			continue
+		key = (result["input"], result["output"])
+		if key not in best or result["total"] < best[key]["total"]:
+			best[key] = result
+	return best
+
+
+def compareReports(oldPath: str, newPath: str, maxSlowdown: float) -> int:
+	with open(oldPath, encoding="utf-8") as file:
+		oldReport = json.load(file)
+	with open(newPath, encoding="utf-8") as file:
+		newReport = json.load(file)
+	if oldReport["params"] != newReport["params"]:
+		print("Warning: reports have different glossary parameters", file=sys.stderr)
+	old = bestResults(oldReport)
+	new = bestResults(newReport)
+	print(f"old: {oldReport.get('commit')}  new: {newReport.get('commit')}")
+	regressions = 0
+	for key, newResult in new.items():
+		oldResult = old.get(key)
+		if oldResult is None:
+			continue
+		ratio = newResult["total"] / oldResult["total"] if oldResult["total"] else 1
+		mark = ""
+		if maxSlowdown and ratio > maxSlowdown:
+			mark = "  REGRESSION"
+			regressions += 1
+		print(
+			f"{key[0] + ' -> ' + key[1]:<32}"
+			f" {oldResult['total']:8.2f}s {newResult['total']:8.2f}s"
+			f" x{ratio:.2f}"
+			f"  RSS {oldResult['maxRssMiB']} -> {newResult['maxRssMiB']} MiB"
+			f"{mark}",
+		)
+	return 1 if regressions else 0
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(
+		description="Benchmark PyGlossary conversions on synthetic glossaries",
+	)
+	parser.add_argument("-n", "--entries", type=int, default=10000)
+	parser.add_argument(
+		"--alt-ratio",
+		type=float,
+		default=0.2,
+		help="ratio of entries that have alternate terms",
+	)
+	parser.add_argument(
+		"--defi-length",
+		type=int,
+		default=300,
+		help="average definition length in characters",
+	)
+	parser.add_argument(
+		"--plain",
+		action="store_true",
+		help="plain text definitions instead of HTML",
+	)
+	parser.add_argument("--resources", type=int, default=0, help="number of files")
+	parser.add_argument("--resource-size", type=int, default=4096)
+	parser.add_argument("--seed", type=int, default=1)
+	parser.add_argument(
+		"--read",
+		help="comma-separated input formats, converted to Tabfile",
+	)
+	parser.add_argument(
+		"--write",
+		help="comma-separated output formats, converted from Tabfile",
+	)
+	parser.add_argument(
+		"--pair",
+		action="append",
+		help="INPUT:OUTPUT format pair, can be given multiple times",
+	)
+	parser.add_argument("--direct", action="store_true", default=None)
+	parser.add_argument("--indirect", dest="direct", action="store_false")
+	parser.add_argument("--sort", action="store_true", default=None)
+	parser.add_argument("--sqlite", action="store_true", default=None)
+	parser.add_argument(
+		"--config",
+		action="append",
+		default=[],
+		help="glossary config KEY=VALUE, VALUE is parsed as JSON if possible",
+	)
+	parser.add_argument("--repeat", type=int, default=1)
+	parser.add_argument(
+		"--work-dir",
+		help="directory for generated inputs (kept) and outputs",
+	)
+	parser.add_argument(
+		"--keep",
+		action="store_true",
+		help="do not remove outputs",
+	)
+	parser.add_argument("-v", "--verbosity", type=int, default=2)
+	parser.add_argument("-o", "--output", help="JSON report file, default: stdout")
+	parser.add_argument(
+		"--compare",
+		nargs=2,
+		metavar=("OLD", "NEW"),
+		help="compare two JSON reports instead of running",
+	)
+	parser.add_argument(
+		"--max-slowdown",
+		type=float,
+		default=0,
+		help="with --compare, exit with 1 if any conversion is slower by this ratio",
+	)
+	parser.add_argument("--run-case", help=argparse.SUPPRESS)
+	args = parser.parse_args()
+
+	if args.run_case:
+		childMain(args.run_case)
+		return
+	if args.compare:
+		sys.exit(compareReports(*args.compare, args.max_slowdown))
+	runBench(args)
+
+
+if __name__ == "__main__":
+	main()
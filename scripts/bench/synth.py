@@ -0,0 +1,430 @@
+"""
+Synthetic glossaries for benchmarks.
+
+Entries are generated from a seeded random generator, so the same parameters
+always give the same glossary, in every format. Formats that PyGlossary can
+write are created with the Glossary API, read-only formats (DSL, XDXF,
+FreeDict TEI and Octopus MDict) are written directly by this module.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import struct
+import sys
+import zipfile
+import zlib
+from dataclasses import asdict, dataclass
+from html import escape
+from os.path import abspath, dirname, splitext
+from typing import TYPE_CHECKING
+
+rootDir = dirname(dirname(dirname(abspath(__file__))))
+sys.path.insert(0, rootDir)
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Iterator
+
+__all__ = [
+	"SynthEntry",
+	"SynthParams",
+	"generateInput",
+	"iterEntries",
+	"iterResources",
+	"readOnlyFormats",
+]
+
+_consonants = "bcdfghjklmnprstvz"
+_vowels = "aeiou"
+_syllables = [c + v for c in _consonants for v in _vowels] + list(_vowels)
+
+
+@dataclass(slots=True, frozen=True)
+class SynthParams:
+	entries: int = 10000
+	altRatio: float = 0.2
+	defiLength: int = 300
+	html: bool = True
+	resources: int = 0
+	resourceSize: int = 4096
+	seed: int = 1
+
+	def key(self) -> str:
+		"""Short stable id of parameters, used as cache directory name."""
+		data = json.dumps(asdict(self), sort_keys=True).encode("utf-8")
+		return f"n{self.entries}-" + hashlib.sha1(data).hexdigest()[:10]  # noqa: S324
+
+
+@dataclass(slots=True)
+class SynthEntry:
+	terms: list[str]
+	# lines of (style, text) segments, style is "", "b", "i" or "ref"
+	lines: list[list[tuple[str, str]]]
+	image: str = ""
+
+
+def _newWord(rand: random.Random) -> str:
+	return "".join(rand.choices(_syllables, k=rand.randint(2, 4)))
+
+
+def _newUniqueWord(rand: random.Random, seen: set[str]) -> str:
+	word = _newWord(rand)
+	while word in seen:
+		word += rand.choice(_syllables)
+	seen.add(word)
+	return word
+
+
+def _resourceName(index: int) -> str:
+	return f"img{index}.png"
+
+
+def iterEntries(params: SynthParams) -> Iterator[SynthEntry]:
+	rand = random.Random(params.seed)
+	seen: set[str] = set()
+	mainTerms: list[str] = []
+	resourceStep = params.entries // params.resources if params.resources else 0
+	for index in range(params.entries):
+		term = _newUniqueWord(rand, seen)
+		terms = [term]
+		if rand.random() < params.altRatio:
+			terms += [_newUniqueWord(rand, seen) for _ in range(rand.randint(1, 3))]
+
+		lines: list[list[tuple[str, str]]] = []
+		size = 0
+		target = max(1, int(rand.gauss(params.defiLength, params.defiLength / 4)))
+		while size < target:
+			line: list[tuple[str, str]] = []
+			for _ in range(rand.randint(3, 12)):
+				style = rand.choices(("", "b", "i", "ref"), weights=(20, 2, 2, 1))[0]
+				if style == "ref" and mainTerms:
+					text = rand.choice(mainTerms)
+				elif style == "ref":
+					style, text = "", _newWord(rand)
+				else:
+					text = " ".join(_newWord(rand) for _ in range(rand.randint(1, 4)))
+				line.append((style, text))
+				size += len(text) + 1
+			lines.append(line)
+
+		image = ""
+		if resourceStep and index % resourceStep == 0:
+			resourceIndex = index // resourceStep
+			if resourceIndex < params.resources:
+				image = _resourceName(resourceIndex)
+
+		mainTerms.append(term)
+		yield SynthEntry(terms=terms, lines=lines, image=image)
+
+
+def iterResources(params: SynthParams) -> Iterator[tuple[str, bytes]]:
+	rand = random.Random(params.seed + 1)
+	for index in range(params.resources):
+		data = b"\x89PNG\r\n\x1a\n" + rand.randbytes(max(0, params.resourceSize - 8))
+		yield _resourceName(index), data
+
+
+# ___________________________ definition renderers ___________________________
+
+
+def _joinLine(
+	line: list[tuple[str, str]],
+	tags: dict[str, Callable[[str], str]],
+	esc: Callable[[str], str],
+) -> str:
+	return " ".join(tags[style](text) if style else esc(text) for style, text in line)
+
+
+_htmlTags: dict[str, Callable[[str], str]] = {
+	"b": lambda s: f"<b>{escape(s)}</b>",
+	"i": lambda s: f"<i>{escape(s)}</i>",
+	"ref": lambda s: f'<a href="bword://{escape(s)}">{escape(s)}</a>',
+}
+
+
+def renderHtml(entry: SynthEntry) -> str:
+	defi = "<br>".join(_joinLine(line, _htmlTags, escape) for line in entry.lines)
+	if entry.image:
+		defi = f'<img src="{entry.image}"><br>' + defi
+	return defi
+
+
+def renderPlain(entry: SynthEntry) -> str:
+	return "\n".join(" ".join(text for _, text in line) for line in entry.lines)
+
+
+def renderDefi(entry: SynthEntry, params: SynthParams) -> tuple[str, str]:
+	"""Return (defi, defiFormat)."""
+	if params.html:
+		return renderHtml(entry), "h"
+	return renderPlain(entry), "m"
+
+
+def _noEscape(s: str) -> str:
+	return s
+
+
+_dslTags: dict[str, Callable[[str], str]] = {
+	"b": lambda s: f"[b]{s}[/b]",
+	"i": lambda s: f"[i]{s}[/i]",
+	"ref": lambda s: f"[ref]{s}[/ref]",
+}
+
+_xdxfTags: dict[str, Callable[[str], str]] = {
+	"b": lambda s: f"<b>{escape(s)}</b>",
+	"i": lambda s: f"<i>{escape(s)}</i>",
+	"ref": lambda s: f"<kref>{escape(s)}</kref>",
+}
+
+
+# ____________________________ read-only formats _____________________________
+
+
+def writeDsl(params: SynthParams, path: str) -> None:
+	with open(path, "w", encoding="utf-8") as file:
+		file.write(
+			'#NAME "Synthetic Benchmark"\n'
+			'#INDEX_LANGUAGE "English"\n'
+			'#CONTENTS_LANGUAGE "English"\n\n',
+		)
+		for entry in iterEntries(params):
+			file.writelines(term + "\n" for term in entry.terms)
+			if entry.image:
+				file.write(f"\t[m1][s]{entry.image}[/s][/m]\n")
+			file.writelines(
+				f"\t[m1]{_joinLine(line, _dslTags, _noEscape)}[/m]\n"
+				for line in entry.lines
+			)
+			file.write("\n")
+	if params.resources:
+		with zipfile.ZipFile(path + ".files.zip", mode="w") as zf:
+			for fname, data in iterResources(params):
+				zf.writestr(fname, data)
+
+
+def writeXdxf(params: SynthParams, path: str) -> None:
+	with open(path, "w", encoding="utf-8") as file:
+		file.write(
+			'<?xml version="1.0" encoding="UTF-8" ?>\n'
+			'<xdxf lang_from="ENG" lang_to="ENG" format="visual">\n'
+			"<full_name>Synthetic Benchmark</full_name>\n"
+			"<description>Synthetic Benchmark</description>\n",
+		)
+		for entry in iterEntries(params):
+			keys = "".join(f"<k>{escape(term)}</k>" for term in entry.terms)
+			defi = "\n".join(_joinLine(line, _xdxfTags, escape) for line in entry.lines)
+			file.write(f"<ar>{keys}\n{defi}</ar>\n")
+		file.write("</xdxf>\n")
+
+
+def writeFreeDict(params: SynthParams, path: str) -> None:
+	with open(path, "w", encoding="utf-8") as file:
+		file.write(
+			'<?xml version="1.0" encoding="UTF-8"?>\n'
+			'<TEI xmlns="http://www.tei-c.org/ns/1.0">\n'
+			"<teiHeader><fileDesc>"
+			"<titleStmt><title>Synthetic Benchmark</title></titleStmt>"
+			f"<extent>{params.entries} headwords</extent>"
+			"</fileDesc></teiHeader>\n"
+			"<text><body>\n",
+		)
+		for entry in iterEntries(params):
+			forms = "".join(
+				f"<form><orth>{escape(term)}</orth></form>" for term in entry.terms
+			)
+			senses = "".join(
+				'<sense><cit type="trans"><quote>'
+				+ escape(" ".join(text for _, text in line))
+				+ "</quote></cit></sense>"
+				for line in entry.lines
+			)
+			file.write(f"<entry>{forms}{senses}</entry>\n")
+		file.write("</body></text>\n</TEI>\n")
+
+
+# Octopus MDict, engine version 2.0, UTF-8, zlib compressed, not encrypted
+
+_mdictBlockSize = 64 * 1024
+
+
+def _mdictBlock(data: bytes) -> bytes:
+	return (
+		b"\x02\x00\x00\x00" + struct.pack(">I", zlib.adler32(data)) + zlib.compress(data)
+	)
+
+
+def _mdictHeader(encoding: str) -> bytes:
+	text = (
+		'<Dictionary GeneratedByEngineVersion="2.0" RequiredEngineVersion="2.0"'
+		f' Encrypted="No" Encoding="{encoding}" Format="Html"'
+		' Title="Synthetic Benchmark" Description="Synthetic Benchmark"/>\r\n\x00'
+	)
+	b_text = text.encode("utf-16-le")
+	return (
+		struct.pack(">I", len(b_text)) + b_text + struct.pack("<I", zlib.adler32(b_text))
+	)
+
+
+def _writeMdictFile(
+	path: str,
+	items: Iterator[tuple[str, bytes]],
+	keyEncoding: str,
+) -> None:
+	"""
+	Write an MDict file with given (key, record) items.
+
+	keyEncoding: "utf-8" for .mdx, "utf-16-le" for .mdd
+	"""
+	keyTerm = b"\x00\x00" if keyEncoding == "utf-16-le" else b"\x00"
+	charSize = len(keyTerm)
+
+	keyInfo: list[bytes] = []
+	keyBlocks: list[bytes] = []
+	recordSizes: list[tuple[int, int]] = []
+	recordBlocks: list[bytes] = []
+	entryCount = 0
+
+	keyBuf = bytearray()
+	keyCount = 0
+	firstKey = lastKey = b""
+	recordBuf = bytearray()
+	recordOffset = 0
+
+	def flushKeys() -> None:
+		nonlocal keyBuf, keyCount
+		block = _mdictBlock(bytes(keyBuf))
+		keyInfo.append(
+			struct.pack(">QH", keyCount, len(firstKey) // charSize)
+			+ firstKey
+			+ keyTerm
+			+ struct.pack(">H", len(lastKey) // charSize)
+			+ lastKey
+			+ keyTerm
+			+ struct.pack(">QQ", len(block), len(keyBuf)),
+		)
+		keyBlocks.append(block)
+		keyBuf = bytearray()
+		keyCount = 0
+
+	def flushRecords() -> None:
+		nonlocal recordBuf
+		block = _mdictBlock(bytes(recordBuf))
+		recordSizes.append((len(block), len(recordBuf)))
+		recordBlocks.append(block)
+		recordBuf = bytearray()
+
+	for key, record in items:
+		b_key = key.encode(keyEncoding)
+		if not keyCount:
+			firstKey = b_key
+		lastKey = b_key
+		keyBuf += struct.pack(">Q", recordOffset) + b_key + keyTerm
+		keyCount += 1
+		entryCount += 1
+		recordBuf += record
+		recordOffset += len(record)
+		if len(keyBuf) >= _mdictBlockSize:
+			flushKeys()
+		if len(recordBuf) >= _mdictBlockSize:
+			flushRecords()
+	if keyCount:
+		flushKeys()
+	if recordBuf:
+		flushRecords()
+
+	b_keyInfo = b"".join(keyInfo)
+	keyInfoBlock = _mdictBlock(b_keyInfo)
+	keySection = struct.pack(
+		">QQQQQ",
+		len(keyBlocks),
+		entryCount,
+		len(b_keyInfo),
+		len(keyInfoBlock),
+		sum(len(block) for block in keyBlocks),
+	)
+	with open(path, "wb") as file:
+		file.write(_mdictHeader("UTF-16" if charSize == 2 else "UTF-8"))
+		file.write(keySection)
+		file.write(struct.pack(">I", zlib.adler32(keySection)))
+		file.write(keyInfoBlock)
+		file.writelines(keyBlocks)
+		file.write(
+			struct.pack(
+				">QQQQ",
+				len(recordBlocks),
+				entryCount,
+				16 * len(recordBlocks),
+				sum(len(block) for block in recordBlocks),
+			),
+		)
+		file.writelines(
+			struct.pack(">QQ", compSize, decompSize)
+			for compSize, decompSize in recordSizes
+		)
+		file.writelines(recordBlocks)
+
+
+def writeMdict(params: SynthParams, path: str) -> None:
+	def iterItems() -> Iterator[tuple[str, bytes]]:
+		for entry in iterEntries(params):
+			term = entry.terms[0]
+			yield term, renderHtml(entry).encode("utf-8") + b"\x00"
+			for alt in entry.terms[1:]:
+				yield alt, f"@@@LINK={term}".encode() + b"\x00"
+
+	_writeMdictFile(path, iterItems(), "utf-8")
+	if params.resources:
+		_writeMdictFile(
+			splitext(path)[0] + ".mdd",
+			(("\\" + fname, data) for fname, data in iterResources(params)),
+			"utf-16-le",
+		)
+
+
+readOnlyFormats: dict[str, tuple[str, Callable[[SynthParams, str], None]]] = {
+	"ABBYYLingvoDSL": (".dsl", writeDsl),
+	"Xdxf": (".xdxf", writeXdxf),
+	"FreeDict": (".tei", writeFreeDict),
+	"OctopusMdict": (".mdx", writeMdict),
+}
+
+
+# ____________________________ writable formats ______________________________
+
+
+def writeWithGlossary(params: SynthParams, path: str, formatName: str) -> None:
+	from pyglossary.glossary_v2 import Glossary
+
+	glos = Glossary()
+	glos.setInfo("name", "Synthetic Benchmark")
+	glos.setInfo("sourceLang", "English")
+	glos.setInfo("targetLang", "English")
+	for entry in iterEntries(params):
+		defi, defiFormat = renderDefi(entry, params)
+		glos.addEntry(glos.newEntry(entry.terms, defi, defiFormat=defiFormat))
+	for fname, data in iterResources(params):
+		glos.addEntry(glos.newDataEntry(fname, data))
+	# same as Glossary.convert, some formats (like Yomichan) are written
+	# as a directory, then compressed
+	filename, formatName, compression = Glossary.detectOutputFormat(
+		filename=path,
+		formatName=formatName,
+	)
+	filename = glos.write(filename, formatName=formatName)
+	if compression:
+		from pyglossary.compress import compress
+
+		compress(filename, compression)
+	glos.cleanup()
+
+
+def generateInput(params: SynthParams, formatName: str, path: str) -> None:
+	"""Create synthetic glossary file `path` in format `formatName`."""
+	os.makedirs(dirname(path), exist_ok=True)
+	if formatName in readOnlyFormats:
+		readOnlyFormats[formatName][1](params, path)
+		return
+	writeWithGlossary(params, path, formatName)
@@ -24,7 +24,7 @@ requirements = {
 	"prompt_toolkit",  # used for interactive cli
 }
 # "tqdm" used for progressbar if installed
-# "python-idzip" is used as dictzip for StarDict if installed
+# "python-idzip" is used by runDictzip(method="idzip")
 for p in plugins:
 	requirements |= set(p.readDepends.values())
 	requirements |= set(p.writeDepends.values())
@@ -26,7 +26,7 @@ moduleNames = {
 	"prompt_toolkit",  # used for interactive cli
 }
 # "tqdm" used for progressbar if installed
-# "python-idzip" is used as dictzip for StarDict if installed
+# "python-idzip" is used by runDictzip(method="idzip")
 for p in plugins:
 	moduleNames |= set(p.readDepends)
 	moduleNames |= set(p.writeDepends)
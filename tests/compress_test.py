@@ -0,0 +1,90 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from os.path import abspath, dirname, join
+
+rootDir = dirname(dirname(abspath(__file__)))
+sys.path.insert(0, rootDir)
+
+from pyglossary.compress import (
+	compressedRawFile,
+	compressionOpen,
+	progressFile,
+	progressFileSize,
+)
+from pyglossary.text_reader import TextFilePosWrapper
+
+TEXT = "".join(f"word{i}\tdefinition of word {i} بله\n" for i in range(20000))
+
+
+class TestCompressProgress(unittest.TestCase):
+	def setUp(self) -> None:
+		self.tempDir = tempfile.mkdtemp()
+		self.data = TEXT.encode("utf-8")
+
+	def tearDown(self) -> None:
+		shutil.rmtree(self.tempDir)
+
+	def writeFile(self, ext: str) -> str:
+		fpath = join(self.tempDir, f"test.txt{ext}")
+		compressFunc = {
+			"": bytes,
+			".gz": gzip.compress,
+			".bz2": bz2.compress,
+			".lzma": lzma.compress,
+		}[ext]
+		with open(fpath, "wb") as file:
+			file.write(compressFunc(self.data))
+		return fpath
+
+	def test_plain(self) -> None:
+		fpath = self.writeFile("")
+		with compressionOpen(fpath, mode="rb") as file:
+			self.assertIsNone(compressedRawFile(file))
+			self.assertIs(progressFile(file), file)
+			self.assertEqual(progressFileSize(file), len(self.data))
+			self.assertEqual(file.tell(), 0)
+
+	def test_compressed(self) -> None:
+		for ext in (".gz", ".bz2", ".lzma"):
+			fpath = self.writeFile(ext)
+			fileSize = os.path.getsize(fpath)
+			for mode in ("rb", "rt"):
+				with compressionOpen(fpath, mode=mode) as file:
+					raw = compressedRawFile(file)
+					self.assertIsNotNone(raw, msg=f"{ext=}, {mode=}")
+					self.assertIs(progressFile(file), raw)
+					self.assertEqual(progressFileSize(file), fileSize)
+					# size is known without decompressing anything
+					self.assertEqual(raw.tell(), 0)
+					head = file.read(5)
+					self.assertEqual(head, "word0" if mode == "rt" else b"word0")
+					file.read()
+					self.assertEqual(raw.tell(), fileSize)
+
+	def test_text_file_pos_wrapper(self) -> None:
+		for ext in ("", ".gz"):
+			fpath = self.writeFile(ext)
+			fileSize = os.path.getsize(fpath)
+			cfile = compressionOpen(fpath, mode="rt", encoding="utf-8")
+			self.assertEqual(progressFileSize(cfile), fileSize)
+			file = TextFilePosWrapper(cfile, "utf-8")
+			lines = list(file)
+			self.assertEqual("".join(lines), TEXT)
+			self.assertEqual(file.tell(), fileSize)
+			file.close()
+
+	def test_not_compressed_buffer(self) -> None:
+		file = io.BytesIO(self.data)
+		self.assertIsNone(compressedRawFile(file))
+		self.assertEqual(progressFileSize(file), len(self.data))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -1,10 +1,17 @@
 import gzip
+import io
 import logging
+import random
+import struct
 import unittest
+import zlib
 from pathlib import Path
+from unittest.mock import patch
 
 from glossary_v2_errors_test import TestGlossaryErrorsBase
 
+from pyglossary.dictzip_reader import DictzipReader, openDictzip
+from pyglossary.dictzip_writer import DictzipWriter, chunkLength
 from pyglossary.os_utils import runDictzip
 
 TEXT = """
@@ -26,6 +33,16 @@ class TestDictzip(TestGlossaryErrorsBase):
 		with open(self.test_file_path, "a", encoding="utf-8") as tmp_file:
 			tmp_file.write(TEXT)
 
+	def test_native_compressed_matches(self) -> None:
+		runDictzip(self.test_file_path)
+		self.assertFalse(self.test_file_path.exists())
+		with gzip.open(self.result_file_path, "r") as file:
+			result = file.read().decode()
+		self.assertEqual(result, TEXT)
+		with DictzipReader(str(self.result_file_path)) as reader:
+			reader.seek(10)
+			self.assertEqual(reader.read(20).decode(), TEXT[10:30])
+
 	def test_idzip_compressed_exists(self) -> None:
 		method = "idzip"
 		runDictzip(self.test_file_path, method)
@@ -69,5 +86,129 @@ class TestDictzip(TestGlossaryErrorsBase):
 		self.assertIsNotNone(err)
 
 
+class TestDictzipWriter(TestGlossaryErrorsBase):
+	def setUp(self) -> None:
+		super().setUp()
+		self.data = (TEXT * 2000).encode("utf-8")
+		self.assertGreater(len(self.data), chunkLength * 3)
+		self.dzPath = Path(self.tempDir) / "test_file.txt.dz"
+
+	def test_decompress(self) -> None:
+		with DictzipWriter(str(self.dzPath)) as dzFile:
+			for index in range(0, len(self.data), 1000):
+				dzFile.write(self.data[index : index + 1000])
+			self.assertEqual(dzFile.tell(), len(self.data))
+		with gzip.open(self.dzPath, "rb") as file:
+			self.assertEqual(file.read(), self.data)
+
+	def test_empty(self) -> None:
+		with DictzipWriter(str(self.dzPath)):
+			pass
+		with gzip.open(self.dzPath, "rb") as file:
+			self.assertEqual(file.read(), b"")
+
+	def test_same_as_idzip(self) -> None:
+		from idzip import compressor
+
+		idzipPath = Path(self.tempDir) / "idzip.dz"
+		with open(idzipPath, "wb") as file:
+			compressor.compress(
+				io.BytesIO(self.data),
+				len(self.data),
+				file,
+				"test_file.txt",
+				1234,
+			)
+		with DictzipWriter(str(self.dzPath), workers=3, mtime=1234) as dzFile:
+			dzFile.write(self.data)
+		self.assertEqual(self.dzPath.read_bytes(), idzipPath.read_bytes())
+
+
+def writeDictzipToolFile(path: Path, data: bytes, chunkSize: int) -> None:
+	"""Write a dictzip file like `dictzip` command, ending deflate in last chunk."""
+	compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+	chunks = []
+	for index in range(0, len(data), chunkSize):
+		chunk = compressor.compress(data[index : index + chunkSize])
+		if index + chunkSize >= len(data):
+			chunk += compressor.flush(zlib.Z_FINISH)
+		else:
+			chunk += compressor.flush(zlib.Z_FULL_FLUSH)
+		chunks.append(chunk)
+	field = struct.pack("<HHH", 1, chunkSize, len(chunks))
+	field += struct.pack(f"<{len(chunks)}H", *[len(chunk) for chunk in chunks])
+	with open(path, "wb") as file:
+		file.write(b"\x1f\x8b\x08" + struct.pack("<BIBB", 4 | 8, 0, 2, 3))
+		file.write(struct.pack("<H2sH", len(field) + 4, b"RA", len(field)))
+		file.write(field)
+		file.write(b"test\x00")
+		file.writelines(chunks)
+		file.write(struct.pack("<II", zlib.crc32(data), len(data)))
+
+
+class TestDictzipReader(TestGlossaryErrorsBase):
+	def setUp(self) -> None:
+		super().setUp()
+		self.data = (TEXT * 2000).encode("utf-8")
+		self.dzPath = Path(self.tempDir) / "test_file.txt.dz"
+
+	def checkRandomAccess(self, reader: DictzipReader) -> None:
+		data = self.data
+		self.assertEqual(reader.size, len(data))
+		self.assertEqual(reader.read(), data)
+		self.assertEqual(reader.read(10), b"")
+		rand = random.Random(1)
+		for _ in range(300):
+			start = rand.randrange(len(data))
+			size = rand.choice([1, 100, chunkLength, 3 * chunkLength])
+			reader.seek(start)
+			self.assertEqual(reader.read(size), data[start : start + size])
+			self.assertEqual(reader.tell(), min(start + size, len(data)))
+		reader.seek(-5, io.SEEK_END)
+		self.assertEqual(reader.read(), data[-5:])
+
+	def test_writer_output(self) -> None:
+		with DictzipWriter(str(self.dzPath)) as dzFile:
+			dzFile.write(self.data)
+		for prefetch in (0, 3):
+			with DictzipReader(str(self.dzPath), prefetch=prefetch) as reader:
+				self.checkRandomAccess(reader)
+
+	def test_multiple_members(self) -> None:
+		with (
+			patch("pyglossary.dictzip_writer.maxMemberChunks", 2),
+			DictzipWriter(str(self.dzPath)) as dzFile,
+		):
+			dzFile.write(self.data)
+		with gzip.open(self.dzPath, "rb") as file:
+			self.assertEqual(file.read(), self.data)
+		with DictzipReader(str(self.dzPath), cacheSize=2, prefetch=1) as reader:
+			self.checkRandomAccess(reader)
+
+	def test_dictzip_tool_output(self) -> None:
+		writeDictzipToolFile(self.dzPath, self.data, 10000)
+		with gzip.open(self.dzPath, "rb") as file:
+			self.assertEqual(file.read(), self.data)
+		with DictzipReader(str(self.dzPath), cacheSize=4) as reader:
+			self.checkRandomAccess(reader)
+
+	def test_empty(self) -> None:
+		with DictzipWriter(str(self.dzPath)):
+			pass
+		with DictzipReader(str(self.dzPath)) as reader:
+			self.assertEqual(reader.size, 0)
+			self.assertEqual(reader.read(), b"")
+
+	def test_plain_gzip(self) -> None:
+		with gzip.open(self.dzPath, "wb") as file:
+			file.write(self.data)
+		with self.assertRaises(ValueError):
+			DictzipReader(str(self.dzPath))
+		with openDictzip(str(self.dzPath)) as file:
+			self.assertIsInstance(file, gzip.GzipFile)
+			file.seek(1000)
+			self.assertEqual(file.read(10), self.data[1000:1010])
+
+
 if __name__ == "__main__":
 	unittest.main()
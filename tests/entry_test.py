@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pickle
 import sys
 import unittest
 from os.path import abspath, dirname
@@ -7,7 +8,7 @@ from os.path import abspath, dirname
 rootDir = dirname(dirname(abspath(__file__)))
 sys.path.insert(0, rootDir)
 
-from pyglossary.entry import Entry
+from pyglossary.entry import Entry, LazyEntry
 
 
 class TestEntryBasic(unittest.TestCase):
@@ -98,6 +99,44 @@ class TestEntryBasic(unittest.TestCase):
 		self.assertEqual(entry.l_term, ["test1", "test 1"])
 
 
+class TestLazyEntry(unittest.TestCase):
+	def newEntry(self) -> LazyEntry:
+		return LazyEntry(
+			["wörd".encode(), b"word"],
+			"défi".encode(),
+			defiFormat="h",
+		)
+
+	def test_decode(self):
+		entry = self.newEntry()
+		self.assertEqual(entry.s_term, "wörd|word")
+		self.assertEqual(entry.l_term, ["wörd", "word"])
+		self.assertEqual(entry.defi, "défi")
+		self.assertEqual(entry.defiFormat, "h")
+
+	def test_bytes_not_decoded(self):
+		entry = self.newEntry()
+		self.assertEqual(entry.lb_term, ["wörd".encode(), b"word"])
+		self.assertEqual(entry.b_defi, "défi".encode())
+		self.assertIsNone(entry._strTerm)
+		self.assertIsNone(entry._strDefi)
+
+	def test_modify(self):
+		entry = self.newEntry()
+		entry.addAlt("alt")
+		self.assertEqual(entry.lb_term, ["wörd".encode(), b"word", b"alt"])
+		entry.replaceInDefi("é", "e")
+		self.assertEqual(entry.b_defi, b"defi")
+		entry.editFuncDefi(str.upper)
+		self.assertEqual(entry.b_defi, b"DEFI")
+
+	def test_pickle(self):
+		entry = pickle.loads(pickle.dumps(self.newEntry()))
+		self.assertIsInstance(entry, LazyEntry)
+		self.assertEqual(entry.l_term, ["wörd", "word"])
+		self.assertEqual(entry.defi, "défi")
+
+
 class TestEntryDetectDefiFormat(unittest.TestCase):
 	def test_1(self):
 		entry = Entry("test1", "something")
@@ -2,13 +2,15 @@ import plistlib
 import sys
 import unittest
 from os.path import abspath, dirname, join
+from unittest.mock import patch
 
 rootDir = dirname(dirname(abspath(__file__)))
 sys.path.insert(0, rootDir)
 
-from glossary_v2_test import TestGlossaryBase
+from glossary_v2_test import TestGlossaryBase, testLocalDataDir
 
 from pyglossary.glossary_v2 import ConvertArgs, Glossary
+from pyglossary.plugins.appledict import writer as appledict_writer
 
 
 class TestGlossaryAppleDict(TestGlossaryBase):
@@ -96,6 +98,88 @@ class TestGlossaryAppleDict(TestGlossaryBase):
 		n_rd = sum(1 for e in gl_rd if not e.isData())
 		self.assertEqual(n_rd, n_tab)
 
+	def test_workers(self):
+		inputFilepath = join(testLocalDataDir, "100-en-fa.txt")
+		xmlData = []
+		for workers in (0, 2):
+			outputDirPath = self.newTempFilePath(f"100-en-fa-{workers}.apple")
+			self.glos = Glossary()
+			with patch.object(appledict_writer, "batchSize", 7):
+				self.glos.convert(
+					ConvertArgs(
+						inputFilename=inputFilepath,
+						outputFilename=outputDirPath,
+						inputFormat="Tabfile",
+						outputFormat="AppleDict",
+						writeOptions={"workers": workers},
+					)
+				)
+			fname = f"100-en-fa-{workers}_apple.xml"
+			with open(join(outputDirPath, fname), encoding="utf-8") as file:
+				xmlData.append(file.read())
+		self.assertEqual(xmlData[0].count("<d:entry "), 100)
+		self.assertEqual(xmlData[0], xmlData[1])
+
+	def test_clean_html_parser(self):
+		xmlData = {}
+		for htmlParser in ("bs4", "lxml"):
+			for inputName in ("100-en-de-v4", "100-ja-en"):
+				outputDirPath = self.newTempFilePath(f"{inputName}-{htmlParser}.apple")
+				self.glos = Glossary()
+				self.glos.convert(
+					ConvertArgs(
+						inputFilename=join(testLocalDataDir, f"{inputName}.txt"),
+						outputFilename=outputDirPath,
+						inputFormat="Tabfile",
+						outputFormat="AppleDict",
+						writeOptions={"clean_html_parser": htmlParser},
+					)
+				)
+				fname = f"{inputName}-{htmlParser}_apple.xml"
+				with open(join(outputDirPath, fname), encoding="utf-8") as file:
+					xmlData[inputName, htmlParser] = file.read()
+		for inputName in ("100-en-de-v4", "100-ja-en"):
+			self.assertEqual(
+				xmlData[inputName, "lxml"],
+				xmlData[inputName, "bs4"],
+				msg=inputName,
+			)
+
+	def test_prepare_content_lxml(self):
+		import bs4
+
+		from pyglossary.plugins.appledict._content import prepare_content
+
+		bodies = [
+			"",
+			" ",
+			"plain text",
+			'<span class="sec ex" style="color:steelblue">a</span>',
+			'<i class="p" style="color:green">p</i> <i style="color:green">c</i>',
+			'<div style="margin-left:2em;color:steelblue">m</div>',
+			'<div class=" a  sec "><u>u</u> <s>s</s></div>',
+			"<xhtml:b>x</xhtml:b><xhtml:span><b>y</b></xhtml:span><xhtml:br>",
+			'<a href="bword://foo">f</a> <a href="sound://a.wav">s</a>',
+			'<a href="phonetics"><audio name="a#1"></audio></a>',
+			'<a href="http://x.com/?a=1&amp;b=2">u</a> <a href="#x">h</a>',
+			'<a href=\'say "hi"\'>q</a> <a href="it\'s &quot;q&quot;">q</a>',
+			'<img src="/img.png"><br><input disabled><hr/>',
+			'<div class="pic_thumb"></div><div class="big_pic"></div>',
+			'<pos onclick="toggle_infl(this)">p</pos>',
+			"<pre>  </pre> <p>  \n  </p><script>a < b && c</script>",
+			"a &amp; b &lt;c&gt; &nbsp; &foo; <!-- comment --> <!---->",
+			"<h3>title</h3><table><tr><td>cell",
+			'<meta charset="latin1"><b>x</b>',
+			"<title>t</title>",
+		]
+		for body in bodies:
+			for title in ("word", None):
+				self.assertEqual(
+					prepare_content(title, body, bs4, "lxml"),
+					prepare_content(title, body, bs4, "bs4"),
+					msg=f"{title=}, {body=}",
+				)
+
 
 if __name__ == "__main__":
 	unittest.main()
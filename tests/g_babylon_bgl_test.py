@@ -1,7 +1,13 @@
 import unittest
 from os.path import join
+from unittest.mock import patch
 
-from glossary_v2_test import TestGlossaryBase
+from glossary_v2_test import TestGlossaryBase, testLocalDataDir
+
+from pyglossary.glossary_v2 import Glossary
+from pyglossary.plugins.babylon_bgl import reader_entries, reader_io
+from pyglossary.plugins.babylon_bgl.reader import Reader
+from pyglossary.plugins.babylon_bgl.reader_data import Block
 
 
 class TestGlossaryBGL(TestGlossaryBase):
@@ -48,6 +54,44 @@ class TestGlossaryBGL(TestGlossaryBase):
 			resPathExpected = self.downloadFile(f"{fname}.txt_res/{resName}")
 			self.compareBinaryFiles(resPathActual, resPathExpected)
 
+	def test_iter_blocks(self):
+		def blockTuples(blocks):
+			return [(block.type, block.offset, block.data) for block in blocks]
+
+		for fname in ("004-bar.txt.bgl", "100-en-fa.txt.bgl"):
+			reader = Reader(Glossary())
+			reader.open(join(testLocalDataDir, fname))
+			expected = []
+			block = Block()
+			while reader.readBlock(block):
+				expected.append((block.type, block.offset, block.data))
+				block = Block()
+			self.assertGreater(len(expected), 10)
+			with patch.object(reader_io, "readChunkSize", 7):
+				self.assertEqual(blockTuples(reader.iterBlocks()), expected)
+			self.assertEqual(
+				blockTuples(reader.iterSavedBlocks()),
+				[item for item in expected if item[0] in {1, 2, 7, 10, 11, 13}],
+			)
+			reader.close()
+
+	def test_workers(self):
+		def readEntries(filename, workers):
+			reader = Reader(Glossary())
+			reader._workers = workers
+			reader.open(filename)
+			entries = [
+				(entry.l_term, entry.b_defi if entry.isData() else entry.defi)
+				for entry in reader
+			]
+			reader.close()
+			return entries
+
+		for fname in ("004-bar.txt.bgl", "100-en-fa.txt.bgl"):
+			filename = join(testLocalDataDir, fname)
+			with patch.object(reader_entries, "batchSize", 7):
+				self.assertEqual(readEntries(filename, 2), readEntries(filename, 0))
+
 	def test_convert_bgl_txt_1(self):
 		self.convert_bgl_txt(
 			"Flavours_of_Malaysia",
@@ -1,7 +1,12 @@
+import gzip
 import unittest
+from os.path import isfile
 
 from glossary_v2_test import TestGlossaryBase
 
+from pyglossary.glossary_v2 import ConvertArgs, Glossary
+from pyglossary.text_utils import crc32hex
+
 
 class TestGlossaryDictOrg(TestGlossaryBase):
 	def __init__(self, *args, **kwargs):
@@ -37,6 +42,35 @@ class TestGlossaryDictOrg(TestGlossaryBase):
 			writeOptions={"install": False},
 		)
 
+	def test_convert_txt_dict_org_dictzip(self):
+		outputFilename = self.newTempFilePath("100-en-fa-dz.index")
+		glos = self.glos = Glossary()
+		glos.convert(
+			ConvertArgs(
+				inputFilename=self.downloadFile("100-en-fa.txt"),
+				outputFilename=outputFilename,
+				writeOptions={"install": False, "dictzip": True},
+			),
+		)
+		dictPath = outputFilename.removesuffix(".index") + ".dict"
+		self.assertFalse(isfile(dictPath))
+		with gzip.open(dictPath + ".dz", "rb") as file:
+			self.assertEqual(crc32hex(file.read()), "02abe5dc")
+
+		txtPath = self.newTempFilePath("100-en-fa-dz.txt")
+		glos = self.glos = Glossary()
+		glos.convert(
+			ConvertArgs(
+				inputFilename=outputFilename,
+				outputFilename=txtPath,
+				infoOverride={"input_file_size": None},
+			),
+		)
+		self.compareTextFiles(
+			txtPath,
+			self.downloadFile("100-en-fa.txt.index.txt"),
+		)
+
 	def test_convert_dict_org_txt_1(self):
 		self.convert_dict_org_txt(
 			"100-en-fa.txt",
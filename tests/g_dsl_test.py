@@ -240,6 +240,30 @@ class TestGlossaryDSL(TestGlossaryBase):
 			"test\thello &lt;&lt;world&gt;&gt;",
 		)
 
+	def test_text_and_simple_tags(self):
+		self.convert_string_dsl_txt(
+			"test\n    [m1]a < b & [b]c[/b] [c red]d[/c] ~ x[/m]",
+			'test\t<p style="padding-left:1em;margin:0">a &lt; b &amp; <b>c</b> '
+			'<font color="red">d</font> test x</p>',
+		)
+
+	def test_tag_with_attrs(self):
+		self.convert_string_dsl_txt(
+			"test\n    a [i]b[/i] [lang id=1033]c[/lang] d\\",
+			"test\ta <i>b</i> c d\\\\",
+		)
+
+	def test_workers(self):
+		self.convert_string_dsl_txt(
+			"test\n    hello [b]world[/b]\n    @ sub\n    sub text\n"
+			"test2\n    [i]hello[/i] ~",
+			'test\thello <b>world</b><p style="padding-left:2em;margin:0">'
+			'<a href="bword://sub">sub</a>\n'
+			"sub\tsub text\n"
+			"test2\t<i>hello</i> ~",
+			readOptions={"workers": 2},
+		)
+
 
 if __name__ == "__main__":
 	unittest.main()
@@ -284,6 +284,15 @@ class TestGlossaryStarDict(TestGlossaryStarDictBase):
 			"1",
 		)
 
+	def test_convert_stardict_txt_1_lazy_index(self):
+		self.convert_stardict_txt(
+			"100-en-fa",
+			"100-en-fa-sd-v2",
+			"100-en-fa-sd-v2",
+			"1-lazy-index",
+			readOptions={"lazy_index": True},
+		)
+
 	def test_convert_stardict_txt_mixed_types_1(self):
 		self.convert_stardict_txt(
 			"stardict-mixed-types-2",
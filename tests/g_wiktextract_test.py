@@ -78,6 +78,15 @@ class TestGlossaryWiktextract(TestGlossaryBase):
 		# "topics" in sense
 		# "form_of" in sense
 
+	def test_convert_jsonl_txt_3_workers(self):
+		self.convert_jsonl_txt(
+			"03-kaikki-fa-selection",
+			"03-kaikki-fa-selection-v3",
+			readOptions={
+				"workers": 2,
+			},
+		)
+
 
 if __name__ == "__main__":
 	unittest.main()
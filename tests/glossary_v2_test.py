@@ -839,6 +839,106 @@ class TestGlossary(TestGlossaryBase):
 				sqlite=sqlite,
 			)
 
+	def test_txt_txt_bar_sort_external(self):
+		self.convert_txt_txt(
+			"004-bar",
+			"004-bar-sort",
+			testId="bar_sort_external",
+			sort=True,
+			sqlite=True,
+			config={"external_sort": True},
+		)
+
+	def test_txt_txt_empty_filtered_parallel(self):
+		for direct in (None, False, True):
+			self.convert_txt_txt(
+				"006-empty",
+				"006-empty-filtered",
+				testId="empty_filtered_parallel",
+				direct=direct,
+				config={"filter_workers": 2},
+			)
+
+	def test_txt_txt_bar_sort_parallel(self):
+		self.convert_txt_txt(
+			"004-bar",
+			"004-bar-sort",
+			testId="bar_sort_parallel",
+			sort=True,
+			config={"filter_workers": 2},
+		)
+
+	def test_txt_txt_bar_sort_profile(self):
+		reportPath = self.newTempFilePath("bar_sort_profile.json")
+		for sqlite in (False, True):
+			self.convert_txt_txt(
+				"004-bar",
+				"004-bar-sort",
+				testId="bar_sort_profile",
+				sort=True,
+				sqlite=sqlite,
+				config={
+					"profile_report": reportPath,
+					"profile_cprofile": "sort",
+				},
+			)
+			with open(reportPath, encoding="utf-8") as file:
+				report = json.load(file)
+			stages = report["stages"]
+			for stage in (
+				"read.open:Tabfile",
+				"read:Tabfile",
+				"store",
+				"sort",
+				"fetch",
+				"write.open:Tabfile",
+				"write:Tabfile",
+				"finish:Tabfile",
+				"convert",
+				"filter:TrimWhitespaces",
+			):
+				self.assertIn(stage, stages)
+			self.assertEqual(stages["convert"]["calls"], 1)
+			self.assertEqual(stages["store"]["calls"], 4)
+			self.assertEqual(list(report["cprofile"]), ["sort"])
+			self.assertAlmostEqual(
+				sum(item["seconds"] for item in stages.values()),
+				report["elapsed"],
+				delta=0.1,
+			)
+
+	def test_txt_txt_bar_direct_profile(self):
+		glos = self.glos = Glossary()
+		profiler = glos.enableProfiling()
+		glos.convert(
+			ConvertArgs(
+				inputFilename=self.downloadFile("004-bar.txt"),
+				outputFilename=self.newTempFilePath("004-bar-profile.txt"),
+				direct=True,
+			),
+		)
+		stages = profiler.report()["stages"]
+		# 4 entries, one None (empty line) and end of iteration
+		self.assertEqual(stages["read:Tabfile"]["calls"], 6)
+		# first send(None), 4 entries and last send(None)
+		self.assertEqual(stages["write:Tabfile"]["calls"], 6)
+		self.assertEqual(stages["filter:TrimWhitespaces"]["calls"], 4)
+		self.assertNotIn("store", stages)
+		self.assertNotIn("sort", stages)
+
+	def test_splitEntryFilters(self):
+		from pyglossary.parallel_filters import splitEntryFilters
+
+		glos = self.glos = Glossary()
+		glos.config = {"lower": True, "skip_duplicate_headword": True}
+		glos.updateEntryFilters()
+		parallel, sequential = splitEntryFilters(glos._entryFilters)
+		self.assertEqual(
+			[f.name for f in parallel],
+			["trim_whitespaces", "non_empty_term", "lower"],
+		)
+		self.assertEqual(sequential[0].name, "skip_duplicate_headword")
+
 	def test_dataEntry_save(self):
 		glos = self.glos = Glossary()
 		tmpFname = "test_dataEntry_save"
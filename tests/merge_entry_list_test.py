@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from itertools import pairwise
+from os.path import abspath, dirname
+
+rootDir = dirname(dirname(abspath(__file__)))
+sys.path.insert(0, rootDir)
+
+from pyglossary.glossary_v2 import Glossary
+from pyglossary.merge_entry_list import MergeSortEntryList
+from pyglossary.sort_keys import lookupSortKey
+
+
+class TestMergeSortEntryList(unittest.TestCase):
+	def setUp(self):
+		self.tmpDir = tempfile.mkdtemp()
+		self.glos = Glossary()
+
+	def tearDown(self):
+		shutil.rmtree(self.tmpDir)
+
+	def newList(self, ramBudget: int) -> MergeSortEntryList:
+		return MergeSortEntryList(
+			entryToRaw=self.glos._entryToRaw,
+			entryFromRaw=self.glos._entryFromRaw,
+			tmpDir=self.tmpDir,
+			ramBudget=ramBudget,
+		)
+
+	def addEntries(self, entryList: MergeSortEntryList, count: int) -> list[str]:
+		rng = random.Random(1)
+		terms = [f"w{rng.randrange(count * 10):06d}" for _ in range(count)]
+		for index, term in enumerate(terms):
+			entryList.append(
+				self.glos.newEntry([term, f"alt{index}"], f"defi {index}"),
+			)
+		return terms
+
+	def sortedEntries(self, ramBudget: int, count: int) -> tuple[list[str], list]:
+		entryList = self.newList(ramBudget)
+		namedSortKey = lookupSortKey("headword_lower")
+		assert namedSortKey
+		entryList.setSortKey(namedSortKey, "utf-8", {})
+		terms = self.addEntries(entryList, count)
+		entryList.sort()
+		entries = list(entryList)
+		entryList.close()
+		return terms, entries
+
+	def test_in_memory(self):
+		terms, entries = self.sortedEntries(ramBudget=10**9, count=500)
+		self.assertEqual([e.l_term[0] for e in entries], sorted(terms))
+
+	def test_spill(self):
+		terms, entries = self.sortedEntries(ramBudget=10_000, count=2000)
+		self.assertEqual([e.l_term[0] for e in entries], sorted(terms))
+
+	def test_spill_merge_runs(self):
+		# small budget to create more than maxMergeRuns run files
+		terms, entries = self.sortedEntries(ramBudget=1000, count=2000)
+		self.assertEqual([e.l_term[0] for e in entries], sorted(terms))
+
+	def test_stable(self):
+		_, entries = self.sortedEntries(ramBudget=5000, count=3000)
+		for e1, e2 in pairwise(entries):
+			if e1.l_term[0] != e2.l_term[0]:
+				continue
+			self.assertLess(int(e1.defi.split()[1]), int(e2.defi.split()[1]))
+
+	def test_entry_fields(self):
+		_, entries = self.sortedEntries(ramBudget=2000, count=100)
+		for entry in entries:
+			index = entry.l_term[1][3:]
+			self.assertEqual(entry.defi, f"defi {index}")
+			self.assertEqual(len(entry.l_term), 2)
+
+	def test_unsorted_order(self):
+		entryList = self.newList(ramBudget=2000)
+		terms = self.addEntries(entryList, 300)
+		self.assertEqual(len(entryList), 300)
+		self.assertEqual([e.l_term[0] for e in entryList], terms)
+		entryList.close()
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from os.path import abspath, dirname
+
+rootDir = dirname(dirname(abspath(__file__)))
+sys.path.insert(0, rootDir)
+
+from pyglossary.entry_list import EntryList
+from pyglossary.glossary_v2 import Glossary
+from pyglossary.raw_entry import packRawEntry, rawEntryTerms, unpackRawEntry
+from pyglossary.sort_keys import lookupSortKey
+
+
+class TestRawEntry(unittest.TestCase):
+	def test_pack_unpack(self):
+		terms = ["word", "", "wörd\x00alt"]
+		defi = "line1\nline2\x00 — ✓"
+		raw = packRawEntry(
+			"h",
+			defi.encode("utf-8"),
+			[term.encode("utf-8") for term in terms],
+		)
+		self.assertIsInstance(raw, bytes)
+		self.assertEqual(unpackRawEntry(raw), ("h", defi, terms))
+		self.assertEqual(rawEntryTerms(raw), terms)
+
+	def test_default_format(self):
+		raw = packRawEntry("", b"", [b"a"])
+		self.assertEqual(unpackRawEntry(raw), ("", "", ["a"]))
+
+	def test_memoryview(self):
+		raw1 = packRawEntry("m", b"defi1", [b"a", b"b"])
+		raw2 = packRawEntry("x", b"defi2", [b"c"])
+		view = memoryview(raw1 + raw2)
+		self.assertEqual(
+			unpackRawEntry(view[len(raw1) :]),
+			("x", "defi2", ["c"]),
+		)
+		self.assertEqual(rawEntryTerms(view[: len(raw1)]), ["a", "b"])
+
+
+class TestEntryList(unittest.TestCase):
+	def setUp(self):
+		self.glos = Glossary()
+		self.entryList = EntryList(
+			entryToRaw=self.glos._entryToRaw,
+			entryFromRaw=self.glos._entryFromRaw,
+		)
+
+	def terms(self) -> list[list[str]]:
+		return [entry.l_term for entry in self.entryList]
+
+	def test_append_iter(self):
+		glos = self.glos
+		self.entryList.append(glos.newEntry(["b", "b2"], "defi b", defiFormat="h"))
+		self.entryList.append(glos.newEntry("a", "defi a"))
+		self.assertEqual(len(self.entryList), 2)
+		entries = list(self.entryList)
+		self.assertEqual(entries[0].l_term, ["b", "b2"])
+		self.assertEqual(entries[0].defi, "defi b")
+		self.assertEqual(entries[0].defiFormat, "h")
+		self.assertEqual(entries[1].l_term, ["a"])
+		self.assertEqual(entries[1].defiFormat, "m")
+
+	def test_sort(self):
+		glos = self.glos
+		self.entryList.setSortKey(lookupSortKey("headword"), "utf-8", {})
+		for term in ("c", "a", "b"):
+			self.entryList.append(glos.newEntry(term, "defi"))
+		self.entryList.sort()
+		self.assertEqual(self.terms(), [["a"], ["b"], ["c"]])
+		# entries appended after sort are added to the end
+		self.entryList.append(glos.newEntry("0", "defi"))
+		self.assertEqual(self.terms(), [["a"], ["b"], ["c"], ["0"]])
+		self.entryList.clear()
+		self.assertEqual(len(self.entryList), 0)
+		self.assertEqual(self.terms(), [])
+
+
+if __name__ == "__main__":
+	unittest.main()
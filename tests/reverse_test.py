@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import unittest
+from os.path import abspath, dirname, join
+
+rootDir = dirname(dirname(abspath(__file__)))
+sys.path.insert(0, rootDir)
+
+from pyglossary.entry import Entry
+from pyglossary.reverse import (
+	ReverseIndex,
+	reverseGlossary,
+	searchWordInDef,
+	takeOutputWords,
+)
+
+vocab = [
+	"apple",
+	"banana",
+	"cherry",
+	"date",
+	"fig",
+	"grape",
+	"lemon",
+	"mango",
+	"melon",
+	"peach",
+	"pear",
+	"plum",
+]
+
+
+def randomDefi(rand: random.Random) -> str:
+	parts = []
+	for _ in range(rand.randint(1, 4)):
+		words = rand.choices(vocab, k=rand.randint(1, 6))
+		parts.append(" ".join(words))
+	return rand.choice([". ", ", ", "، "]).join(parts)
+
+
+class MockGlossary:
+	def __init__(self, entries: list[Entry]) -> None:
+		self._entries = entries
+		self.progressbar = True
+
+	def __iter__(self):
+		return iter(self._entries)
+
+	def getInfo(self, _key: str) -> str:
+		return "test"
+
+	def progressInit(self, *args) -> None:
+		pass
+
+	def progress(self, pos: int, total: int, unit: str = "entries") -> None:
+		pass
+
+	def progressEnd(self) -> None:
+		pass
+
+
+class TestReverseIndex(unittest.TestCase):
+	def setUp(self):
+		rand = random.Random(42)
+		self.entries = [
+			Entry(
+				[f"w{i}", f"alt{i}"] if i % 3 == 0 else f"w{i}",
+				randomDefi(rand),
+			)
+			for i in range(300)
+		]
+
+	def test_search_same_as_scan(self):
+		for includeDefs in (False, True):
+			index = ReverseIndex(includeDefs=includeDefs)
+			for entry in self.entries:
+				index.add(entry)
+			self.assertEqual(len(index), len(self.entries))
+			for st in [*vocab, "xyz", "an"]:
+				for maxNum, minRel, showRel in [
+					(100, 0.0, "Percent"),
+					(5, 0.3, "Percent At First"),
+					(-1, 0.2, ""),
+				]:
+					self.assertEqual(
+						index.search(
+							st,
+							maxNum=maxNum,
+							minRel=minRel,
+							showRel=showRel,
+						),
+						searchWordInDef(
+							self.entries,
+							st,
+							maxNum=maxNum,
+							minRel=minRel,
+							includeDefs=includeDefs,
+							showRel=showRel,
+						),
+						msg=f"{st=}, {includeDefs=}, {maxNum=}, {minRel=}",
+					)
+
+	def test_reverseGlossary(self):
+		glos = MockGlossary(self.entries)
+		self.assertEqual(
+			ReverseIndex().build(glos),
+			takeOutputWords(glos, self.entries),
+		)
+		expectedLines = []
+		for term in takeOutputWords(glos, self.entries):
+			result = searchWordInDef(self.entries, term, minRel=0.3)
+			if result:
+				expectedLines.append(f"{term}\t{', '.join(result)}.\n")
+		with tempfile.TemporaryDirectory() as tmpDir:
+			savePath = join(tmpDir, "out.txt")
+			for _ in reverseGlossary(glos, savePath=savePath, minRel=0.3):
+				pass
+			with open(savePath, encoding="utf-8") as file:
+				self.assertEqual(file.read(), "".join(expectedLines))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+import unittest
+from os.path import abspath, dirname, join
+
+rootDir = dirname(dirname(abspath(__file__)))
+sys.path.insert(0, rootDir)
+
+from pyglossary.stage_profiler import StageProfiler
+
+
+def sleepy(seconds: float) -> float:
+	time.sleep(seconds)
+	return seconds
+
+
+class TestStageProfiler(unittest.TestCase):
+	def test_wrap_iterate(self):
+		profiler = StageProfiler()
+		func = profiler.wrap("func", sleepy)
+		self.assertEqual(func(0.01), 0.01)
+		self.assertEqual(func(0.01), 0.01)
+		self.assertEqual(list(profiler.iterate("iter", [1, None, 3])), [1, None, 3])
+		report = profiler.report()
+		self.assertEqual(report["stages"]["func"]["calls"], 2)
+		self.assertGreaterEqual(report["stages"]["func"]["seconds"], 0.02)
+		# 3 items and the last call that raises StopIteration
+		self.assertEqual(report["stages"]["iter"]["calls"], 4)
+		self.assertNotIn("cprofile", report)
+		self.assertNotIn("tracemalloc", report)
+
+	def test_nested_exclusive(self):
+		profiler = StageProfiler()
+		with profiler.stage("outer"):
+			sleepy(0.02)
+			profiler.wrap("inner", sleepy)(0.05)
+		seconds = profiler.stageSeconds()
+		self.assertGreaterEqual(seconds["inner"], 0.05)
+		self.assertGreaterEqual(seconds["outer"], 0.02)
+		self.assertLess(seconds["outer"], 0.05)
+
+	def test_exception(self):
+		profiler = StageProfiler()
+
+		def fail():
+			raise ValueError("test")
+
+		with self.assertRaises(ValueError):
+			profiler.wrap("fail", fail)()
+		self.assertEqual(profiler.report()["stages"]["fail"]["calls"], 1)
+
+	def test_cprofile_tracemalloc(self):
+		profiler = StageProfiler(cprofile=["read"], tracemalloc=["filter:Big"])
+		profiler.wrap("read:Tabfile", sleepy)(0)
+		profiler.wrap("filter:Big", lambda: [0] * 100000)()
+		profiler.wrap("filter:Small", list)()
+		profiler.close()
+		report = profiler.report()
+		self.assertEqual(list(report["cprofile"]), ["read:Tabfile"])
+		functions = [item["function"] for item in report["cprofile"]["read:Tabfile"]]
+		self.assertTrue(any("sleepy" in func for func in functions), functions)
+		self.assertEqual(list(report["tracemalloc"]), ["filter:Big"])
+		self.assertGreater(report["tracemalloc"]["filter:Big"]["peakBytes"], 800000)
+
+	def test_saveReport(self):
+		profiler = StageProfiler()
+		profiler.wrap("write:Tabfile", sleepy)(0)
+		with tempfile.TemporaryDirectory() as tmpDir:
+			fpath = join(tmpDir, "report.json")
+			profiler.saveReport(fpath)
+			with open(fpath, encoding="utf-8") as file:
+				report = json.load(file)
+		self.assertEqual(report["stages"]["write:Tabfile"]["calls"], 1)
+		self.assertIn("write:Tabfile", profiler.summary())
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -2,10 +2,24 @@ from __future__ import annotations
 
 import locale
 import random
+import struct
+import sys
+import tempfile
 import unittest
 from functools import cmp_to_key
+from os.path import abspath, dirname, join
 from typing import Any
 
+rootDir = dirname(dirname(abspath(__file__)))
+sys.path.insert(0, rootDir)
+
+from pyglossary.plugins.stardict.lazyidx import (
+	SynIndex,
+	countIdxRecords,
+	iterIdxRecords,
+)
+from pyglossary.plugins.stardict.sqlist import SynSqList
+
 
 def toBytes(s: str | bytes) -> bytes:
 	return bytes(s, "utf-8") if isinstance(s, str) else bytes(s)
@@ -185,5 +199,63 @@ class SortRandomTest(unittest.TestCase):
 			)
 
 
+class SynSqListTest(unittest.TestCase):
+	def test_append_sort_iter(self):
+		with tempfile.TemporaryDirectory() as tmpDir:
+			sqList = SynSqList(join(tmpDir, "syn.db"))
+			count = sqList.appendBatchSize * 2 + 7
+			items = [(f"W{i % 97}".encode(), i) for i in range(count)]
+			random.shuffle(items)
+			for item in items:
+				sqList.append(item)
+			self.assertEqual(len(sqList), count)
+			sqList.sort()
+			actual = [tuple(row) for row in sqList]
+			sqList.close()
+		self.assertEqual(
+			[row[0] for row in actual],
+			sorted(item[0] for item in items),
+		)
+		self.assertEqual(sorted(actual), sorted(items))
+
+
+class LazyIndexTest(unittest.TestCase):
+	def test_idx_records(self):
+		records = [(b"apple", 0, 10), (b"", 10, 0), (b"banana", 10, 20)]
+		for largeFile in (False, True):
+			offsetFormat = ">Q" if largeFile else ">I"
+			buf = b"".join(
+				term
+				+ b"\x00"
+				+ struct.pack(offsetFormat, offset)
+				+ struct.pack(">I", size)
+				for term, offset, size in records
+			)
+			self.assertEqual(countIdxRecords(buf, largeFile), 3)
+			self.assertEqual(list(iterIdxRecords(buf, largeFile)), records)
+			# truncated last record is ignored
+			self.assertEqual(countIdxRecords(buf[:-1], largeFile), 2)
+			self.assertEqual(list(iterIdxRecords(buf[:-1], largeFile)), records[:2])
+
+	def test_syn_index(self):
+		synRecords = [
+			("a1", 2),
+			("b1", 0),
+			("c2", 2),
+			("d", 5),  # invalid entry index
+			("é", 0),
+		]
+		buf = b"".join(
+			alt.encode("utf-8") + b"\x00" + struct.pack(">I", entryIndex)
+			for alt, entryIndex in synRecords
+		)
+		synIndex = SynIndex(buf, 4, "strict")
+		self.assertEqual(len(synIndex), 4)
+		self.assertEqual(synIndex.get(0), ["b1", "é"])
+		self.assertIsNone(synIndex.get(1))
+		self.assertEqual(synIndex.get(2), ["a1", "c2"])
+		self.assertIsNone(synIndex.get(3))
+
+
 if __name__ == "__main__":
 	unittest.main()